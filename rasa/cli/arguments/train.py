@@ -25,6 +25,7 @@ def set_train_arguments(parser: argparse.ArgumentParser) -> None:
     add_debug_plots_param(parser)
 
     _add_num_threads_param(parser)
+    _add_nlu_parallelism_param(parser)
 
     _add_model_name_param(parser)
     add_persist_nlu_data_param(parser)
@@ -60,6 +61,7 @@ def set_train_nlu_arguments(parser: argparse.ArgumentParser) -> None:
     add_nlu_data_param(parser, help_text="File or folder containing your NLU data.")
 
     _add_num_threads_param(parser)
+    _add_nlu_parallelism_param(parser)
 
     _add_model_name_param(parser)
     add_persist_nlu_data_param(parser)
@@ -181,6 +183,18 @@ def _add_num_threads_param(
     )
 
 
+def _add_nlu_parallelism_param(
+    parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
+) -> None:
+    parser.add_argument(
+        "--nlu-parallelism",
+        type=int,
+        default=1,
+        help="Maximum number of NLU models of different languages to train at the "
+        "same time. Every model is trained in a separate process.",
+    )
+
+
 def _add_model_name_param(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--fixed-model-name",
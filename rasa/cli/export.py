@@ -151,15 +151,26 @@ def _prepare_event_broker(event_broker: "EventBroker") -> None:
     the instance is launched as part of this short-lived export script, meaning the
     object is destroyed before it might be published.
 
+    A `KafkaEventBroker` sends the events from a queue in the background. It has to
+    wait for space in the queue instead of dropping events and, when it is closed,
+    for the queued events to be sent. It raises if events could not be sent.
+
     In addition, wait until the event broker reports a `ready` state.
 
     """
+    from rasa.core.brokers.kafka import KafkaEventBroker, OVERFLOW_BLOCK
     from rasa.core.brokers.pika import PikaEventBroker
 
     if isinstance(event_broker, PikaEventBroker):
         event_broker.should_keep_unpublished_messages = False
         event_broker.raise_on_failure = True
 
+    if isinstance(event_broker, KafkaEventBroker):
+        event_broker.overflow_policy = OVERFLOW_BLOCK
+        event_broker.block_timeout_in_seconds = None
+        event_broker.close_timeout_in_seconds = None
+        event_broker.raise_on_failure = True
+
     if not event_broker.is_ready():
         rasa.shared.utils.cli.print_error_and_exit(
             f"Event broker of type '{type(event_broker)}' is not ready. Exiting."
@@ -237,6 +237,8 @@ def extract_nlu_additional_arguments(args: argparse.Namespace) -> Dict:
 
     if "num_threads" in args:
         arguments["num_threads"] = args.num_threads
+    if "nlu_parallelism" in args:
+        arguments["nlu_parallelism"] = args.nlu_parallelism
 
     return arguments
 
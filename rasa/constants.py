@@ -1,6 +1,11 @@
 import os
 
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
+# limits of the connection pools of the HTTP sessions of endpoints
+DEFAULT_CONNECTION_POOL_SIZE = 100
+DEFAULT_CONNECTION_POOL_SIZE_PER_HOST = 0  # no limit
+DEFAULT_KEEPALIVE_TIMEOUT = 15  # seconds
+DEFAULT_DNS_CACHE_TTL = 10  # seconds
 DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 TEST_DATA_FILE = "test.md"
@@ -35,7 +40,18 @@ ENV_LOG_LEVEL_LIBRARIES = "LOG_LEVEL_LIBRARIES"
 DEFAULT_SANIC_WORKERS = 1
 ENV_SANIC_WORKERS = "SANIC_WORKERS"
 ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
+ENV_SANIC_PRELOAD_MODEL = "SANIC_PRELOAD_MODEL"
 
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
+
+ENV_INFERENCE_BATCH_WINDOW_MS = "INFERENCE_BATCH_WINDOW_MS"
+ENV_INFERENCE_MAX_BATCH_SIZE = "INFERENCE_MAX_BATCH_SIZE"
+DEFAULT_INFERENCE_MAX_BATCH_SIZE = 32
+
+ENV_INFERENCE_EXECUTOR = "INFERENCE_EXECUTOR"
+ENV_INFERENCE_MAX_WORKERS = "INFERENCE_MAX_WORKERS"
+ENV_INFERENCE_MAX_PENDING = "INFERENCE_MAX_PENDING"
+DEFAULT_INFERENCE_MAX_WORKERS = 4
+DEFAULT_INFERENCE_MAX_PENDING = 32
@@ -1,7 +1,8 @@
 import copy
 import json
 import logging
-from typing import List, Text, Optional, Dict, Any, Set, TYPE_CHECKING
+from http import HTTPStatus
+from typing import List, Text, Optional, Dict, Any, Set, Tuple, TYPE_CHECKING
 
 import aiohttp
 
@@ -60,6 +61,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# keys of the action endpoint configuration which make the action server payloads
+# more compact
+DOMAIN_BY_FINGERPRINT_KEY = "domain_by_fingerprint"
+TRACKER_EVENTS_KEY = "tracker_events"
+MAX_TRACKER_EVENTS_KEY = "max_tracker_events"
+
+# status with which action servers ask for the domain of an unknown fingerprint
+DOMAIN_REQUIRED_STATUS = HTTPStatus.PRECONDITION_FAILED
+
+# action server URLs and the fingerprints of the domains which were sent to them
+_domains_sent_to_action_servers: Set[Tuple[Text, Text]] = set()
+
 
 def default_actions(action_endpoint: Optional[EndpointConfig] = None) -> List["Action"]:
     """List default actions."""
@@ -566,22 +579,88 @@ class RemoteAction(Action):
         self._name = name
         self.action_endpoint = action_endpoint
 
+    def _endpoint_option(self, key: Text, default: Any) -> Any:
+        if not self.action_endpoint:
+            return default
+        return self.action_endpoint.kwargs.get(key, default)
+
+    def _tracker_state(self, tracker: "DialogueStateTracker") -> Dict[Text, Any]:
+        from rasa.shared.core.trackers import EventVerbosity
+
+        verbosity = self._endpoint_option(TRACKER_EVENTS_KEY, EventVerbosity.ALL.name)
+        try:
+            event_verbosity = EventVerbosity[verbosity.upper()]
+        except KeyError:
+            raise RasaException(
+                f"Invalid value '{verbosity}' for '{TRACKER_EVENTS_KEY}' in the "
+                f"action endpoint configuration. Valid values are "
+                f"{[v.name.lower() for v in EventVerbosity]}."
+            )
+
+        return tracker.current_state(
+            event_verbosity,
+            max_events=self._endpoint_option(MAX_TRACKER_EVENTS_KEY, None),
+        )
+
+    def _sends_domain_by_fingerprint(self) -> bool:
+        return bool(self._endpoint_option(DOMAIN_BY_FINGERPRINT_KEY, False))
+
     def _action_call_format(
         self, tracker: "DialogueStateTracker", domain: "Domain"
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
-        from rasa.shared.core.trackers import EventVerbosity
+        """Create the request json send to the action server.
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
-
-        return {
+        If `domain_by_fingerprint` is set in the action endpoint configuration, the
+        domain is only sent the first time to the action server. Further calls only
+        contain the fingerprint of the domain. The events of the tracker can be
+        limited with `tracker_events` (`all`, `after_restart`, `applied` or `none`)
+        and `max_tracker_events`.
+        """
+        json_body = {
             "next_action": self._name,
             "sender_id": tracker.sender_id,
-            "tracker": tracker_state,
-            "domain": domain.as_dict(),
+            "tracker": self._tracker_state(tracker),
             "version": rasa.__version__,
         }
 
+        if not self._sends_domain_by_fingerprint():
+            json_body["domain"] = domain.cached_dict
+            return json_body
+
+        json_body["domain_fingerprint"] = domain.cached_fingerprint
+        if (
+            self.action_endpoint.url,
+            domain.cached_fingerprint,
+        ) not in _domains_sent_to_action_servers:
+            json_body["domain"] = domain.cached_dict
+        return json_body
+
+    async def _request_action_server(
+        self, json_body: Dict[Text, Any], domain: "Domain"
+    ) -> Any:
+        try:
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+        except ClientResponseError as e:
+            if e.status != DOMAIN_REQUIRED_STATUS or "domain" in json_body:
+                raise
+            # e.g. the action server restarted and lost the domains it cached
+            logger.debug(
+                f"Action server doesn't know the domain with fingerprint "
+                f"'{json_body['domain_fingerprint']}', sending the full domain."
+            )
+            json_body["domain"] = domain.cached_dict
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+
+        if "domain_fingerprint" in json_body:
+            _domains_sent_to_action_servers.add(
+                (self.action_endpoint.url, json_body["domain_fingerprint"])
+            )
+        return response
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
@@ -627,13 +706,24 @@ class RemoteAction(Action):
     ) -> List[BotUttered]:
         """Use the responses generated by the action endpoint and utter them."""
 
+        templates = [response.pop("template", None) for response in responses]
+        # render all templates at once instead of one remote call after another
+        drafts = iter(
+            await nlg.generate_batch(
+                [
+                    (template, response)
+                    for template, response in zip(templates, responses)
+                    if template
+                ],
+                tracker,
+                output_channel.name(),
+            )
+        )
+
         bot_messages = []
-        for response in responses:
-            template = response.pop("template", None)
+        for template, response in zip(templates, responses):
             if template:
-                draft = await nlg.generate(
-                    template, tracker, output_channel.name(), **response
-                )
+                draft = next(drafts)
                 if not draft:
                     continue
                 draft["template_name"] = template
@@ -674,9 +764,7 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            response = await self._request_action_server(json_body, domain)
 
             self._validate_action_result(response)
 
@@ -3,6 +3,7 @@ import logging
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 import uuid
@@ -115,6 +116,35 @@ def _load_domain_and_policy_ensemble(
     return domain, policy_ensemble
 
 
+def _warm_up(
+    domain: Optional[Domain],
+    policy_ensemble: Optional[PolicyEnsemble],
+    interpreter: Optional[NaturalLanguageInterpreter],
+) -> None:
+    """Builds the prediction graphs of the NLU and Core models.
+
+    Prediction graphs are otherwise built with the first message which the model
+    handles, which would slow down the first message after a model was (re)loaded.
+
+    Args:
+        domain: The domain of the model.
+        policy_ensemble: The policies of the model.
+        interpreter: The NLU interpreter of the model.
+    """
+    start = time.perf_counter()
+    try:
+        if interpreter:
+            interpreter.warm_up()
+        if policy_ensemble and domain:
+            policy_ensemble.warm_up(domain, interpreter or RegexInterpreter())
+    except Exception as e:  # skipcq: PYL-W0703
+        # the graphs are built with the first message instead
+        logger.warning(f"Failed to warm up the model: {e}")
+        return
+
+    logger.debug(f"Warmed up the model in {time.perf_counter() - start:.2f}s.")
+
+
 def _load_and_set_updated_model(
     agent: "Agent", model_directory: Text, fingerprint: Text
 ) -> None:
@@ -132,6 +162,9 @@ def _load_and_set_updated_model(
     interpreter = _load_interpreter(agent, nlu_path)
     domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
 
+    # warm up the new model before it replaces the current one
+    _warm_up(domain, policy_ensemble, interpreter)
+
     agent.update_model(
         domain, policy_ensemble, fingerprint, interpreter, model_directory
     )
@@ -189,7 +222,7 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
+    async with model_server.request_session() as session:
         try:
             params = model_server.combine_parameters()
             async with session.request(
@@ -451,6 +484,8 @@ class Agent:
             # ensures the domain hasn't changed between test and train
             domain.compare_with_specification(core_model)
 
+        _warm_up(domain, ensemble, interpreter)
+
         return cls(
             domain=domain,
             policies=ensemble,
@@ -508,6 +543,23 @@ class Agent:
         message = UserMessage(message_data, metadata={"language": lang}) # bf
         return await processor.parse_message(message, tracker)
 
+    async def parse_messages_using_nlu_interpreter(
+        self,
+        texts: List[Text],
+        lang: Optional[Text] = None,  # bf
+    ) -> List[Dict[Text, Any]]:
+        """Parses multiple texts with a single pass through the NLU pipeline.
+
+        Args:
+            texts: The texts to parse.
+            lang: The language of the texts.
+
+        Returns:
+            The parsed messages in the order of `texts`.
+        """
+        processor = self.create_processor()
+        return await processor.parse_messages(texts, metadata={"language": lang})
+
     async def handle_message(
         self,
         message: UserMessage,
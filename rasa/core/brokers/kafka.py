@@ -1,16 +1,49 @@
+import asyncio
+import glob
 import json
 import logging
+import os
+import queue
+import tempfile
+import threading
 import time
 from asyncio import AbstractEventLoop
-from typing import Any, Text, List, Optional, Union
-import time
+from typing import Any, Dict, Text, List, Optional, Tuple, Union
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.exceptions import PublishingError
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+# what happens to events which are published while the outbound queue is full
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_SPILL = "spill"
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BLOCK_TIMEOUT = 1  # in seconds
+DEFAULT_CLOSE_TIMEOUT = 30  # in seconds
+# how often the worker checks whether it should stop or send spilled events
+QUEUE_POLL_INTERVAL = 0.5  # in seconds
+
+# events and the time they were published at
+QueuedEvent = Tuple[Dict[Text, Any], float]
+
+
+def _is_running(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists, but belongs to another user
+        return True
+    return True
+
 
 class KafkaEventBroker(EventBroker):
     def __init__(
@@ -26,10 +59,24 @@ class KafkaEventBroker(EventBroker):
         ssl_check_hostname: bool = False,
         security_protocol: Text = "SASL_PLAINTEXT",
         loglevel: Union[int, Text] = logging.ERROR,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow_policy: Text = OVERFLOW_DROP,
+        block_timeout_in_seconds: Optional[float] = DEFAULT_BLOCK_TIMEOUT,
+        spill_directory: Optional[Text] = None,
+        close_timeout_in_seconds: Optional[float] = DEFAULT_CLOSE_TIMEOUT,
+        raise_on_failure: bool = False,
+        retry_delay_in_seconds: float = 5,
+        linger_ms: int = 5,
+        batch_size: int = 16384,
+        compression_type: Optional[Text] = None,
         **kwargs: Any,
     ) -> None:
         """Kafka event broker.
 
+        Published events are put into a bounded queue and sent to Kafka by a
+        background thread, so that an unreachable or slow Kafka doesn't block the
+        conversations.
+
         Args:
             url: 'url[:port]' string (or list of 'url[:port]'
                 strings) that the producer should contact to bootstrap initial
@@ -54,6 +101,27 @@ class KafkaEventBroker(EventBroker):
             security_protocol: Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
             loglevel: Logging level of the kafka logger.
+            queue_size: Maximum number of events waiting to be sent.
+            overflow_policy: What to do with events which are published while the
+                queue is full: `drop` them, `block` until there is space in the queue
+                (at most `block_timeout_in_seconds`, then drop them) or `spill` them
+                to a file in `spill_directory`, which is sent once Kafka caught up.
+            block_timeout_in_seconds: How long `publish` waits for space in the
+                queue with the `block` overflow policy (`None` to wait until there
+                is space).
+            spill_directory: Directory of the spill files (defaults to the
+                temporary directory).
+            close_timeout_in_seconds: How long `close` waits for the queued events
+                to be sent (`None` to wait until they were sent or Kafka turned
+                out to be unreachable).
+            raise_on_failure: Whether `close` raises a `PublishingError` if events
+                could not be published.
+            retry_delay_in_seconds: Delay between attempts to connect to Kafka.
+            linger_ms: How long the producer waits for more events to send them in
+                a single batch.
+            batch_size: Maximum size of a batch in bytes.
+            compression_type: Compression of the batches (`gzip`, `snappy`, `lz4`
+                or `zstd`).
 
         """
         import kafka
@@ -72,6 +140,44 @@ class KafkaEventBroker(EventBroker):
 
         self.producer: Optional[kafka.KafkaConsumer] = None
 
+        if overflow_policy not in [OVERFLOW_DROP, OVERFLOW_BLOCK, OVERFLOW_SPILL]:
+            raise ValueError(
+                f"Cannot initialise `KafkaEventBroker`: "
+                f"Invalid `overflow_policy` ('{overflow_policy}')."
+            )
+        self.overflow_policy = overflow_policy
+        self.block_timeout_in_seconds = block_timeout_in_seconds
+        self.close_timeout_in_seconds = close_timeout_in_seconds
+        self.raise_on_failure = raise_on_failure
+        self.retry_delay_in_seconds = retry_delay_in_seconds
+        # every process spills to its own file
+        self.spill_directory = spill_directory or tempfile.gettempdir()
+        self.spill_file = os.path.join(
+            self.spill_directory, f"rasa-kafka-{topic}-{os.getpid()}.jsonl"
+        )
+        self.producer_settings = {
+            "linger_ms": linger_ms,
+            "batch_size": batch_size,
+            "compression_type": compression_type,
+        }
+
+        self._queue: "queue.Queue[QueuedEvent]" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        # guards the spill file and `_spilling`
+        self._spill_lock = threading.Lock()
+        # once events are spilled, all events are spilled until the worker sent the
+        # spill file, so that the events keep their order
+        self._spilling = False
+        self.published = 0
+        self.failed = 0
+        self.dropped = 0
+        self.spilled = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        # timestamp of the earliest event which was dropped or failed to be sent
+        self._first_unsent_timestamp: Optional[float] = None
+
         logging.getLogger("kafka").setLevel(loglevel)
 
     @classmethod
@@ -86,38 +192,243 @@ class KafkaEventBroker(EventBroker):
 
         return cls(broker_config.url, **broker_config.kwargs)
 
-    def publish(self, event, retries=60, retry_delay_in_seconds=5) -> None:
-        """Publishes events."""
-        if self.producer is None:
-            self._create_producer()
-            connected = self.producer.bootstrap_connected()
-            if connected:
-                logger.debug("Connection to kafka successful.")
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Queues `event` to be published by the background thread."""
+        if self._worker is None:
+            self._start_worker()
+
+        queued_event = (event, time.time())
+        if self._spilling:
+            self._spill([queued_event])
+            self.spilled += 1
+            return
+
+        try:
+            if self.overflow_policy == OVERFLOW_BLOCK:
+                self._queue.put(queued_event, timeout=self.block_timeout_in_seconds)
             else:
-                logger.debug("Failed to connect kafka.")
-                return
-        while retries:
-            try:
-                self._publish(event)
-                return
-            except Exception as e:
-                logger.error(
-                    f"Could not publish message to kafka url '{self.url}'. "
-                    f"Failed with error: {e}"
+                self._queue.put_nowait(queued_event)
+        except queue.Full:
+            if self.overflow_policy == OVERFLOW_SPILL:
+                self._spill([queued_event])
+                self.spilled += 1
+            else:
+                self.dropped += 1
+                self._track_unsent([event])
+                logger.warning(
+                    f"Dropped event as the queue of the Kafka event broker is full. "
+                    f"Kafka at '{self.url}' might be unreachable."
                 )
-                connected = self.producer.bootstrap_connected()
-                if not connected:
-                    self._close()
-                    logger.debug("Connection to kafka lost, reconnecting...")
-                    self._create_producer()
-                    connected = self.producer.bootstrap_connected()
-                    if connected:
-                        logger.debug("Reconnection to kafka successful")
-                        self._publish(event)
-                retries -= 1
-                time.sleep(retry_delay_in_seconds)
-
-        logger.error("Failed to publish Kafka event.")
+
+    def _start_worker(self) -> None:
+        if self.overflow_policy == OVERFLOW_SPILL:
+            self._adopt_spill_files()
+        self._worker = threading.Thread(
+            target=self._run, name="kafka-event-broker", daemon=True
+        )
+        self._worker.start()
+
+    def _adopt_spill_files(self) -> None:
+        """Takes over the events spilled by processes which stopped."""
+        if os.path.exists(self.spill_file):
+            self._spilling = True
+
+        prefix = os.path.join(self.spill_directory, f"rasa-kafka-{self.topic}-")
+        for spill_file in glob.glob(f"{prefix}*.jsonl"):
+            pid = spill_file[len(prefix) : -len(".jsonl")]
+            if not pid.isdigit() or _is_running(int(pid)):
+                continue
+            adopted_file = f"{self.spill_file}.{pid}"
+            try:
+                # renaming is atomic, only one process adopts the events
+                os.rename(spill_file, adopted_file)
+            except OSError:
+                continue
+            with open(adopted_file, encoding=DEFAULT_ENCODING) as f:
+                spilled_events = f.read()
+            with self._spill_lock:
+                with open(self.spill_file, "a", encoding=DEFAULT_ENCODING) as f:
+                    f.write(spilled_events)
+                self._spilling = True
+            os.remove(adopted_file)
+            logger.debug(f"Adopted the Kafka events spilled to '{spill_file}'.")
+
+    def _spill(self, queued_events: List[QueuedEvent]) -> None:
+        with self._spill_lock:
+            with open(self.spill_file, "a", encoding=DEFAULT_ENCODING) as f:
+                for event, published_at in queued_events:
+                    f.write(json.dumps([event, published_at]) + "\n")
+            self._spilling = True
+
+    def _read_spilled_events(self) -> List[QueuedEvent]:
+        with self._spill_lock:
+            if not self._spilling:
+                return []
+            with open(self.spill_file, encoding=DEFAULT_ENCODING) as f:
+                queued_events = [tuple(json.loads(line)) for line in f if line.strip()]
+            os.remove(self.spill_file)
+            self._spilling = False
+            return queued_events
+
+    def _next_events(self) -> Optional[List[QueuedEvent]]:
+        """Returns the next events to send or `None` if the worker should stop."""
+        try:
+            return [self._queue.get(timeout=QUEUE_POLL_INTERVAL)]
+        except queue.Empty:
+            # spilled events are sent once the events which were queued before them
+            spilled_events = self._read_spilled_events()
+            if spilled_events:
+                return spilled_events
+            if self._stopped.is_set():
+                return None
+            return []
+
+    def _run(self) -> None:
+        queued_events = self._next_events()
+        while queued_events is not None:
+            for i, queued_event in enumerate(queued_events):
+                if not self._send(queued_event):
+                    # Kafka is unreachable and the broker is closed
+                    self._discard(queued_events[i:])
+                    return
+            queued_events = self._next_events()
+
+        if self.producer is not None:
+            self.producer.flush(timeout=self.close_timeout_in_seconds)
+            self._close()
+
+    def _connect(self) -> bool:
+        try:
+            self._create_producer()
+        except Exception as e:
+            logger.error(f"Failed to connect to kafka url '{self.url}': {e}")
+            self.producer = None
+            return False
+
+        if self.producer.bootstrap_connected():
+            logger.debug("Connection to kafka successful.")
+            return True
+
+        logger.debug("Failed to connect kafka.")
+        self._close()
+        return False
+
+    def _send(self, queued_event: QueuedEvent) -> bool:
+        """Sends an event, retries until it was sent or the broker is closed."""
+        while True:
+            if self.producer is not None or self._connect():
+                try:
+                    self._publish(queued_event)
+                    return True
+                except Exception as e:
+                    logger.error(
+                        f"Could not publish message to kafka url '{self.url}'. "
+                        f"Failed with error: {e}"
+                    )
+                    if not self.producer.bootstrap_connected():
+                        logger.debug("Connection to kafka lost, reconnecting...")
+                        self._close()
+
+            # waits in the background thread, returns early if the broker is closed
+            if self._stopped.wait(self.retry_delay_in_seconds):
+                return False
+
+    def _discard(self, queued_events: List[QueuedEvent]) -> None:
+        unsent_events = list(queued_events)
+        while not self._queue.empty():
+            unsent_events.append(self._queue.get_nowait())
+        if self.overflow_policy == OVERFLOW_SPILL:
+            # the unsent events come before the events which were already spilled,
+            # the spill file is adopted by the next broker with this topic
+            self._spill(unsent_events + self._read_spilled_events())
+            self.spilled += len(unsent_events)
+            return
+        self.failed += len(unsent_events)
+        self._track_unsent([event for event, _ in unsent_events])
+        logger.error(
+            f"Failed to publish {len(unsent_events)} Kafka events, as kafka url "
+            f"'{self.url}' is unreachable."
+        )
+
+    def _on_send_success(self, published_at: float, *_: Any) -> None:
+        latency = time.time() - published_at
+        self.published += 1
+        self._latency_sum += latency
+        self._latency_max = max(self._latency_max, latency)
+
+    def _on_send_error(self, event: Dict[Text, Any], error: Exception) -> None:
+        self.failed += 1
+        self._track_unsent([event])
+        logger.error(f"Failed to publish Kafka event. Failed with error: {error}")
+
+    def _track_unsent(self, events: List[Dict[Text, Any]]) -> None:
+        timestamps = [
+            event["timestamp"] for event in events if event.get("timestamp") is not None
+        ]
+        if self._first_unsent_timestamp is not None:
+            timestamps.append(self._first_unsent_timestamp)
+        if timestamps:
+            self._first_unsent_timestamp = min(timestamps)
+
+    def stats(self) -> Dict[Text, Any]:
+        """Returns the queue depth, event counters and the publish latency."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "spilling": self._spilling,
+            "published": self.published,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "average_publish_latency": (
+                self._latency_sum / self.published if self.published else 0.0
+            ),
+            "max_publish_latency": self._latency_max,
+        }
+
+    async def close(self) -> None:
+        """Sends the queued events and closes the connection to Kafka.
+
+        If Kafka is unreachable, the queued events are spilled with the `spill`
+        overflow policy and discarded otherwise.
+
+        Raises:
+            PublishingError: If `raise_on_failure` is set and events were dropped,
+                failed to be sent or are still queued after
+                `close_timeout_in_seconds`. Its timestamp is the one of the earliest
+                of these events.
+        """
+        if self._worker is None:
+            return
+
+        # the worker stops once the queue is empty
+        self._stopped.set()
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._worker.join, self.close_timeout_in_seconds
+        )
+
+        # the daemon worker dies with the process, hence its events are lost
+        remaining_events = (
+            [event for event, _ in list(self._queue.queue)]
+            if self._worker.is_alive()
+            else []
+        )
+        self._track_unsent(remaining_events)
+        unsent_events = self.dropped + self.failed + len(remaining_events)
+        if self._spilling:
+            logger.warning(
+                f"Kafka events were spilled to '{self.spill_file}', they are sent by "
+                f"the next Kafka event broker with the topic '{self.topic}'."
+            )
+        if not unsent_events:
+            return
+
+        logger.error(
+            f"{unsent_events} Kafka event(s) were not published "
+            f"({self.dropped} dropped, {self.failed} failed, "
+            f"{len(remaining_events)} still queued)."
+        )
+        if self.raise_on_failure:
+            raise PublishingError(self._first_unsent_timestamp)
 
     def _create_producer(self) -> None:
         import kafka
@@ -127,6 +438,7 @@ class KafkaEventBroker(EventBroker):
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
                 value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                **self.producer_settings,
                 security_protocol=self.security_protocol,
                 ssl_check_hostname=False,
             )
@@ -135,6 +447,7 @@ class KafkaEventBroker(EventBroker):
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
                 value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                **self.producer_settings,
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 sasl_mechanism="PLAIN",
@@ -145,6 +458,7 @@ class KafkaEventBroker(EventBroker):
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
                 value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                **self.producer_settings,
                 ssl_cafile=self.ssl_cafile,
                 ssl_certfile=self.ssl_certfile,
                 ssl_keyfile=self.ssl_keyfile,
@@ -156,6 +470,7 @@ class KafkaEventBroker(EventBroker):
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
                 value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                **self.producer_settings,
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 ssl_cafile=self.ssl_cafile,
@@ -171,9 +486,14 @@ class KafkaEventBroker(EventBroker):
                 f"Invalid `security_protocol` ('{self.security_protocol}')."
             )
 
-    def _publish(self, event) -> None:
+    def _publish(self, queued_event: QueuedEvent) -> None:
+        event, published_at = queued_event
         logger.debug(f"Calling kafka send({self.topic}, {event})")
-        self.producer.send(self.topic, event)
+        # the producer sends the events in batches from its own thread
+        self.producer.send(self.topic, event).add_callback(
+            self._on_send_success, published_at
+        ).add_errback(self._on_send_error, event)
 
     def _close(self) -> None:
         self.producer.close()
+        self.producer = None
@@ -48,3 +48,11 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 # Names of the environment variables defining PostgreSQL pool size and max overflow
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
+
+# Name of the environment variable defining the number of threads which run the
+# blocking operations of a tracker store
+TRACKER_STORE_THREAD_POOL_SIZE = "TRACKER_STORE_THREAD_POOL_SIZE"
+
+# Text of the message which is used to trace the prediction graphs of a model
+# when it's loaded
+WARM_UP_MESSAGE_TEXT = "hello"
@@ -1,9 +1,7 @@
-import aiohttp
-
 import logging
 
 import os
-from typing import Text, Dict, Any, Union, Optional
+from typing import Text, Dict, Any, List, Union, Optional, TYPE_CHECKING
 
 from rasa.core import constants
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -12,8 +10,13 @@ import rasa.shared.utils.io
 import rasa.shared.utils.common
 import rasa.shared.nlu.interpreter
 from rasa.shared.nlu.training_data.message import Message
+import rasa.utils.inference_executor
+from rasa.utils.inference_scheduler import InferenceScheduler
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from rasa.nlu.components import ComponentBuilder
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,19 +26,31 @@ def create_interpreter(
         EndpointConfig,
         Text,
         None,
-    ]
+    ],
+    component_builder: Optional["ComponentBuilder"] = None,
 ) -> "rasa.shared.nlu.interpreter.NaturalLanguageInterpreter":
-    """Factory to create a natural language interpreter."""
+    """Factory to create a natural language interpreter.
+
+    Args:
+        obj: The interpreter, the path to an NLU model or an endpoint configuration.
+        component_builder: Builder to load the components of local NLU models with.
+            Components which it already holds (e.g. spaCy language models) are
+            reused instead of being loaded again.
+    """
 
     if isinstance(obj, rasa.shared.nlu.interpreter.NaturalLanguageInterpreter):
         return obj
     # bf>
     elif isinstance(obj, dict):
         from rasa_addons.core.interpreter import MultilingualNLUInterpreter
-        return MultilingualNLUInterpreter(model_directory=obj)
+        return MultilingualNLUInterpreter(
+            model_directory=obj, component_builder=component_builder
+        )
     # </bf
     elif isinstance(obj, str) and os.path.exists(obj):
-        return RasaNLUInterpreter(model_directory=obj)
+        return RasaNLUInterpreter(
+            model_directory=obj, component_builder=component_builder
+        )
     elif isinstance(obj, str):
         # user passed in a string, but file does not exist
         logger.warning(
@@ -98,7 +113,7 @@ class RasaNLUHttpInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpre
 
         # noinspection PyBroadException
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.endpoint_config.request_session() as session:
                 async with session.post(url, json=params) as resp:
                     if resp.status == 200:
                         return await resp.json()
@@ -122,16 +137,23 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        component_builder: Optional["ComponentBuilder"] = None,
     ):
         self.model_directory = model_directory
         self.lazy_init = lazy_init
         self.config_file = config_file
+        self.component_builder = component_builder
 
         if not lazy_init:
             self._load_interpreter()
         else:
             self.interpreter = None
 
+        # opt-in micro-batching of concurrent parse requests
+        self._scheduler = InferenceScheduler.from_environment(
+            self._parse_texts, name="nlu"
+        )
+
     async def parse(
         self,
         text: Text,
@@ -146,10 +168,30 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         if self.lazy_init and self.interpreter is None:
             self._load_interpreter()
 
-        result = self.interpreter.parse(text)
+        if self._scheduler is not None:
+            return await self._scheduler.predict_async(text)
+
+        result = await rasa.utils.inference_executor.run_inference(
+            self.interpreter.parse, text
+        )
 
         return result
 
+    async def parse_batch(
+        self, texts: List[Text], metadata: Optional[Dict] = None
+    ) -> List[Dict[Text, Any]]:
+        """Parse multiple text messages with a single pass through the pipeline."""
+
+        if self.lazy_init and self.interpreter is None:
+            self._load_interpreter()
+
+        return await rasa.utils.inference_executor.run_inference(
+            self.interpreter.parse_batch, texts
+        )
+
+    def _parse_texts(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        return self.interpreter.parse_batch(texts)
+
     def featurize_message(self, message: Message) -> Optional[Message]:
         """Featurize message using a trained NLU pipeline.
         Args:
@@ -162,10 +204,32 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         result = self.interpreter.featurize_message(message)
         return result
 
+    def warm_up(self) -> None:
+        if self.interpreter is None:
+            # the model is loaded with the first message anyway
+            return
+
+        self.interpreter.parse(constants.WARM_UP_MESSAGE_TEXT)
+
+    def cache_stats(self) -> Dict[Text, Dict[Text, Any]]:
+        """Returns the counters of the caches of the pipeline components by name."""
+        if self.interpreter is None:
+            return {}
+
+        stats = {}
+        for component in self.interpreter.pipeline:
+            if callable(getattr(component, "cache_stats", None)):
+                component_stats = component.cache_stats()
+                if component_stats:
+                    stats[component.name] = component_stats
+        return stats
+
     def _load_interpreter(self) -> None:
         from rasa.nlu.model import Interpreter
 
-        self.interpreter = Interpreter.load(self.model_directory)
+        self.interpreter = Interpreter.load(
+            self.model_directory, component_builder=self.component_builder
+        )
 
 
 def _create_from_endpoint_config(
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Optional, Union, Text, Any, Dict
+from typing import Optional, Union, Text, Any, Dict, List, Tuple
 
 import rasa.shared.utils.common
 from rasa.shared.core.domain import Domain
@@ -26,6 +27,33 @@ class NaturalLanguageGenerator:
         the dialogue state into a machine learning NLG model."""
         raise NotImplementedError
 
+    async def generate_batch(
+        self,
+        requests: List[Tuple[Text, Dict[Text, Any]]],
+        tracker: "DialogueStateTracker",
+        output_channel: Text,
+    ) -> List[Optional[Dict[Text, Any]]]:
+        """Generate the responses for several templates at once.
+
+        The templates are generated concurrently. Generators which can generate
+        several responses with a single request should override this.
+
+        Args:
+            requests: Names of the requested templates and the keyword arguments
+                to generate them with.
+            tracker: The tracker of the conversation.
+            output_channel: The name of the output channel.
+
+        Returns:
+            The generated responses in the order of the `requests`.
+        """
+        return await asyncio.gather(
+            *[
+                self.generate(template_name, tracker, output_channel, **kwargs)
+                for template_name, kwargs in requests
+            ]
+        )
+
     @staticmethod
     def create(
         obj: Union["NaturalLanguageGenerator", EndpointConfig, None],
@@ -11,7 +11,7 @@ from typing import Text, Optional, Any, List, Dict, Tuple, Type, Union
 
 import rasa.core
 import rasa.core.training.training
-from rasa.core.constants import FALLBACK_POLICY_PRIORITY
+from rasa.core.constants import FALLBACK_POLICY_PRIORITY, WARM_UP_MESSAGE_TEXT
 from rasa.shared.exceptions import RasaException
 import rasa.shared.utils.common
 import rasa.shared.utils.io
@@ -37,11 +37,18 @@ from rasa.shared.core.events import (
     ActionExecutionRejected,
     ActionExecuted,
     DefinePrevUserUtteredFeaturization,
+    UserUttered,
 )
 from rasa.core.exceptions import UnsupportedDialogueModelError
 from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
+from rasa.shared.nlu.constants import INTENT_NAME_KEY
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
-from rasa.core.policies.policy import Policy, SupportedData, PolicyPrediction
+from rasa.core.policies.policy import (
+    Policy,
+    SupportedData,
+    PolicyPrediction,
+    PredictionContext,
+)
 from rasa.core.policies.fallback import FallbackPolicy
 from rasa.core.policies.memoization import MemoizationPolicy, AugmentedMemoizationPolicy
 from rasa.core.policies.rule_policy import RulePolicy
@@ -218,6 +225,29 @@ class PolicyEnsemble:
     ) -> PolicyPrediction:
         raise NotImplementedError
 
+    def warm_up(self, domain: Domain, interpreter: NaturalLanguageInterpreter) -> None:
+        """Predicts the next action of a sample conversation.
+
+        This builds the prediction graphs of the policies, so that the first
+        prediction of a conversation isn't slowed down by it.
+
+        Args:
+            domain: The model's domain.
+            interpreter: Interpreter which featurizes user messages.
+        """
+        events = [ActionExecuted(ACTION_LISTEN_NAME)]
+        if domain.intents:
+            events.append(
+                UserUttered(
+                    WARM_UP_MESSAGE_TEXT, intent={INTENT_NAME_KEY: domain.intents[0]}
+                )
+            )
+        tracker = DialogueStateTracker.from_events(
+            "warm-up", events, slots=domain.slots
+        )
+
+        self.probabilities_using_best_policy(tracker, domain, interpreter)
+
     def _max_histories(self) -> List[Optional[int]]:
         """Return max history."""
 
@@ -669,9 +699,11 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         ):
             rejected_action_name = last_action_event.action_name
 
+        # policies share what they create from the tracker, e.g. its states
+        prediction_context = PredictionContext(tracker, domain)
         predictions = {
             f"policy_{i}_{type(p).__name__}": self._get_prediction(
-                p, tracker, domain, interpreter
+                p, tracker, domain, interpreter, prediction_context
             )
             for i, p in enumerate(self.policies)
         }
@@ -694,6 +726,7 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         tracker: DialogueStateTracker,
         domain: Domain,
         interpreter: NaturalLanguageInterpreter,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> PolicyPrediction:
         number_of_arguments_in_rasa_1_0 = 2
         arguments = rasa.shared.utils.common.arguments_of(
@@ -704,8 +737,16 @@ class SimplePolicyEnsemble(PolicyEnsemble):
             len(arguments) > number_of_arguments_in_rasa_1_0
             and "interpreter" in arguments
         ):
+            kwargs = {}
+            if prediction_context is not None and (
+                "prediction_context" in arguments
+                or rasa.shared.utils.common.accepts_keyword_arguments(
+                    policy.predict_action_probabilities
+                )
+            ):
+                kwargs["prediction_context"] = prediction_context
             prediction = policy.predict_action_probabilities(
-                tracker, domain, interpreter
+                tracker, domain, interpreter, **kwargs
             )
         else:
             rasa.shared.utils.io.raise_warning(
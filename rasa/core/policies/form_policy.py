@@ -3,7 +3,7 @@ from typing import List, Dict, Text, Optional, Any, Union, Tuple
 
 import rasa.shared.utils.common
 import rasa.shared.utils.io
-from rasa.core.policies.policy import PolicyPrediction
+from rasa.core.policies.policy import PolicyPrediction, PredictionContext
 from rasa.shared.constants import DOCS_URL_MIGRATION_GUIDE
 from rasa.shared.core.constants import (
     ACTION_LISTEN_NAME,
@@ -103,19 +103,31 @@ class FormPolicy(MemoizationPolicy):
         return lookup
 
     def recall(
-        self, states: List[State], tracker: DialogueStateTracker, domain: Domain
+        self,
+        states: List[State],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> Optional[Text]:
         # modify the states
         return self._recall_states(self._modified_states(states))
 
-    def state_is_unhappy(self, tracker: DialogueStateTracker, domain: Domain) -> bool:
+    def state_is_unhappy(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        prediction_context: Optional[PredictionContext] = None,
+    ) -> bool:
         # since it is assumed that training stories contain
         # only unhappy paths, notify the form that
         # it should not be validated if predicted by other policy
-        tracker_as_states = self.featurizer.prediction_states([tracker], domain)
-        states = tracker_as_states[0]
+        states = self._prediction_states(
+            tracker, domain, prediction_context=prediction_context
+        )
 
-        memorized_form = self.recall(states, tracker, domain)
+        memorized_form = self.recall(
+            states, tracker, domain, prediction_context=prediction_context
+        )
 
         state_is_unhappy = (
             memorized_form is not None and memorized_form == tracker.active_loop_name
@@ -148,7 +160,9 @@ class FormPolicy(MemoizationPolicy):
                 # predict form action after user utterance
 
                 if tracker.active_loop.get(LOOP_REJECTED):
-                    if self.state_is_unhappy(tracker, domain):
+                    if self.state_is_unhappy(
+                        tracker, domain, kwargs.get("prediction_context")
+                    ):
                         return self._prediction(result, events=[LoopInterrupted(True)])
 
                 result = self._prediction_result(
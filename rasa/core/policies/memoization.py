@@ -17,7 +17,7 @@ from rasa.core.featurizers.tracker_featurizers import (
     MaxHistoryTrackerFeaturizer,
 )
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
-from rasa.core.policies.policy import Policy, PolicyPrediction
+from rasa.core.policies.policy import Policy, PolicyPrediction, PredictionContext
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 from rasa.shared.utils.io import is_logging_disabled
@@ -195,7 +195,11 @@ class MemoizationPolicy(Policy):
         return self.lookup.get(self._create_feature_key(states))
 
     def recall(
-        self, states: List[State], tracker: DialogueStateTracker, domain: Domain
+        self,
+        states: List[State],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> Optional[Text]:
         return self._recall_states(states)
 
@@ -224,10 +228,14 @@ class MemoizationPolicy(Policy):
     ) -> PolicyPrediction:
         result = self._default_predictions(domain)
 
-        tracker_as_states = self.featurizer.prediction_states([tracker], domain)
-        states = tracker_as_states[0]
+        prediction_context = kwargs.get("prediction_context")
+        states = self._prediction_states(
+            tracker, domain, prediction_context=prediction_context
+        )
         logger.debug(f"Current tracker state:{self.format_tracker_states(states)}")
-        predicted_action_name = self.recall(states, tracker, domain)
+        predicted_action_name = self.recall(
+            states, tracker, domain, prediction_context=prediction_context
+        )
         if predicted_action_name is not None:
             logger.debug(f"There is a memorised next action '{predicted_action_name}'")
             result = self._prediction_result(predicted_action_name, tracker, domain)
@@ -267,7 +275,9 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
 
     @staticmethod
     def _back_to_the_future(
-        tracker, again: bool = False
+        tracker: DialogueStateTracker,
+        again: bool = False,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> Optional[DialogueStateTracker]:
         """Send Marty to the past to get
         the new featurization for the future"""
@@ -275,8 +285,13 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
         idx_of_first_action = None
         idx_of_second_action = None
 
+        if prediction_context is not None:
+            applied_events = prediction_context.applied_events()
+        else:
+            applied_events = tracker.applied_events()
+
         # we need to find second executed action
-        for e_i, event in enumerate(tracker.applied_events()):
+        for e_i, event in enumerate(applied_events):
             # find second ActionExecuted
             if isinstance(event, ActionExecuted):
                 if idx_of_first_action is None:
@@ -291,7 +306,7 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
             return
 
         # make second ActionExecuted the first one
-        events = tracker.applied_events()[idx_to_use:]
+        events = applied_events[idx_to_use:]
         if not events:
             return
 
@@ -301,13 +316,21 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
 
         return mcfly_tracker
 
-    def _recall_using_delorean(self, old_states, tracker, domain) -> Optional[Text]:
+    def _recall_using_delorean(
+        self,
+        old_states: List[State],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        prediction_context: Optional[PredictionContext] = None,
+    ) -> Optional[Text]:
         """Recursively go to the past to correctly forget slots,
         and then back to the future to recall."""
 
         logger.debug("Launch DeLorean...")
 
-        mcfly_tracker = self._back_to_the_future(tracker)
+        mcfly_tracker = self._back_to_the_future(
+            tracker, prediction_context=prediction_context
+        )
         while mcfly_tracker is not None:
             tracker_as_states = self.featurizer.prediction_states(
                 [mcfly_tracker], domain
@@ -330,12 +353,18 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
         return None
 
     def recall(
-        self, states: List[State], tracker: DialogueStateTracker, domain: Domain
+        self,
+        states: List[State],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> Optional[Text]:
 
         predicted_action_name = self._recall_states(states)
         if predicted_action_name is None:
             # let's try a different method to recall that tracker
-            return self._recall_using_delorean(states, tracker, domain)
+            return self._recall_using_delorean(
+                states, tracker, domain, prediction_context
+            )
         else:
             return predicted_action_name
@@ -23,7 +23,7 @@ from rasa.shared.core.events import Event
 import rasa.shared.utils.common
 import rasa.utils.common
 import rasa.shared.utils.io
-from rasa.shared.core.domain import Domain
+from rasa.shared.core.domain import Domain, State
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.featurizers.tracker_featurizers import (
     TrackerFeaturizer,
@@ -232,6 +232,64 @@ class Policy:
         """
         raise NotImplementedError("Policy must have the capacity to predict.")
 
+    def _prediction_states(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        use_text_for_last_user_input: bool = False,
+        prediction_context: Optional["PredictionContext"] = None,
+    ) -> List[State]:
+        """Creates the states of the tracker for the prediction.
+
+        Args:
+            tracker: the :class:`rasa.core.trackers.DialogueStateTracker`
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            use_text_for_last_user_input: Indicates whether to use text or intent label
+                for featurizing last user input.
+            prediction_context: If given, the states are taken from and cached in
+                this context.
+
+        Returns:
+            The states of the tracker.
+        """
+        if prediction_context is not None:
+            return prediction_context.prediction_states(
+                self.featurizer, use_text_for_last_user_input
+            )
+        return self.featurizer.prediction_states(
+            [tracker], domain, use_text_for_last_user_input
+        )[0]
+
+    def _prediction_state_features(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        use_text_for_last_user_input: bool = False,
+        prediction_context: Optional["PredictionContext"] = None,
+    ) -> List[Dict[Text, List["Features"]]]:
+        """Creates the state features of the tracker for the prediction.
+
+        Args:
+            tracker: the :class:`rasa.core.trackers.DialogueStateTracker`
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            interpreter: Interpreter which is used to featurize the states.
+            use_text_for_last_user_input: Indicates whether to use text or intent label
+                for featurizing last user input.
+            prediction_context: If given, the features are taken from and cached in
+                this context.
+
+        Returns:
+            The features of each state of the tracker.
+        """
+        if prediction_context is not None:
+            return prediction_context.state_features(
+                self.featurizer, interpreter, use_text_for_last_user_input
+            )
+        return self.featurizer.create_state_features(
+            [tracker], domain, interpreter, use_text_for_last_user_input
+        )[0]
+
     def _prediction(
         self,
         probabilities: List[float],
@@ -396,6 +454,103 @@ class Policy:
         return "\n".join(formatted_states)
 
 
+class PredictionContext:
+    """Caches what policies create from a tracker to predict the next action.
+
+    The ensemble passes the same context to all policies when predicting the next
+    action, so that e.g. the states of the tracker are only created once. The
+    cached values are shared and must not be modified.
+    """
+
+    def __init__(self, tracker: DialogueStateTracker, domain: Domain) -> None:
+        """Creates a `PredictionContext`.
+
+        Args:
+            tracker: The tracker which is used for the prediction.
+            domain: The current model domain.
+        """
+        self.tracker = tracker
+        self.domain = domain
+        self._applied_events: Optional[List[Event]] = None
+        self._states: Dict[Tuple, List[State]] = {}
+        self._state_features: Dict[Tuple, List[Dict[Text, List["Features"]]]] = {}
+        self._events_count = len(tracker.events)
+        self._last_event = tracker.events[-1] if tracker.events else None
+
+    def _clear_if_tracker_changed(self) -> None:
+        # policies might add events to the tracker while predicting
+        last_event = self.tracker.events[-1] if self.tracker.events else None
+        if (
+            len(self.tracker.events) != self._events_count
+            or last_event is not self._last_event
+        ):
+            self._applied_events = None
+            self._states = {}
+            self._state_features = {}
+            self._events_count = len(self.tracker.events)
+            self._last_event = last_event
+
+    def applied_events(self) -> List[Event]:
+        """Returns the applied events of the tracker (see `applied_events`)."""
+        self._clear_if_tracker_changed()
+        if self._applied_events is None:
+            self._applied_events = self.tracker.applied_events()
+        return self._applied_events
+
+    def prediction_states(
+        self, featurizer: TrackerFeaturizer, use_text_for_last_user_input: bool = False
+    ) -> List[State]:
+        """Returns the states of the tracker which `featurizer` creates for prediction.
+
+        Args:
+            featurizer: The tracker featurizer of the policy.
+            use_text_for_last_user_input: Indicates whether to use text or intent label
+                for featurizing last user input.
+
+        Returns:
+            The states of the tracker.
+        """
+        self._clear_if_tracker_changed()
+        # featurizers of the same type and `max_history` create the same states
+        key = (
+            type(featurizer),
+            getattr(featurizer, "max_history", None),
+            use_text_for_last_user_input,
+        )
+        if key not in self._states:
+            self._states[key] = featurizer.prediction_states(
+                [self.tracker], self.domain, use_text_for_last_user_input
+            )[0]
+        return self._states[key]
+
+    def state_features(
+        self,
+        featurizer: TrackerFeaturizer,
+        interpreter: NaturalLanguageInterpreter,
+        use_text_for_last_user_input: bool = False,
+    ) -> List[Dict[Text, List["Features"]]]:
+        """Returns the state features of the tracker which `featurizer` creates.
+
+        Args:
+            featurizer: The tracker featurizer of the policy.
+            interpreter: The interpreter which is used to featurize the states.
+            use_text_for_last_user_input: Indicates whether to use text or intent label
+                for featurizing last user input.
+
+        Returns:
+            The features of each state of the tracker.
+        """
+        self._clear_if_tracker_changed()
+        # the features depend on the state featurizer of the specific policy
+        key = (featurizer, use_text_for_last_user_input)
+        if key not in self._state_features:
+            states = self.prediction_states(featurizer, use_text_for_last_user_input)
+            self._state_features[key] = featurizer._featurize_states(
+                [states], interpreter
+            )[0]
+        return self._state_features[key]
+
+
 class PolicyPrediction:
     """Stores information about the prediction of a `Policy`."""
 
@@ -13,7 +13,11 @@ from rasa.shared.core.events import LoopInterrupted, UserUttered, ActionExecuted
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 from rasa.core.policies.memoization import MemoizationPolicy
-from rasa.core.policies.policy import SupportedData, PolicyPrediction
+from rasa.core.policies.policy import (
+    SupportedData,
+    PolicyPrediction,
+    PredictionContext,
+)
 from rasa.shared.core.trackers import (
     DialogueStateTracker,
     get_active_loop_name,
@@ -80,6 +84,120 @@ class InvalidRule(RasaException):
         )
 
 
+class _RuleIndex:
+    """Pre-parsed rules of a lookup which are indexed by turn and previous action.
+
+    Rules are compared with the conversation going back in time. For every turn,
+    rules are indexed by a feature of the previous action in their state for this
+    turn, so that only rules with a matching previous action have to be compared
+    with the conversation state.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        self.lookup = lookup
+        self.size = len(lookup)
+        # rule states going back in time with lists converted to tuples
+        self.reversed_rule_states: Dict[Text, List[State]] = {}
+        self.max_rule_length = 0
+
+        for rule_key in lookup.keys():
+            reversed_rule_states = [
+                {
+                    state_type: {
+                        key: tuple(value) if isinstance(value, list) else value
+                        for key, value in sub_state.items()
+                    }
+                    for state_type, sub_state in rule_state.items()
+                }
+                for rule_state in reversed(json.loads(rule_key))
+            ]
+            self.reversed_rule_states[rule_key] = reversed_rule_states
+            self.max_rule_length = max(self.max_rule_length, len(reversed_rule_states))
+
+        # rules which are shorter than the turn index, i.e. which were applicable
+        # for all previous turns
+        self.finished_rules: List[Set[Text]] = [
+            set() for _ in range(self.max_rule_length)
+        ]
+        # rules without previous action at the turn, i.e. conversation starters
+        self.starter_rules: List[Set[Text]] = [
+            set() for _ in range(self.max_rule_length)
+        ]
+        # rules by a feature of their previous action at the turn
+        self.rules_by_previous_action: List[Dict[Tuple[Text, Any], Set[Text]]] = [
+            defaultdict(set) for _ in range(self.max_rule_length)
+        ]
+        # rules with a previous action which doesn't restrict the conversation state
+        self.unindexed_rules: List[Set[Text]] = [
+            set() for _ in range(self.max_rule_length)
+        ]
+
+        for rule_key, reversed_rule_states in self.reversed_rule_states.items():
+            for turn_index in range(len(reversed_rule_states), self.max_rule_length):
+                self.finished_rules[turn_index].add(rule_key)
+
+            for turn_index, rule_state in enumerate(reversed_rule_states):
+                rule_previous_action = rule_state.get(PREVIOUS_ACTION)
+                if not rule_previous_action:
+                    self.starter_rules[turn_index].add(rule_key)
+                    continue
+
+                feature = next(
+                    (
+                        (key, value)
+                        for key, value in sorted(rule_previous_action.items())
+                        if value and value != SHOULD_NOT_BE_SET
+                    ),
+                    None,
+                )
+                if feature is None:
+                    self.unindexed_rules[turn_index].add(rule_key)
+                else:
+                    self.rules_by_previous_action[turn_index][feature].add(rule_key)
+
+    def is_index_of(self, lookup: Dict[Text, Text]) -> bool:
+        return self.lookup is lookup and self.size == len(lookup)
+
+    def possible_keys(self, states: List[State]) -> Set[Text]:
+        """Finds the rules which are applicable to the conversation states.
+
+        A rule is applicable if every one of its states matches the conversation
+        state of the same turn, going back in time.
+        """
+        possible_keys = set(self.reversed_rule_states.keys())
+
+        for turn_index, state in enumerate(reversed(states)):
+            # all remaining rules were applicable for all their turns
+            if turn_index >= self.max_rule_length or not possible_keys:
+                break
+
+            current_previous_action = state.get(PREVIOUS_ACTION)
+            if not current_previous_action:
+                # the conversation state is a conversation starter
+                possible_keys &= (
+                    self.finished_rules[turn_index] | self.starter_rules[turn_index]
+                )
+                continue
+
+            candidates = set(self.unindexed_rules[turn_index])
+            rules_by_previous_action = self.rules_by_previous_action[turn_index]
+            for feature in current_previous_action.items():
+                candidates |= rules_by_previous_action.get(feature, set())
+
+            matching_rules = {
+                rule_key
+                for rule_key in possible_keys & candidates
+                if RulePolicy._does_rule_match_state(
+                    self.reversed_rule_states[rule_key][turn_index], state
+                )
+            }
+            possible_keys = (
+                possible_keys & self.finished_rules[turn_index]
+            ) | matching_rules
+
+        return possible_keys
+
+
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
 
@@ -138,6 +256,8 @@ class RulePolicy(MemoizationPolicy):
 
         self._prediction_source = None
         self._rules_sources = None
+        # rule lookups compiled for prediction
+        self._rule_indices: Dict[Text, _RuleIndex] = {}
 
         # max history is set to `None` in order to capture any lengths of rule stories
         super().__init__(
@@ -147,6 +267,7 @@ class RulePolicy(MemoizationPolicy):
             lookup=lookup,
             **kwargs,
         )
+        self._compile_rules()
 
     @classmethod
     def validate_against_domain(
@@ -629,6 +750,8 @@ class RulePolicy(MemoizationPolicy):
                 rule_trackers, training_trackers, domain, interpreter
             )
 
+        self._compile_rules()
+
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
     @staticmethod
@@ -660,67 +783,23 @@ class RulePolicy(MemoizationPolicy):
 
         return True
 
-    @staticmethod
-    def _rule_key_to_state(rule_key: Text) -> List[State]:
-        return json.loads(rule_key)
-
-    def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
-    ) -> bool:
-        """Check if rule is satisfied with current state at turn.
+    def _compile_rules(self) -> None:
+        """Parses and indexes the rules so that they can be matched efficiently."""
+        for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+            if lookup_name in self.lookup:
+                self._rule_index(lookup_name)
 
-        Args:
-            rule_key: the textual representation of learned rule
-            turn_index: index of a current dialogue turn
-            conversation_state: the state that corresponds to turn_index
-
-        Returns:
-            a boolean that says whether the rule is applicable to current state
-        """
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
-        # the rule must be applicable because we got (without any applicability issues)
-        # further in the conversation history than the rule's length
-        if turn_index >= len(reversed_rule_states):
-            return True
-
-        # a state has previous action if and only if it is not a conversation start
-        # state
-        current_previous_action = conversation_state.get(PREVIOUS_ACTION)
-        rule_previous_action = reversed_rule_states[turn_index].get(PREVIOUS_ACTION)
-
-        # current conversation state and rule state are conversation starters.
-        # any slots with initial_value set will necessarily be in both states and don't
-        # need to be checked.
-        if not rule_previous_action and not current_previous_action:
-            return True
-
-        # current rule state is a conversation starter (due to conversation_start: true)
-        # but current conversation state is not.
-        # or
-        # current conversation state is a starter
-        # but current rule state is not.
-        if not rule_previous_action or not current_previous_action:
-            return False
-
-        # check: current rule state features are present in current conversation state
-        return self._does_rule_match_state(
-            reversed_rule_states[turn_index], conversation_state
-        )
+    def _rule_index(self, lookup_name: Text) -> _RuleIndex:
+        lookup = self.lookup[lookup_name]
+        rule_index = self._rule_indices.get(lookup_name)
+        # the lookup might have been replaced, e.g. by training the policy again
+        if rule_index is None or not rule_index.is_index_of(lookup):
+            rule_index = _RuleIndex(lookup)
+            self._rule_indices[lookup_name] = rule_index
+        return rule_index
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
-                )
-            )
-        return possible_keys
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        return self._rule_index(lookup_name).possible_keys(states)
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -775,6 +854,7 @@ class RulePolicy(MemoizationPolicy):
         tracker: DialogueStateTracker,
         domain: Domain,
         use_text_for_last_user_input: bool,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> Tuple[Optional[Text], Optional[Text], bool]:
         """Predicts the next action based on the memoized rules.
 
@@ -783,6 +863,7 @@ class RulePolicy(MemoizationPolicy):
             domain: The domain of the current model.
             use_text_for_last_user_input: `True` if text of last user message
                 should be used for the prediction. `False` if intent should be used.
+            prediction_context: The context which caches the states of the tracker.
 
         Returns:
             A tuple of the predicted action name or text (or `None` if no matching rule
@@ -798,10 +879,9 @@ class RulePolicy(MemoizationPolicy):
             # the text or the intent
             return None, None, False
 
-        tracker_as_states = self.featurizer.prediction_states(
-            [tracker], domain, use_text_for_last_user_input
+        states = self._prediction_states(
+            tracker, domain, use_text_for_last_user_input, prediction_context
         )
-        states = tracker_as_states[0]
 
         current_states = self.format_tracker_states(states)
         logger.debug(f"Current tracker state:{current_states}")
@@ -812,7 +892,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -826,7 +906,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -840,7 +920,9 @@ class RulePolicy(MemoizationPolicy):
             # Hence, we have to take care of that.
             predicted_listen_from_general_rule = (
                 predicted_action_name == ACTION_LISTEN_NAME
-                and not get_active_loop_name(self._rule_key_to_state(best_rule_key)[-1])
+                and not get_active_loop_name(
+                    self._rule_index(RULES).reversed_rule_states[best_rule_key][0]
+                )
             )
             if predicted_listen_from_general_rule:
                 if DO_NOT_PREDICT_LOOP_ACTION not in unhappy_path_conditions:
@@ -885,12 +967,16 @@ class RulePolicy(MemoizationPolicy):
         **kwargs: Any,
     ) -> PolicyPrediction:
         """Predicts the next action (see parent class for more information)."""
+        prediction_context = kwargs.get("prediction_context")
         (
             rules_action_name_from_text,
             self._prediction_source,
             returning_from_unhappy_path_from_text,
         ) = self._find_action_from_rules(
-            tracker, domain, use_text_for_last_user_input=True
+            tracker,
+            domain,
+            use_text_for_last_user_input=True,
+            prediction_context=prediction_context,
         )
 
         # Rasa Open Source default actions overrule anything. If users want to achieve
@@ -934,7 +1020,10 @@ class RulePolicy(MemoizationPolicy):
             self._prediction_source,
             returning_from_unhappy_path_from_intent,
         ) = self._find_action_from_rules(
-            tracker, domain, use_text_for_last_user_input=False
+            tracker,
+            domain,
+            use_text_for_last_user_input=False,
+            prediction_context=prediction_context,
         )
         if rules_action_name_from_intent:
             probabilities = self._prediction_result(
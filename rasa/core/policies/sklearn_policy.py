@@ -284,7 +284,14 @@ class SklearnPolicy(Policy):
         interpreter: NaturalLanguageInterpreter,
         **kwargs: Any,
     ) -> PolicyPrediction:
-        X = self.featurizer.create_state_features([tracker], domain, interpreter)
+        X = [
+            self._prediction_state_features(
+                tracker,
+                domain,
+                interpreter,
+                prediction_context=kwargs.get("prediction_context"),
+            )
+        ]
         training_data, _ = model_data_utils.convert_to_data_format(
             X, self.zero_state_features
         )
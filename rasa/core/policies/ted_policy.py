@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from collections import defaultdict
@@ -35,13 +36,14 @@ from rasa.shared.nlu.constants import (
     SPLIT_ENTITIES_BY_COMMA_DEFAULT_VALUE,
 )
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
-from rasa.core.policies.policy import Policy, PolicyPrediction
+from rasa.core.policies.policy import Policy, PolicyPrediction, PredictionContext
 from rasa.core.constants import DEFAULT_POLICY_PRIORITY, DIALOGUE
 from rasa.shared.constants import DIAGNOSTIC_DATA
 from rasa.shared.core.constants import ACTIVE_LOOP, SLOTS, ACTION_LISTEN_NAME
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 import rasa.utils.train_utils
+from rasa.utils.inference_scheduler import InferenceScheduler
 from rasa.utils.tensorflow.models import RasaModel, TransformerRasaModel
 from rasa.utils.tensorflow.model_data import (
     RasaModelData,
@@ -342,6 +344,11 @@ class TEDPolicy(Policy):
         self._label_data: Optional[RasaModelData] = None
         self.data_example: Optional[Dict[Text, List[np.ndarray]]] = None
 
+        # opt-in micro-batching of concurrent predictions
+        self._scheduler = InferenceScheduler.from_environment(
+            self._predict_batch, name="ted"
+        )
+
     def _load_params(self, **kwargs: Dict[Text, Any]) -> None:
         new_config = rasa.utils.train_utils.check_core_deprecated_options(kwargs)
         self.config = rasa.utils.train_utils.override_defaults(
@@ -547,23 +554,36 @@ class TEDPolicy(Policy):
         tracker: DialogueStateTracker,
         domain: Domain,
         interpreter: NaturalLanguageInterpreter,
+        prediction_context: Optional[PredictionContext] = None,
     ) -> List[List[Dict[Text, List["Features"]]]]:
         # construct two examples in the batch to be fed to the model -
         # one by featurizing last user text
         # and second - an optional one (see conditions below),
         # the first example in the constructed batch either does not contain user input
         # or uses intent or text based on whether TED is e2e only.
-        tracker_state_features = self.featurizer.create_state_features(
-            [tracker], domain, interpreter, use_text_for_last_user_input=self.only_e2e
-        )
+        tracker_state_features = [
+            self._prediction_state_features(
+                tracker,
+                domain,
+                interpreter,
+                use_text_for_last_user_input=self.only_e2e,
+                prediction_context=prediction_context,
+            )
+        ]
         # the second - text, but only after user utterance and if not only e2e
         if (
             tracker.latest_action_name == ACTION_LISTEN_NAME
             and TEXT in self.fake_features
             and not self.only_e2e
         ):
-            tracker_state_features += self.featurizer.create_state_features(
-                [tracker], domain, interpreter, use_text_for_last_user_input=True
+            tracker_state_features.append(
+                self._prediction_state_features(
+                    tracker,
+                    domain,
+                    interpreter,
+                    use_text_for_last_user_input=True,
+                    prediction_context=prediction_context,
+                )
             )
         return tracker_state_features
 
@@ -611,15 +631,18 @@ class TEDPolicy(Policy):
 
         # create model data from tracker
         tracker_state_features = self._featurize_tracker_for_e2e(
-            tracker, domain, interpreter
+            tracker, domain, interpreter, kwargs.get("prediction_context")
         )
-        model_data = self._create_model_data(tracker_state_features)
 
-        output = self.model.predict(model_data)
+        if self._should_schedule(tracker):
+            output, similarities, confidences = self._scheduler.predict(
+                tracker_state_features
+            )
+        else:
+            output, similarities, confidences = self._predict_batch(
+                [tracker_state_features]
+            )[0]
 
-        # take the last prediction in the sequence
-        similarities = output["similarities"].numpy()[:, -1, :]
-        confidences = output["action_scores"].numpy()[:, -1, :]
         # take correct prediction from batch
         confidence, is_e2e_prediction = self._pick_confidence(confidences, similarities)
 
@@ -643,6 +666,90 @@ class TEDPolicy(Policy):
             ),
         )
 
+    def _should_schedule(self, tracker: DialogueStateTracker) -> bool:
+        """Checks if the prediction should be batched with concurrent ones."""
+        if self._scheduler is None:
+            return False
+
+        if (
+            self.config[ENTITY_RECOGNITION]
+            and tracker.latest_action_name == ACTION_LISTEN_NAME
+        ):
+            # entities are picked from the entity predictions of the whole batch,
+            # hence these predictions can't be shared with other trackers
+            return False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+
+        # waiting for a batch on the event loop would block all other
+        # conversations which could join the batch
+        return False
+
+    def _predict_batch(
+        self,
+        all_tracker_state_features: List[List[List[Dict[Text, List["Features"]]]]],
+    ) -> List[Tuple[Dict[Text, Any], np.ndarray, np.ndarray]]:
+        """Predicts multiple trackers with a single call of the model.
+
+        Args:
+            all_tracker_state_features: The featurized examples of every tracker as
+                created by `_featurize_tracker_for_e2e`.
+
+        Returns:
+            For every tracker the model output, the similarities and confidences of
+            the last dialogue turn of its examples.
+        """
+        model_data = self._create_model_data(
+            [
+                state_features
+                for tracker_state_features in all_tracker_state_features
+                for state_features in tracker_state_features
+            ]
+        )
+        output = self.model.predict(model_data)
+        all_similarities = output["similarities"].numpy()
+        all_confidences = output["action_scores"].numpy()
+
+        if len(all_tracker_state_features) == 1:
+            # take the last prediction in the sequence
+            return [(output, all_similarities[:, -1, :], all_confidences[:, -1, :])]
+
+        diagnostic_data = rasa.utils.tensorflow.numpy.values_to_numpy(
+            output.get(DIAGNOSTIC_DATA)
+        )
+        results = []
+        start = 0
+        for tracker_state_features in all_tracker_state_features:
+            end = start + len(tracker_state_features)
+            rows = list(range(start, end))
+            # dialogues are padded to the longest one of the batch, hence the last
+            # prediction of a dialogue isn't necessarily the last in the sequence
+            last_turns = [
+                len(state_features) - 1 for state_features in tracker_state_features
+            ]
+            tracker_output = {}
+            if diagnostic_data:
+                attention_weights = diagnostic_data.get("attention_weights")
+                tracker_output[DIAGNOSTIC_DATA] = {
+                    # attention weights are stacked per transformer layer
+                    "attention_weights": attention_weights[:, start:end]
+                    if attention_weights is not None
+                    else None
+                }
+            results.append(
+                (
+                    tracker_output,
+                    all_similarities[rows, last_turns, :],
+                    all_confidences[rows, last_turns, :],
+                )
+            )
+            start = end
+
+        return results
+
     def _create_optional_event_for_entities(
         self,
         prediction_output: Dict[Text, tf.Tensor],
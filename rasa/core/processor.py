@@ -14,6 +14,7 @@ from rasa.core.channels.channel import (
     UserMessage,
 )
 import rasa.core.utils
+import rasa.utils.inference_executor
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.shared.core.constants import (
     USER_INTENT_RESTART,
@@ -92,7 +93,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -103,7 +104,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -122,10 +123,12 @@ class MessageProcessor:
         # we have a Tracker instance for each user
         # which maintains conversation state
         tracker = await self.fetch_tracker_and_update_session(sender_id)
-        result = self.predict_next_with_tracker(tracker)
+        result = await rasa.utils.inference_executor.run_inference(
+            self.predict_next_with_tracker, tracker
+        )
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return result
 
@@ -231,7 +234,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
 
         await self._update_tracker_session(tracker, output_channel, metadata)
 
@@ -254,7 +257,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
 
         # run session start only if the tracker is empty
         if not tracker.events:
@@ -283,6 +286,25 @@ class MessageProcessor:
             conversation_id, append_action_listen=False
         )
 
+    async def get_tracker_async(self, conversation_id: Text) -> DialogueStateTracker:
+        """Get the tracker for a conversation without blocking the event loop.
+
+        See `get_tracker` for details.
+
+        Args:
+            conversation_id: The ID of the conversation for which the history should be
+                retrieved.
+
+        Returns:
+            Tracker for the conversation. Creates an empty tracker in case it's a new
+            conversation.
+        """
+        conversation_id = conversation_id or DEFAULT_SENDER_ID
+
+        return await self.tracker_store.get_or_create_tracker_async(
+            conversation_id, append_action_listen=False
+        )
+
     def get_trackers_for_all_conversation_sessions(
         self, conversation_id: Text
     ) -> List[DialogueStateTracker]:
@@ -323,7 +345,7 @@ class MessageProcessor:
 
         if should_save_tracker:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
         # bf >
         if message.output_channel.name() == 'bot_regression_test_output':
             # BOTFRONT TEST CHANNEL: send user messages to the output channel
@@ -365,7 +387,7 @@ class MessageProcessor:
         await self._run_action(action, tracker, output_channel, nlg, prediction)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return tracker
 
@@ -492,7 +514,7 @@ class MessageProcessor:
         )
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker) -> None:
@@ -583,6 +605,41 @@ class MessageProcessor:
 
         return parse_data
 
+    async def parse_messages(
+        self, texts: List[Text], metadata: Optional[Dict] = None
+    ) -> List[Dict[Text, Any]]:
+        """Interprete multiple messages sharing the same metadata at once.
+
+        Arguments:
+            texts: Texts of the messages to handle
+            metadata: Metadata of the messages
+
+        Returns:
+            Parsed data extracted from the messages, in the order of `texts`.
+        """
+        # preprocess messages if necessary
+        if self.message_preprocessor is not None:
+            texts = [self.message_preprocessor(text) for text in texts]
+
+        parse_data = [None] * len(texts)
+        # messages with the intent prefix short-cut the NLU part, see `parse_message`
+        for index, text in enumerate(texts):
+            if text.startswith(INTENT_MESSAGE_PREFIX):
+                parse_data[index] = await RegexInterpreter().parse(text)
+
+        indices = [index for index, data in enumerate(parse_data) if data is None]
+        if indices:
+            batch_parse_data = await self.interpreter.parse_batch(
+                [texts[index] for index in indices], metadata=metadata
+            )
+            for index, data in zip(indices, batch_parse_data):
+                parse_data[index] = data
+
+        for data in parse_data:
+            self._check_for_unseen_features(data)
+
+        return parse_data
+
     async def _handle_message_with_tracker(
         self, message: UserMessage, tracker: DialogueStateTracker
     ) -> None:
@@ -653,7 +710,9 @@ class MessageProcessor:
             and num_predicted_actions < self.max_number_of_predictions
         ):
             # this actually just calls the policy's method by the same name
-            action, prediction = self.predict_next_action(tracker)
+            action, prediction = await rasa.utils.inference_executor.run_inference(
+                self.predict_next_action, tracker
+            )
 
             should_predict_another_action = await self._run_action(
                 action, tracker, output_channel, self.nlg, prediction
@@ -891,8 +950,8 @@ class MessageProcessor:
 
         return has_expired
 
-    def _save_tracker(self, tracker: DialogueStateTracker) -> None:
-        self.tracker_store.save(tracker)
+    async def _save_tracker(self, tracker: DialogueStateTracker) -> None:
+        await self.tracker_store.save_async(tracker)
 
     def _get_next_action_probabilities(
         self, tracker: DialogueStateTracker
@@ -1,19 +1,21 @@
 import asyncio
+import gc
 import logging
 import uuid
 import os
 import shutil
 from functools import partial
-from typing import Any, List, Optional, Text, Union
+from typing import Any, Dict, List, Optional, Text, Union
 
 import rasa.core.utils
 from rasa.shared.exceptions import RasaException
 import rasa.shared.utils.common
 import rasa.utils
 import rasa.utils.common
+import rasa.utils.endpoints
 import rasa.utils.io
 from rasa import model, server, telemetry
-from rasa.constants import ENV_SANIC_BACKLOG
+from rasa.constants import ENV_SANIC_BACKLOG, ENV_SANIC_PRELOAD_MODEL
 from rasa.core import agent, channels, constants
 from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
@@ -23,6 +25,8 @@ import rasa.core.interpreter
 from rasa.core.lock_store import LockStore
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.utils import AvailableEndpoints
+from rasa.nlu.components import ComponentBuilder
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 import rasa.shared.utils.io
 from sanic import Sanic
 from asyncio import AbstractEventLoop
@@ -30,6 +34,26 @@ from asyncio import AbstractEventLoop
 logger = logging.getLogger()  # get the root logger
 
 
+# Components which are loaded before the Sanic workers are forked, so that the workers
+# share their memory. Components using TensorFlow must not be part of this, as
+# TensorFlow can't be used in a forked process once it was initialized in the parent.
+FORK_SAFE_COMPONENTS = ("SpacyNLP", "MitieNLP")
+
+
+class PreloadedModel:
+    """A model which was unpacked and partially loaded before forking the workers."""
+
+    def __init__(
+        self,
+        model_archive: Text,
+        model_directory: Text,
+        component_builder: ComponentBuilder,
+    ) -> None:
+        self.model_archive = model_archive
+        self.model_directory = model_directory
+        self.component_builder = component_builder
+
+
 def create_http_input_channels(
     channel: Optional[Text], credentials_file: Optional[Text]
 ) -> List["InputChannel"]:
@@ -196,21 +220,38 @@ def serve_application(
         f"Starting Rasa server on {constants.DEFAULT_SERVER_FORMAT.format(protocol, port)}"
     )
 
+    number_of_workers = rasa.core.utils.number_of_sanic_workers(
+        endpoints.lock_store if endpoints else None
+    )
+
+    preloaded_model = None
+    if (
+        number_of_workers > 1
+        and _should_preload_model()
+        and not (endpoints and endpoints.model)
+        and not remote_storage
+    ):
+        preloaded_model = preload_model(model_path)
+
     app.register_listener(
-        partial(load_agent_on_start, model_path, endpoints, remote_storage),
+        partial(
+            load_agent_on_start,
+            model_path,
+            endpoints,
+            remote_storage,
+            preloaded_model=preloaded_model,
+        ),
         "before_server_start",
     )
+    app.register_listener(pool_endpoint_sessions, "before_server_start")
     app.register_listener(close_resources, "after_server_stop")
 
     # noinspection PyUnresolvedReferences
     async def clear_model_files(_app: Sanic, _loop: Text) -> None:
-        if app.agent.model_directory:
+        # a preloaded model is shared by all workers and removed by the main process
+        if app.agent.model_directory and not preloaded_model:
             shutil.rmtree(_app.agent.model_directory)
 
-    number_of_workers = rasa.core.utils.number_of_sanic_workers(
-        endpoints.lock_store if endpoints else None
-    )
-
     telemetry.track_server_start(
         input_channels, endpoints, model_path, number_of_workers, enable_api
     )
@@ -218,13 +259,86 @@ def serve_application(
     app.register_listener(clear_model_files, "after_server_stop")
 
     rasa.utils.common.update_sanic_log_level(log_file)
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        ssl=ssl_context,
-        backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
-        workers=number_of_workers,
+    try:
+        app.run(
+            host="0.0.0.0",
+            port=port,
+            ssl=ssl_context,
+            backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
+            workers=number_of_workers,
+        )
+    finally:
+        if preloaded_model:
+            shutil.rmtree(preloaded_model.model_directory, ignore_errors=True)
+
+
+def _should_preload_model() -> bool:
+    return os.environ.get(ENV_SANIC_PRELOAD_MODEL, "false").lower() == "true"
+
+
+def _nlu_model_directories(nlu_models: Union[Dict, Text, None]) -> List[Text]:
+    if isinstance(nlu_models, dict):
+        return [path for path in nlu_models.values() if path]
+    return [nlu_models] if nlu_models else []
+
+
+def preload_model(model_path: Optional[Text]) -> Optional[PreloadedModel]:
+    """Prepares a local model in the main process before the workers are forked.
+
+    The model archive is unpacked once into a directory which all workers load
+    their model from. Language models of components in `FORK_SAFE_COMPONENTS` are
+    loaded into a component builder, which the forked workers inherit and share
+    copy-on-write instead of every worker loading its own copy.
+
+    Args:
+        model_path: Path to a model archive or to a directory containing models.
+
+    Returns:
+        The preloaded model or `None` if the model could not be preloaded.
+    """
+    # noinspection PyBroadException
+    try:
+        if os.path.isfile(model_path):
+            model_archive = model_path
+        else:
+            model_archive = model.get_latest_model(model_path)
+        if not model_archive:
+            return None
+
+        model_directory = model.unpack_model(model_archive)
+    except Exception:
+        logger.debug(f"Could not preload the model from '{model_path}'.")
+        return None
+
+    component_builder = ComponentBuilder(use_cache=True)
+    # noinspection PyBroadException
+    try:
+        from rasa.nlu.model import Metadata
+
+        _, nlu_models = model.get_model_subdirectories(model_directory)
+        for nlu_model in _nlu_model_directories(nlu_models):
+            metadata = Metadata.load(nlu_model)
+            for index in range(metadata.number_of_components):
+                component_meta = metadata.for_component(index)
+                if component_meta.get("name") in FORK_SAFE_COMPONENTS:
+                    component_builder.load_component(
+                        component_meta, nlu_model, metadata
+                    )
+    except Exception as e:
+        logger.warning(
+            f"Could not preload the components of the model '{model_archive}'. "
+            f"Every worker will load them separately. Error: {e}"
+        )
+
+    # objects which exist before forking are never changed by the workers' garbage
+    # collections, which keeps their memory pages shared
+    gc.freeze()
+
+    logger.info(
+        f"Preloaded model '{model_archive}' with "
+        f"{len(component_builder.component_cache)} shared component(s)."
     )
+    return PreloadedModel(model_archive, model_directory, component_builder)
 
 
 # noinspection PyUnusedLocal
@@ -234,6 +348,7 @@ async def load_agent_on_start(
     remote_storage: Optional[Text],
     app: Sanic,
     loop: AbstractEventLoop,
+    preloaded_model: Optional[PreloadedModel] = None,
 ):
     """Load an agent.
 
@@ -242,11 +357,15 @@ async def load_agent_on_start(
 
     # noinspection PyBroadException
     try:
-        with model.get_model(model_path) as unpacked_model:
-            _, nlu_model = model.get_model_subdirectories(unpacked_model)
-            _interpreter = rasa.core.interpreter.create_interpreter(
-                endpoints.nlu or nlu_model
+        if preloaded_model:
+            _interpreter = _create_interpreter(
+                preloaded_model.model_directory,
+                endpoints,
+                preloaded_model.component_builder,
             )
+        else:
+            with model.get_model(model_path) as unpacked_model:
+                _interpreter = _create_interpreter(unpacked_model, endpoints)
     except Exception:
         logger.debug(f"Could not load interpreter from '{model_path}'.")
         _interpreter = None
@@ -258,16 +377,29 @@ async def load_agent_on_start(
     model_server = endpoints.model if endpoints and endpoints.model else None
 
     try:
-        app.agent = await agent.load_agent(
-            model_path,
-            model_server=model_server,
-            remote_storage=remote_storage,
-            interpreter=_interpreter,
-            generator=endpoints.nlg,
-            tracker_store=_tracker_store,
-            lock_store=_lock_store,
-            action_endpoint=endpoints.action,
-        )
+        if preloaded_model:
+            # the model was already unpacked (and its components loaded) before
+            # the workers were forked
+            app.agent = Agent.load(
+                preloaded_model.model_directory,
+                interpreter=_interpreter,
+                generator=endpoints.nlg,
+                tracker_store=_tracker_store,
+                lock_store=_lock_store,
+                action_endpoint=endpoints.action,
+                path_to_model_archive=preloaded_model.model_archive,
+            )
+        else:
+            app.agent = await agent.load_agent(
+                model_path,
+                model_server=model_server,
+                remote_storage=remote_storage,
+                interpreter=_interpreter,
+                generator=endpoints.nlg,
+                tracker_store=_tracker_store,
+                lock_store=_lock_store,
+                action_endpoint=endpoints.action,
+            )
     except Exception as e:
         rasa.shared.utils.io.raise_warning(
             f"The model at '{model_path}' could not be loaded. "
@@ -293,6 +425,27 @@ async def load_agent_on_start(
     return app.agent
 
 
+def _create_interpreter(
+    model_directory: Text,
+    endpoints: AvailableEndpoints,
+    component_builder: Optional[ComponentBuilder] = None,
+) -> NaturalLanguageInterpreter:
+    _, nlu_model = model.get_model_subdirectories(model_directory)
+    return rasa.core.interpreter.create_interpreter(
+        endpoints.nlu or nlu_model, component_builder=component_builder
+    )
+
+
+async def pool_endpoint_sessions(_: Sanic, loop: AbstractEventLoop) -> None:
+    """Keeps the connections to endpoints alive while the server is running.
+
+    Args:
+        _: The Sanic application.
+        loop: The current Sanic worker event loop.
+    """
+    rasa.utils.endpoints.enable_session_pooling(loop)
+
+
 async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     """Gracefully closes resources when shutting down server.
 
@@ -300,11 +453,23 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
         app: The Sanic application.
         _: The current Sanic worker event loop.
     """
+    # keep-alive connections to action servers, NLG servers, model servers, ...
+    await rasa.utils.endpoints.close_sessions()
+
     current_agent = getattr(app, "agent", None)
     if not current_agent:
         logger.debug("No agent found when shutting down server.")
         return
 
+    tracker_store = current_agent.tracker_store
+    # tracker stores might still send saves in the background
+    if asyncio.iscoroutinefunction(getattr(tracker_store, "close", None)):
+        await tracker_store.close()
+
+    nlg = getattr(current_agent, "nlg", None)
+    if asyncio.iscoroutinefunction(getattr(nlg, "close", None)):
+        await nlg.close()
+
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         if not asyncio.iscoroutinefunction(event_broker.close):
@@ -1,9 +1,12 @@
+import asyncio
 import contextlib
+import functools
 import itertools
 import json
 import logging
 import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from time import sleep
@@ -32,10 +35,11 @@ from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
     POSTGRESQL_POOL_SIZE,
+    TRACKER_STORE_THREAD_POOL_SIZE,
 )
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted, deserialise_events
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -60,8 +64,14 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# default number of threads which run the blocking operations of a tracker store
+DEFAULT_TRACKER_STORE_THREAD_POOL_SIZE = 10
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
+# prefix of the keys which store where the latest conversation session starts when
+# the `RedisTrackerStore` stores events in lists
+REDIS_SESSION_START_KEY_PREFIX = "session_start:"
 
 
 class TrackerStore:
@@ -183,6 +193,120 @@ class TrackerStore:
 
         return tracker
 
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> "DialogueStateTracker":
+        """Returns tracker or creates one if the retrieval returns None.
+
+        In contrast to `get_or_create_tracker` this doesn't block the event loop.
+
+        Args:
+            sender_id: Conversation ID associated with the requested tracker.
+            max_event_history: Value to update the tracker store's max event history to.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+        """
+        self.max_event_history = max_event_history
+
+        tracker = await self.retrieve_async(sender_id)
+
+        if tracker is None:
+            tracker = self.init_tracker(sender_id)
+
+            if append_action_listen:
+                tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+            await self.save_async(tracker)
+
+        return tracker
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the thread pool which runs the blocking tracker store operations."""
+        # custom tracker stores might not call `TrackerStore.__init__`
+        executor = getattr(self, "_executor", None)
+        if executor is None:
+            max_workers = int(
+                os.environ.get(
+                    TRACKER_STORE_THREAD_POOL_SIZE,
+                    DEFAULT_TRACKER_STORE_THREAD_POOL_SIZE,
+                )
+            )
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=self.__class__.__name__,
+            )
+            self._executor = executor
+
+        return executor
+
+    async def _run_blocking(self, function: Callable, *args: Any) -> Any:
+        """Runs a blocking tracker store operation without blocking the event loop.
+
+        Tracker stores which don't do any I/O can override this to run the operation
+        directly.
+
+        Args:
+            function: The blocking operation.
+            args: Arguments for `function`.
+
+        Returns:
+            The result of `function`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            self._get_executor(), functools.partial(function, *args)
+        )
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session without blocking.
+
+        The default implementation runs `self.retrieve()` in a thread pool, so
+        tracker stores which only implement the synchronous interface can be awaited.
+        Tracker stores with a native asynchronous client may override this.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from the latest conversation sessions.
+        """
+        return await self._run_blocking(self.retrieve, sender_id)
+
+    async def retrieve_full_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker with events from all sessions without blocking.
+
+        Args:
+            conversation_id: The conversation ID to retrieve the tracker for.
+
+        Returns:
+            The fetch tracker containing all events across session starts.
+        """
+        return await self._run_blocking(self.retrieve_full_tracker, conversation_id)
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker without blocking.
+
+        The default implementation runs `self.save()` in a thread pool.
+
+        Args:
+            tracker: The tracker to save.
+        """
+        await self._run_blocking(self.save, tracker)
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Returns the set of values for the tracker store's primary key."""
+        return await self._run_blocking(self.keys)
+
+    async def close(self) -> None:
+        """Releases the resources of the tracker store."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
+
     def save(self, tracker):
         """Save method that will be overridden by specific tracker"""
         raise NotImplementedError()
@@ -217,8 +341,15 @@ class TrackerStore:
         return self.retrieve(conversation_id)
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
-        """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
+        """Streams events to a message broker.
+
+        Only events which aren't persisted yet are published. The offset of these
+        events is taken from the tracker if it was retrieved from or saved to this
+        tracker store before, so the stored tracker doesn't need to be retrieved again.
+        """
+        offset = tracker.persisted_events_count
+        if offset is None:
+            offset = self.number_of_existing_events(tracker.sender_id)
         events = tracker.events
         for event in list(itertools.islice(events, offset, len(events))):
             body = {"sender_id": tracker.sender_id}
@@ -272,6 +403,7 @@ class TrackerStore:
             )
 
         tracker.recreate_from_dialogue(dialogue)
+        tracker.persisted_events_count = len(tracker.events)
 
         return tracker
 
@@ -288,12 +420,17 @@ class InMemoryTrackerStore(TrackerStore):
         self.store = {}
         super().__init__(domain, event_broker, **kwargs)
 
+    async def _run_blocking(self, function: Callable, *args: Any) -> Any:
+        # the in-memory store doesn't do any I/O, so it's cheaper to run it directly
+        return function(*args)
+
     def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state"""
         if self.event_broker:
             self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        tracker.persisted_events_count = len(tracker.events)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         if sender_id in self.store:
@@ -310,7 +447,13 @@ class InMemoryTrackerStore(TrackerStore):
 
 
 class RedisTrackerStore(TrackerStore):
-    """Stores conversation history in Redis"""
+    """Stores conversation history in Redis.
+
+    By default every tracker is stored as one serialised blob which is overwritten on
+    each save. If `use_event_lists` is set, the events of a tracker are stored in a
+    Redis list instead. Saves then only append the new events and retrievals only
+    fetch the events of the latest conversation session.
+    """
 
     def __init__(
         self,
@@ -323,6 +466,7 @@ class RedisTrackerStore(TrackerStore):
         record_exp: Optional[float] = None,
         key_prefix: Optional[Text] = None,
         use_ssl: bool = False,
+        use_event_lists: bool = False,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import redis
@@ -331,6 +475,7 @@ class RedisTrackerStore(TrackerStore):
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        self.use_event_lists = use_event_lists
 
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         if key_prefix:
@@ -350,6 +495,10 @@ class RedisTrackerStore(TrackerStore):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _session_start_key(self, sender_id: Text) -> Text:
+        """Key of the index of the latest `SessionStarted` event in the events list."""
+        return REDIS_SESSION_START_KEY_PREFIX + self.key_prefix + sender_id
+
     def save(self, tracker, timeout=None):
         """Saves the current conversation state"""
         if self.event_broker:
@@ -358,10 +507,130 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        if self.use_event_lists:
+            self._append_events(tracker, timeout)
+        else:
+            serialised_tracker = self.serialise_tracker(tracker)
+            self.red.set(
+                self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+            )
+        tracker.persisted_events_count = len(tracker.events)
+
+    def _append_events(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        """Appends the events which aren't stored yet to the tracker's events list.
+
+        Args:
+            tracker: Tracker to save.
+            timeout: Expiry of the stored events in seconds.
+        """
+        import redis.exceptions
+
+        key = self.key_prefix + tracker.sender_id
+        session_start_key = self._session_start_key(tracker.sender_id)
+
+        offset = tracker.persisted_events_count
+        if offset is None:
+            offset = self._number_of_events_since_session_start(tracker.sender_id)
+        new_events = list(itertools.islice(tracker.events, offset, len(tracker.events)))
+
+        def append() -> List[Any]:
+            pipeline = self.red.pipeline()
+            if new_events:
+                pipeline.rpush(key, *[json.dumps(e.as_dict()) for e in new_events])
+            if timeout:
+                pipeline.expire(key, int(timeout))
+                pipeline.expire(session_start_key, int(timeout))
+            return pipeline.execute()
+
+        try:
+            results = append()
+        except redis.exceptions.ResponseError:
+            # the tracker is still stored as serialised blob
+            self._migrate_serialised_tracker(tracker.sender_id)
+            results = append()
+
+        session_start_index = _index_of_latest_session_start(new_events)
+        if session_start_index is not None:
+            number_of_events = results[0]
+            self.red.set(
+                session_start_key,
+                number_of_events - len(new_events) + session_start_index,
+                ex=int(timeout) if timeout else None,
+            )
+
+    def _number_of_events_since_session_start(self, sender_id: Text) -> int:
+        import redis.exceptions
+
+        try:
+            number_of_events = self.red.llen(self.key_prefix + sender_id)
+        except redis.exceptions.ResponseError:
+            self._migrate_serialised_tracker(sender_id)
+            number_of_events = self.red.llen(self.key_prefix + sender_id)
+        session_start = self.red.get(self._session_start_key(sender_id))
+
+        return number_of_events - int(session_start or 0)
+
+    def _migrate_serialised_tracker(self, sender_id: Text) -> None:
+        """Converts a tracker which is stored as serialised blob to an events list.
+
+        Args:
+            sender_id: Conversation ID of the tracker to migrate.
+        """
+        key = self.key_prefix + sender_id
+        stored = self.red.get(key)
+        if stored is None:
+            return
+
+        logger.debug(
+            f"Migrating tracker for conversation ID '{sender_id}' from a serialised "
+            f"tracker to a list of events."
         )
+        tracker = self.deserialise_tracker(sender_id, stored)
+        events = list(tracker.events)
+        time_to_live = self.red.ttl(key)
+
+        pipeline = self.red.pipeline()
+        pipeline.delete(key)
+        if events:
+            pipeline.rpush(key, *[json.dumps(e.as_dict()) for e in events])
+        pipeline.set(
+            self._session_start_key(sender_id),
+            _index_of_latest_session_start(events) or 0,
+        )
+        if time_to_live and time_to_live > 0:
+            pipeline.expire(key, time_to_live)
+            pipeline.expire(self._session_start_key(sender_id), time_to_live)
+        pipeline.execute()
+
+    def _retrieve_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> List[bytes]:
+        import redis.exceptions
+
+        key = self.key_prefix + sender_id
+        session_start = 0
+        if not fetch_events_from_all_sessions:
+            session_start = int(self.red.get(self._session_start_key(sender_id)) or 0)
+
+        try:
+            return self.red.lrange(key, session_start, -1)
+        except redis.exceptions.ResponseError:
+            self._migrate_serialised_tracker(sender_id)
+            return self._retrieve_events(sender_id, fetch_events_from_all_sessions)
+
+    def _tracker_from_stored_events(
+        self, sender_id: Text, serialised_events: List[bytes]
+    ) -> DialogueStateTracker:
+        tracker = self.init_tracker(sender_id)
+        tracker.recreate_from_dialogue(
+            Dialogue(
+                sender_id,
+                deserialise_events([json.loads(event) for event in serialised_events]),
+            )
+        )
+        return tracker
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
@@ -374,17 +643,67 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             Tracker containing events from the latest conversation sessions.
         """
+        if self.use_event_lists:
+            serialised_events = self._retrieve_events(
+                sender_id, fetch_events_from_all_sessions=False
+            )
+            if not serialised_events:
+                return None
+
+            tracker = self._tracker_from_stored_events(sender_id, serialised_events)
+            # the offset is relative to the latest conversation session
+            tracker.persisted_events_count = len(serialised_events)
+            return tracker
+
         stored = self.red.get(self.key_prefix + sender_id)
         if stored is not None:
             return self.deserialise_tracker(sender_id, stored)
         else:
             return None
 
+    def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker with events from all conversation sessions.
+
+        Args:
+            conversation_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from all conversation sessions.
+        """
+        if not self.use_event_lists:
+            return self.retrieve(conversation_id)
+
+        serialised_events = self._retrieve_events(
+            conversation_id, fetch_events_from_all_sessions=True
+        )
+        if not serialised_events:
+            return None
+
+        return self._tracker_from_stored_events(conversation_id, serialised_events)
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
         return self.red.keys(self.key_prefix + "*")
 
 
+def _index_of_latest_session_start(events: List[Event]) -> Optional[int]:
+    """Returns the index of the latest `SessionStarted` event in `events`.
+
+    Args:
+        events: Events to search.
+
+    Returns:
+        Index of the latest `SessionStarted` event or `None` if there is none.
+    """
+    for index in reversed(range(len(events))):
+        if isinstance(events[index], SessionStarted):
+            return index
+
+    return None
+
+
 class DynamoTrackerStore(TrackerStore):
     """Stores conversation history in DynamoDB"""
 
@@ -475,6 +794,8 @@ class DynamoTrackerStore(TrackerStore):
             else:
                 raise
 
+        tracker.persisted_events_count = len(tracker.events)
+
     def _retrieve_latest_session_date(self, sender_id: Text) -> Optional[int]:
         dialogues = self.db.query(
             KeyConditionExpression=Key("sender_id").eq(sender_id),
@@ -513,9 +834,12 @@ class DynamoTrackerStore(TrackerStore):
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             sender_id, events_with_floats, self.domain.slots
         )
+        tracker.persisted_events_count = len(events_with_floats)
+
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
@@ -582,22 +906,94 @@ class MongoTrackerStore(TrackerStore):
 
     def save(self, tracker, timeout=None):
         """Saves the current conversation state."""
+        from pymongo import ReturnDocument
+
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        additional_events = list(self._additional_events(tracker))
 
-        self.conversations.update_one(
+        stored = self.conversations.find_one_and_update(
             {"sender_id": tracker.sender_id},
             {
                 "$set": self._current_tracker_state_without_events(tracker),
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
+                "$inc": {"events_count": len(additional_events)},
             },
+            projection={"events_count": True},
             upsert=True,
+            return_document=ReturnDocument.BEFORE,
         )
 
+        if stored is not None and "events_count" not in stored:
+            # the conversation was stored before the event counters were introduced
+            self._set_event_counters(tracker.sender_id)
+        else:
+            session_start_index = _index_of_latest_session_start(additional_events)
+            if session_start_index is not None:
+                number_of_stored_events = stored["events_count"] if stored else 0
+                self.conversations.update_one(
+                    {"sender_id": tracker.sender_id},
+                    {
+                        "$set": {
+                            "last_session_start_index": number_of_stored_events
+                            + session_start_index
+                        }
+                    },
+                )
+
+        tracker.persisted_events_count = len(tracker.events)
+
+    def _set_event_counters(self, sender_id: Text) -> None:
+        """Stores the number of events and the index of the latest session start.
+
+        These fields allow to fetch only the events of the latest conversation session
+        and are missing for conversations which were stored by older versions.
+
+        Args:
+            sender_id: Conversation ID of the stored conversation.
+        """
+        stored = self.conversations.find_one({"sender_id": sender_id}) or {}
+        all_events = self._events_from_serialized_tracker(stored)
+        number_events_since_last_session = len(
+            self._events_since_last_session_start(all_events)
+        )
+
+        self.conversations.update_one(
+            {"sender_id": sender_id},
+            {
+                "$set": {
+                    "events_count": len(all_events),
+                    "last_session_start_index": len(all_events)
+                    - number_events_since_last_session,
+                }
+            },
+        )
+
+    def _event_counters(self, sender_id: Text) -> Optional[Dict[Text, int]]:
+        """Returns the stored event counters of a conversation.
+
+        Args:
+            sender_id: Conversation ID of the stored conversation.
+
+        Returns:
+            The number of stored events and the index of the latest session start, or
+            `None` if the conversation or its counters aren't stored.
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            {"events_count": True, "last_session_start_index": True},
+        )
+        if not stored or "events_count" not in stored:
+            return None
+
+        return {
+            "events_count": stored["events_count"],
+            "last_session_start_index": stored.get("last_session_start_index", 0),
+        }
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -608,12 +1004,22 @@ class MongoTrackerStore(TrackerStore):
             List of serialised events that aren't currently stored.
 
         """
+        number_events_since_last_session = tracker.persisted_events_count
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
-        )
+        if number_events_since_last_session is None:
+            counters = self._event_counters(tracker.sender_id)
+            if counters:
+                number_events_since_last_session = (
+                    counters["events_count"] - counters["last_session_start_index"]
+                )
+            else:
+                stored = (
+                    self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
+                )
+                all_events = self._events_from_serialized_tracker(stored)
+                number_events_since_last_session = len(
+                    self._events_since_last_session_start(all_events)
+                )
 
         return itertools.islice(
             tracker.events, number_events_since_last_session, len(tracker.events)
@@ -644,10 +1050,32 @@ class MongoTrackerStore(TrackerStore):
 
         return list(reversed(events_after_session_start))
 
+    def _latest_session_projection(self, sender_id: Text) -> Optional[Dict]:
+        """Returns a projection which only fetches the events of the latest session.
+
+        Args:
+            sender_id: Conversation ID of the stored conversation.
+
+        Returns:
+            `$slice` projection of the events, or `None` if the event counters of the
+            conversation aren't stored.
+        """
+        counters = self._event_counters(sender_id)
+        if not counters:
+            return None
+
+        start = counters["last_session_start_index"]
+        # the number of events to return has to be positive
+        return {"events": {"$slice": [start, max(counters["events_count"] - start, 1)]}}
+
     def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        projection = None
+        if not fetch_events_from_all_sessions:
+            projection = self._latest_session_projection(sender_id)
+
+        stored = self.conversations.find_one({"sender_id": sender_id}, projection)
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -681,7 +1109,11 @@ class MongoTrackerStore(TrackerStore):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        # the offset is relative to the latest conversation session
+        tracker.persisted_events_count = len(events)
+
+        return tracker
 
     def retrieve_full_tracker(
         self, conversation_id: Text
@@ -969,6 +1401,17 @@ class SQLTrackerStore(TrackerStore):
 
         conn.close()
 
+    async def _run_blocking(self, function: Callable, *args: Any) -> Any:
+        if self.engine.dialect.name == "sqlite" and self.engine.url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            # every thread would get its own in-memory SQLite database
+            return function(*args)
+
+        return await super()._run_blocking(function, *args)
+
     @contextlib.contextmanager
     def session_scope(self):
         """Provide a transactional scope around a series of operations."""
@@ -1020,9 +1463,13 @@ class SQLTrackerStore(TrackerStore):
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
+                tracker = DialogueStateTracker.from_dict(
                     sender_id, events, self.domain.slots
                 )
+                if not fetch_events_from_all_sessions:
+                    # the offset is relative to the latest conversation session
+                    tracker.persisted_events_count = len(events)
+                return tracker
             else:
                 logger.debug(
                     f"Can't retrieve tracker matching "
@@ -1081,37 +1528,46 @@ class SQLTrackerStore(TrackerStore):
             # only store recent events
             events = self._additional_events(session, tracker)
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
-                )
+            session.bulk_insert_mappings(
+                self.SQLEvent,
+                [self._event_to_row(tracker.sender_id, event) for event in events],
+            )
             session.commit()
 
+        tracker.persisted_events_count = len(tracker.events)
+
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
+    @staticmethod
+    def _event_to_row(sender_id: Text, event: Event) -> Dict[Text, Any]:
+        """Return the column values of the `SQLEvent` row for `event`."""
+        data = event.as_dict()
+        intent = data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": data.get("timestamp"),
+            "intent_name": intent,
+            "action_name": data.get("name"),
+            "data": json.dumps(data),
+        }
+
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
+        """Return events from the tracker which aren't currently stored.
+
+        If the tracker was retrieved from or saved to this tracker store before, the
+        stored events don't have to be counted in the database.
+        """
+        number_of_events_since_last_session = tracker.persisted_events_count
+
+        if number_of_events_since_last_session is None:
+            number_of_events_since_last_session = self._event_query(
+                session, tracker.sender_id, fetch_events_from_all_sessions=False
+            ).count()
 
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
         return itertools.islice(
             tracker.events, number_of_events_since_last_session, len(tracker.events)
         )
@@ -1193,6 +1649,44 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def retrieve_full_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_full_tracker_async(
+                conversation_id
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def keys_async(self) -> Iterable[Text]:
+        try:
+            return await self._tracker_store.keys_async()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_async(tracker)
+
+    async def close(self) -> None:
+        await self._tracker_store.close()
+        if self._fallback_tracker_store:
+            await self._fallback_tracker_store.close()
+        await super().close()
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -8,7 +8,7 @@ import os
 import scipy.sparse
 import tensorflow as tf
 
-from typing import Any, Dict, List, Optional, Text, Tuple, Union, Type
+from typing import Any, Dict, Iterator, List, Optional, Text, Tuple, Union, Type
 
 import rasa.shared.utils.io
 import rasa.utils.io as io_utils
@@ -840,6 +840,11 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     # process helpers
     def _predict(self, message: Message) -> Optional[Dict[Text, tf.Tensor]]:
+        return self._predict_batch([message])
+
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> Optional[Dict[Text, tf.Tensor]]:
         if self.model is None:
             logger.debug(
                 f"There is no trained model for '{self.__class__.__name__}': The "
@@ -848,15 +853,54 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
             )
             return None
 
-        # create session data from message and convert it into a batch of 1
-        model_data = self._create_model_data([message], training=False)
+        # create session data from the messages and convert it into a single batch,
+        # sequences are padded to the longest message
+        model_data = self._create_model_data(messages, training=False)
 
         return self.model.predict(model_data)
 
+    def _prediction_batches(
+        self, messages: List[Message]
+    ) -> Iterator[Tuple[List[Message], Optional[Dict[Text, tf.Tensor]]]]:
+        """Predicts the messages in batches of at most the largest training batch."""
+        batch_size = self.component_config[BATCH_SIZES]
+        if isinstance(batch_size, list):
+            batch_size = max(batch_size)
+        for start in range(0, len(messages), batch_size):
+            batch = messages[start : start + batch_size]
+            yield batch, self._predict_batch(batch)
+
+    @staticmethod
+    def _diagnostic_data(
+        predict_out: Dict[Text, Any], prediction_index: int
+    ) -> Dict[Text, Any]:
+        """Returns the diagnostic data of a single message of a prediction batch.
+
+        The batch dimension is kept, so that the data has the same shape as if the
+        message was predicted on its own (apart from padding).
+        """
+        diagnostic_data = rasa.utils.tensorflow.numpy.values_to_numpy(
+            predict_out.get(DIAGNOSTIC_DATA)
+        )
+        if not diagnostic_data:
+            return diagnostic_data
+
+        batch_slice = slice(prediction_index, prediction_index + 1)
+
+        attention_weights = diagnostic_data.get("attention_weights")
+        if attention_weights is not None:
+            # attention weights are stacked per transformer layer
+            diagnostic_data["attention_weights"] = attention_weights[:, batch_slice]
+        text_transformed = diagnostic_data.get("text_transformed")
+        if text_transformed is not None:
+            diagnostic_data["text_transformed"] = text_transformed[batch_slice]
+
+        return diagnostic_data
+
     def _predict_label(
-        self, predict_out: Optional[Dict[Text, tf.Tensor]]
+        self, predict_out: Optional[Dict[Text, tf.Tensor]], prediction_index: int = 0
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
-        """Predicts the intent of the provided message."""
+        """Predicts the intent of the message at `prediction_index` of the batch."""
 
         label = {"name": None, "id": None, "confidence": 0.0}
         label_ranking = []
@@ -864,7 +908,7 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         if predict_out is None:
             return label, label_ranking
 
-        message_sim = predict_out["i_scores"].numpy()
+        message_sim = predict_out["i_scores"].numpy()[prediction_index]
 
         message_sim = message_sim.flatten()  # sim is a matrix
 
@@ -913,13 +957,19 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         return label, label_ranking
 
     def _predict_entities(
-        self, predict_out: Optional[Dict[Text, tf.Tensor]], message: Message
+        self,
+        predict_out: Optional[Dict[Text, tf.Tensor]],
+        message: Message,
+        prediction_index: int = 0,
     ) -> List[Dict]:
         if predict_out is None:
             return []
 
         predicted_tags, confidence_values = train_utils.entity_label_to_tags(
-            predict_out, self._entity_tag_specs, self.component_config[BILOU_FLAG]
+            predict_out,
+            self._entity_tag_specs,
+            self.component_config[BILOU_FLAG],
+            prediction_index=prediction_index,
         )
 
         entities = self.convert_predictions_into_entities(
@@ -937,23 +987,34 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Augments the message with intents, entities, and diagnostic data."""
-        out = self._predict(message)
+        self._set_prediction(message, self._predict(message))
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Augments the messages with predictions of a single forward pass per batch."""
+        for batch, out in self._prediction_batches(messages):
+            for prediction_index, message in enumerate(batch):
+                self._set_prediction(message, out, prediction_index)
+
+    def _set_prediction(
+        self,
+        message: Message,
+        out: Optional[Dict[Text, tf.Tensor]],
+        prediction_index: int = 0,
+    ) -> None:
         if self.component_config[INTENT_CLASSIFICATION]:
-            label, label_ranking = self._predict_label(out)
+            label, label_ranking = self._predict_label(out, prediction_index)
 
             message.set(INTENT, label, add_to_output=True)
             message.set("intent_ranking", label_ranking, add_to_output=True)
 
         if self.component_config[ENTITY_RECOGNITION]:
-            entities = self._predict_entities(out, message)
+            entities = self._predict_entities(out, message, prediction_index)
 
             message.set(ENTITIES, entities, add_to_output=True)
 
         if out and DIAGNOSTIC_DATA in out:
             message.add_diagnostic_data(
-                self.unique_name,
-                rasa.utils.tensorflow.numpy.values_to_numpy(out.get(DIAGNOSTIC_DATA)),
+                self.unique_name, self._diagnostic_data(out, prediction_index)
             )
 
     def persist(self, file_name: Text, model_dir: Text) -> Dict[Text, Any]:
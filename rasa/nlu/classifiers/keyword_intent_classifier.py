@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional, Text
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 from rasa.nlu import utils
 from rasa.nlu.classifiers.classifier import IntentClassifier
+from rasa.nlu.utils.pattern_utils import PatternMatcher
 from rasa.shared.nlu.constants import INTENT, TEXT
 import rasa.shared.utils.io
 from rasa.nlu.config import RasaNLUModelConfig
@@ -37,6 +38,17 @@ class KeywordIntentClassifier(IntentClassifier):
 
         self.case_sensitive = self.component_config.get("case_sensitive")
         self.intent_keyword_map = intent_keyword_map or {}
+        self._compile_keywords()
+
+    def _compile_keywords(self) -> None:
+        self._keywords = list(self.intent_keyword_map.items())
+        self._matcher = PatternMatcher(
+            [
+                {"name": intent, "pattern": r"\b" + keyword + r"\b"}
+                for keyword, intent in self._keywords
+            ],
+            self.case_sensitive,
+        )
 
     def train(
         self,
@@ -70,6 +82,7 @@ class KeywordIntentClassifier(IntentClassifier):
             )
 
         self._validate_keyword_map()
+        self._compile_keywords()
 
     def _validate_keyword_map(self) -> None:
         re_flag = 0 if self.case_sensitive else re.IGNORECASE
@@ -108,15 +121,14 @@ class KeywordIntentClassifier(IntentClassifier):
             message.set(INTENT, intent, add_to_output=True)
 
     def _map_keyword_to_intent(self, text: Text) -> Optional[Text]:
-        re_flag = 0 if self.case_sensitive else re.IGNORECASE
-
-        for keyword, intent in self.intent_keyword_map.items():
-            if re.search(r"\b" + keyword + r"\b", text, flags=re_flag):
-                logger.debug(
-                    f"KeywordClassifier matched keyword '{keyword}' to"
-                    f" intent '{intent}'."
-                )
-                return intent
+        index = self._matcher.first_match(text)
+        if index is not None:
+            keyword, intent = self._keywords[index]
+            logger.debug(
+                f"KeywordClassifier matched keyword '{keyword}' to"
+                f" intent '{intent}'."
+            )
+            return intent
 
         logger.debug("KeywordClassifier did not find any keywords in the message.")
         return None
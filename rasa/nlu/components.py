@@ -592,6 +592,20 @@ class Component(metaclass=ComponentMetaclass):
         """
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Processes a batch of incoming messages.
+
+        Components which can vectorize their work (e.g. featurizers or models doing a
+        forward pass) should override this method. By default every message is
+        processed on its own using :meth:`rasa.nlu.components.Component.process`.
+
+        Args:
+            messages: The :class:`rasa.shared.nlu.training_data.message.Message`
+                objects to process.
+        """
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persists this component to disk for future loading.
 
@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.shared.utils.io
@@ -47,6 +46,7 @@ class RegexEntityExtractor(EntityExtractor):
 
         self.case_sensitive = self.component_config["case_sensitive"]
         self.patterns = patterns or []
+        self._matcher = pattern_utils.PatternMatcher(self.patterns, self.case_sensitive)
 
     def train(
         self,
@@ -61,6 +61,7 @@ class RegexEntityExtractor(EntityExtractor):
             use_only_entities=True,
             use_word_boundaries=self.component_config["use_word_boundaries"],
         )
+        self._matcher = pattern_utils.PatternMatcher(self.patterns, self.case_sensitive)
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -84,26 +85,16 @@ class RegexEntityExtractor(EntityExtractor):
     def _extract_entities(self, message: Message) -> List[Dict[Text, Any]]:
         """Extract entities of the given type from the given user message."""
         entities = []
+        text = message.get(TEXT)
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        for pattern, spans in zip(self.patterns, self._matcher.spans(text)):
+            for start_index, end_index in spans:
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
                         ENTITY_ATTRIBUTE_START: start_index,
                         ENTITY_ATTRIBUTE_END: end_index,
-                        ENTITY_ATTRIBUTE_VALUE: message.get(TEXT)[
-                            start_index:end_index
-                        ],
+                        ENTITY_ATTRIBUTE_VALUE: text[start_index:end_index],
                     }
                 )
 
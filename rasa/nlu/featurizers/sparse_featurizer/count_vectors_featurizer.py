@@ -613,41 +613,38 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
         if not self.vectorizers.get(attribute):
-            return [None], [None]
-
-        sequence_features = []
-        sentence_features = []
-
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            seq_vec = self.vectorizers[attribute].transform(tokens)
+            return [None] * len(all_tokens), [None] * len(all_tokens)
+
+        sequence_features = [None] * len(all_tokens)
+        sentence_features = [None] * len(all_tokens)
+
+        # examples without tokens have nothing to featurize
+        # (e.g. the response is not present)
+        indices = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not indices:
+            return sequence_features, sentence_features
+
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features], hence all examples are vectorized at once:
+        # the sequences as one list of tokens and the sentences as one string each
+        seq_vecs = self.vectorizers[attribute].transform(
+            [token for i in indices for token in all_tokens[i]]
+        )
+        offset = 0
+        for i in indices:
+            seq_vec = seq_vecs[offset : offset + len(all_tokens[i])]
             seq_vec.sort_indices()
+            sequence_features[i] = seq_vec.tocoo()
+            offset += len(all_tokens[i])
 
-            sequence_features.append(seq_vec.tocoo())
-
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            sentence_vecs = self.vectorizers[attribute].transform(
+                [" ".join(all_tokens[i]) for i in indices]
+            )
+            for row, i in enumerate(indices):
+                sentence_vec = sentence_vecs[row : row + 1]
                 sentence_vec.sort_indices()
-
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+                sentence_features[i] = sentence_vec.tocoo()
 
         return sequence_features, sentence_features
 
@@ -766,6 +763,30 @@ class CountVectorsFeaturizer(SparseFeaturizer):
                 attribute, sequence_features, sentence_features, [message]
             )
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Computes the features of all messages with one vectorizer call each."""
+        if self.vectorizers is None:
+            logger.error(
+                "There is no trained CountVectorizer: "
+                "component is either not trained or "
+                "didn't receive enough training data"
+            )
+            return
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
+
+            # features shape (len(messages), seq, dim)
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+
+            self._set_attribute_features(
+                attribute, sequence_features, sentence_features, messages
+            )
+
     def _collect_vectorizer_vocabularies(self) -> Dict[Text, Optional[Dict[Text, int]]]:
         """Get vocabulary for all attributes"""
 
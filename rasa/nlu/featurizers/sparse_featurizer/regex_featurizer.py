@@ -1,5 +1,5 @@
+import bisect
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text, Type, Tuple
 from pathlib import Path
 import numpy as np
@@ -77,6 +77,7 @@ class RegexFeaturizer(SparseFeaturizer):
         ]
         self.finetune_mode = finetune_mode
         self.pattern_vocabulary_stats = pattern_vocabulary_stats
+        self._matcher: Optional[pattern_utils.PatternMatcher] = None
 
         if self.finetune_mode and not self.pattern_vocabulary_stats:
             # If the featurizer is instantiated in finetune mode,
@@ -185,6 +186,7 @@ class RegexFeaturizer(SparseFeaturizer):
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._matcher = None
 
         for example in training_data.training_examples:
             for attribute in [TEXT, RESPONSE, ACTION_TEXT]:
@@ -250,42 +252,57 @@ class RegexFeaturizer(SparseFeaturizer):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
+        if self._matcher is None:
+            self._matcher = pattern_utils.PatternMatcher(
+                self.known_patterns, self.case_sensitive
+            )
 
         sequence_length = len(tokens)
-
         max_number_patterns = self.vocabulary_stats["max_number_patterns"]
+        # tokens are ordered, hence their ends are sorted as well
+        token_ends = [token.end for token in tokens]
+
+        matched_tokens = set()
+        for pattern_index, spans in enumerate(
+            self._matcher.spans(message.get(attribute))
+        ):
+            for start, end in spans:
+                # the first token overlapping with the match is the first one ending
+                # after the start of the match
+                token_index = bisect.bisect_right(token_ends, start)
+                while token_index < sequence_length and tokens[token_index].start < end:
+                    matched_tokens.add((token_index, pattern_index))
+                    token_index += 1
+
+        for token_index, token in enumerate(tokens):
+            patterns = token.get("pattern", default={})
+            for pattern_index, pattern in enumerate(self.known_patterns):
+                patterns[pattern["name"]] = (
+                    token_index,
+                    pattern_index,
+                ) in matched_tokens
+            token.set("pattern", patterns)
+
+        rows, columns = zip(*sorted(matched_tokens)) if matched_tokens else ((), ())
+        sequence_features = scipy.sparse.coo_matrix(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(sequence_length, max_number_patterns),
+        )
 
-        sequence_features = np.zeros([sequence_length, max_number_patterns])
-        sentence_features = np.zeros([1, max_number_patterns])
-
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(
-                pattern["pattern"], message.get(attribute), flags=flags
-            )
-            matches = list(matches)
-
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
-
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
-
-                t.set("pattern", patterns)
-
-        return (
-            scipy.sparse.coo_matrix(sequence_features),
-            scipy.sparse.coo_matrix(sentence_features),
+        matched_patterns = []
+        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
+            # sentence vector should contain all patterns
+            matched_patterns = sorted(set(columns))
+        sentence_features = scipy.sparse.coo_matrix(
+            (
+                np.ones(len(matched_patterns)),
+                ([0] * len(matched_patterns), matched_patterns),
+            ),
+            shape=(1, max_number_patterns),
         )
 
+        return sequence_features, sentence_features
+
     @classmethod
     def load(
         cls,
@@ -456,6 +456,49 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse multiple input texts at once.
+
+        Every component of the pipeline processes all messages together, which lets
+        featurizers and classifiers vectorize their work (e.g. a single forward pass
+        of a model instead of one per message).
+
+        Returns:
+            The pipeline results in the order of `texts`.
+        """
+        # empty strings are not processed, see `parse`
+        messages = {
+            index: Message(
+                data={**self.default_output_attributes(), TEXT: text}, time=time
+            )
+            for index, text in enumerate(texts)
+            if text
+        }
+
+        if messages:
+            for component in self.pipeline:
+                component.process_batch(list(messages.values()), **self.context)
+
+        outputs = []
+        for index in range(len(texts)):
+            output = self.default_output_attributes()
+            if index in messages:
+                output.update(
+                    messages[index].as_dict(
+                        only_output_properties=only_output_properties
+                    )
+                )
+            else:
+                output["text"] = ""
+            outputs.append(output)
+
+        return outputs
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
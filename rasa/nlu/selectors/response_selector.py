@@ -7,7 +7,6 @@ import tensorflow as tf
 from typing import Any, Dict, Optional, Text, Tuple, Union, List, Type
 
 from rasa.shared.constants import DIAGNOSTIC_DATA
-import rasa.utils.tensorflow.numpy
 from rasa.shared.nlu.training_data import util
 import rasa.shared.utils.io
 from rasa.shared.exceptions import InvalidConfigException
@@ -405,8 +404,15 @@ class ResponseSelector(DIETClassifier):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Return the most likely response, the associated intent_response_key and its similarity to the input."""
-        out = self._predict(message)
-        top_label, label_ranking = self._predict_label(out)
+        self._set_prediction(message, self._predict(message))
+
+    def _set_prediction(
+        self,
+        message: Message,
+        out: Optional[Dict[Text, tf.Tensor]],
+        prediction_index: int = 0,
+    ) -> None:
+        top_label, label_ranking = self._predict_label(out, prediction_index)
 
         # Get the exact intent_response_key and the associated
         # response templates for the top predicted label
@@ -464,8 +470,7 @@ class ResponseSelector(DIETClassifier):
 
         if out and DIAGNOSTIC_DATA in out:
             message.add_diagnostic_data(
-                self.unique_name,
-                rasa.utils.tensorflow.numpy.values_to_numpy(out.get(DIAGNOSTIC_DATA)),
+                self.unique_name, self._diagnostic_data(out, prediction_index)
             )
 
     def persist(self, file_name: Text, model_dir: Text) -> Dict[Text, Any]:
@@ -66,6 +66,9 @@ ENTITY_PROCESSORS = {"EntitySynonymMapper", "ResponseSelector"}
 
 EXTRACTORS_WITH_CONFIDENCES = {"CRFEntityExtractor", "DIETClassifier"}
 
+# number of test examples which are parsed at once
+EVAL_BATCH_SIZE = 64
+
 
 class CVEvaluationResult(NamedTuple):
     """Stores NLU cross-validation results."""
@@ -1260,8 +1263,20 @@ def get_eval_data(
 
     should_eval_entities = is_entity_extractor_present(interpreter)
 
-    for example in tqdm(test_data.nlu_examples):
-        result = interpreter.parse(example.get(TEXT), only_output_properties=False)
+    examples = test_data.nlu_examples
+    results = []
+    with tqdm(total=len(examples)) as progress_bar:
+        for start in range(0, len(examples), EVAL_BATCH_SIZE):
+            batch = examples[start : start + EVAL_BATCH_SIZE]
+            results.extend(
+                interpreter.parse_batch(
+                    [example.get(TEXT) for example in batch],
+                    only_output_properties=False,
+                )
+            )
+            progress_bar.update(len(batch))
+
+    for example, result in zip(examples, results):
 
         if should_eval_intents:
             if rasa.nlu.classifiers.fallback_classifier.is_fallback_classifier_prediction(
@@ -75,7 +75,7 @@ def create_persistor(persistor: Optional[Text]):
 
 async def train(
     nlu_config: Union[Text, Dict, RasaNLUModelConfig],
-    data: Union[Text, "TrainingDataImporter"],
+    data: Union[Text, "TrainingDataImporter", "TrainingData"],
     path: Optional[Text] = None,
     fixed_model_name: Optional[Text] = None,
     storage: Optional[Text] = None,
@@ -87,6 +87,7 @@ async def train(
 ) -> Tuple[Trainer, Interpreter, Optional[Text]]:
     """Loads the trainer and the data and runs the training of the model."""
     from rasa.shared.importers.importer import TrainingDataImporter
+    from rasa.shared.nlu.training_data.training_data import TrainingData
 
     if not isinstance(nlu_config, RasaNLUModelConfig):
         nlu_config = config.load(nlu_config)
@@ -104,6 +105,8 @@ async def train(
         )
     elif isinstance(data, TrainingDataImporter):
         training_data = await data.get_nlu_data(nlu_config.language)
+    elif isinstance(data, TrainingData):
+        training_data = data
     else:
         training_data = load_data(data, nlu_config.language)
 
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Text, Union
+from typing import Dict, List, Optional, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -153,3 +153,44 @@ def extract_patterns(
         )
 
     return patterns
+
+
+class PatternMatcher:
+    """Matches regex patterns, which are compiled once, against texts.
+
+    The patterns are matched one after another instead of being combined into a
+    single alternation, as matches of different patterns may overlap.
+    """
+
+    def __init__(
+        self, patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+    ) -> None:
+        """Compiles the patterns.
+
+        Args:
+            patterns: The patterns as dictionaries with a `name` and a `pattern`.
+            case_sensitive: `False` if the patterns should ignore the case.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self.patterns = patterns
+        self._regexes = [re.compile(pattern["pattern"], flags) for pattern in patterns]
+
+    def spans(self, text: Text) -> List[List[Tuple[int, int]]]:
+        """Finds all matches of every pattern.
+
+        Args:
+            text: The text to match the patterns against.
+
+        Returns:
+            The start and end of the matches of every pattern.
+        """
+        return [
+            [match.span() for match in regex.finditer(text)] for regex in self._regexes
+        ]
+
+    def first_match(self, text: Text) -> Optional[int]:
+        """Returns the index of the first pattern which matches `text`, if any."""
+        for index, regex in enumerate(self._regexes):
+            if regex.search(text):
+                return index
+        return None
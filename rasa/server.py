@@ -20,6 +20,7 @@ from typing import (
     Dict,
     TYPE_CHECKING,
     NoReturn,
+    Tuple,
     Coroutine,
 )
 
@@ -36,6 +37,8 @@ import rasa.utils.common
 import rasa.shared.utils.common
 import rasa.shared.utils.io
 import rasa.utils.endpoints
+import rasa.utils.inference_executor
+import rasa.utils.inference_scheduler
 import rasa.utils.io
 import rasa.shared.data
 from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
@@ -330,7 +333,7 @@ async def update_conversation_with_events(
         The tracker for `conversation_id` with the updated events.
     """
     if rasa.shared.core.events.do_events_begin_with_session_start(events):
-        tracker = processor.get_tracker(conversation_id)
+        tracker = await processor.get_tracker_async(conversation_id)
     else:
         tracker = await processor.fetch_tracker_with_initial_session(conversation_id)
 
@@ -340,6 +343,40 @@ async def update_conversation_with_events(
     return tracker
 
 
+async def _parse_batch(
+    agent: Agent, emulator: NoEmulator, messages: List[Dict[Text, Any]]
+) -> List[Dict[Text, Any]]:
+    """Parses multiple messages of a `/model/parse` request at once.
+
+    Messages are grouped by their language, every group goes through the NLU
+    pipeline as a single batch.
+    """
+    texts_by_lang: Dict[Optional[Text], List[Tuple[int, Text]]] = {}
+    for index, message in enumerate(messages):
+        data = emulator.normalise_request_json(message)
+        texts_by_lang.setdefault(message.get("lang"), []).append(  # bf
+            (index, data.get("text"))
+        )
+
+    parsed = [None] * len(messages)
+    for lang, texts in texts_by_lang.items():
+        try:
+            parsed_data = await agent.parse_messages_using_nlu_interpreter(
+                [text for _, text in texts], lang=lang
+            )
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "ParsingError",
+                f"An unexpected error occurred. Error: {e}",
+            )
+        for (index, _), data in zip(texts, parsed_data):
+            parsed[index] = emulator.normalise_response_json(data)
+
+    return parsed
+
+
 def validate_request_body(request: Request, error_message: Text) -> None:
     """Check if `request` has a body."""
     if not request.body:
@@ -666,14 +703,36 @@ def create_app(
     async def status(request: Request):
         """Respond with the model name and the fingerprint of that model."""
 
-        return response.json(
-            {
-                "model_file": app.agent.path_to_model_archive
-                or app.agent.model_directory,
-                "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
-                "num_active_training_jobs": app.active_training_processes.value,
-            }
-        )
+        status = {
+            "model_file": app.agent.path_to_model_archive or app.agent.model_directory,
+            "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
+            "num_active_training_jobs": app.active_training_processes.value,
+        }
+        inference_executor = rasa.utils.inference_executor.get_inference_executor()
+        if inference_executor:
+            status["inference_executor"] = inference_executor.stats()
+        inference_schedulers = rasa.utils.inference_scheduler.scheduler_stats()
+        if inference_schedulers:
+            status["inference_schedulers"] = inference_schedulers
+        endpoint_sessions = rasa.utils.endpoints.session_stats()
+        if endpoint_sessions:
+            status["endpoint_sessions"] = endpoint_sessions
+        event_broker = getattr(app.agent.tracker_store, "event_broker", None)
+        if callable(getattr(event_broker, "stats", None)):
+            status["event_broker"] = event_broker.stats()
+        # bf
+        if callable(getattr(app.agent.interpreter, "stats", None)):
+            status["nlu_models"] = app.agent.interpreter.stats()
+        if callable(getattr(app.agent.interpreter, "cache_stats", None)):
+            nlu_caches = app.agent.interpreter.cache_stats()
+            if nlu_caches:
+                status["nlu_caches"] = nlu_caches
+        if callable(getattr(app.agent.nlg, "cache_stats", None)):
+            nlg_cache = app.agent.nlg.cache_stats()
+            if nlg_cache:
+                status["nlg_cache"] = nlg_cache
+
+        return response.json(status)
 
     @app.get("/conversations/<conversation_id:path>/tracker")
     @requires_auth(app, auth_token)
@@ -733,7 +792,7 @@ def create_app(
                         events, tracker, output_channel
                     )
 
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -787,7 +846,7 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -1274,8 +1333,10 @@ def create_app(
             )
 
         try:
-            result = app.agent.create_processor().predict_next_with_tracker(
-                tracker, verbosity
+            result = await rasa.utils.inference_executor.run_inference(
+                app.agent.create_processor().predict_next_with_tracker,
+                tracker,
+                verbosity,
             )
 
             return response.json(result)
@@ -1300,6 +1361,12 @@ def create_app(
         emulator = _create_emulator(emulation_mode)
 
         try:
+            if isinstance(request.json, list):
+                # a list of messages is parsed in batches, one per language
+                return response.json(
+                    await _parse_batch(app.agent, emulator, request.json)
+                )
+
             data = emulator.normalise_request_json(request.json)
             try:
                 parsed_data = await app.agent.parse_message_using_nlu_interpreter(
@@ -1369,7 +1436,7 @@ def create_app(
         """Get current domain in yaml or json format."""
         accepts = request.headers.get("Accept", default=JSON_CONTENT_TYPE)
         if accepts.endswith("json"):
-            domain = app.agent.domain.as_dict()
+            domain = app.agent.domain.cached_dict
             return response.json(domain)
         elif accepts.endswith("yml") or accepts.endswith("yaml"):
             domain_yaml = app.agent.domain.as_yaml()
@@ -664,6 +664,20 @@ class Domain:
         self_as_dict[KEY_ACTIONS] = self.action_names_or_texts
         return rasa.shared.utils.io.get_dictionary_fingerprint(self_as_dict)
 
+    @rasa.shared.utils.common.lazy_property
+    def cached_fingerprint(self) -> Text:
+        """Returns the fingerprint of the domain, which is only computed once."""
+        return self.fingerprint()
+
+    @rasa.shared.utils.common.lazy_property
+    def cached_dict(self) -> Dict[Text, Any]:
+        """Returns the serialized domain, which is only computed once.
+
+        Other than the result of `as_dict`, the dictionary is shared and must not be
+        modified.
+        """
+        return self.as_dict()
+
     @rasa.shared.utils.common.lazy_property
     def user_actions_and_forms(self):
         """Returns combination of user actions and forms."""
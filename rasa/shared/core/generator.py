@@ -93,7 +93,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
         # if don't have it cached, we use the domain to calculate the states
         # from the events
         if self._states_for_hashing is None:
-            states = super().past_states(domain)
+            states = domain.states_for_tracker_history(self)
             self._states_for_hashing = deque(
                 self.freeze_current_state(s) for s in states
             )
@@ -107,8 +107,12 @@ class TrackerWithCachedStates(DialogueStateTracker):
             for frozen_state in frozen_states
         ]
 
-    def past_states(self, domain: Domain) -> List[State]:
+    def past_states(
+        self, domain: Domain, max_history: Optional[int] = None
+    ) -> List[State]:
         states_for_hashing = self.past_states_for_hashing(domain)
+        if max_history:
+            states_for_hashing = list(states_for_hashing)[-max_history:]
         return self._unfreeze_states(states_for_hashing)
 
     def clear_states(self) -> None:
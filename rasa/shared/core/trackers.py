@@ -107,6 +107,66 @@ class AnySlotDict(dict):
         return True
 
 
+class _PastStatesCache:
+    """Keeps the states of a tracker's history so that they can be updated with
+    new events instead of being recreated from all events."""
+
+    def __init__(self, tracker: "DialogueStateTracker", domain: Domain) -> None:
+        self.domain = domain
+        self.loop_names = {
+            event.name
+            for event in tracker.events
+            if isinstance(event, ActiveLoop) and event.name
+        }
+        # the tracker with all applied events up to now
+        self.prior_tracker = tracker.init_copy()
+        self.applied_events: List[Event] = []
+        # the states before each applied `ActionExecuted` event
+        self.states: List[State] = []
+        self.events_count = 0
+        self.last_event: Optional[Event] = None
+
+    def apply(self, event: Event) -> None:
+        if isinstance(event, ActionExecuted):
+            self.states.append(self.domain.get_active_states(self.prior_tracker))
+        self.prior_tracker.update(event)
+        self.applied_events.append(event)
+
+    def apply_new_event(self, event: Event, tracker: "DialogueStateTracker") -> bool:
+        """Applies an event which was added to `tracker` after the cached events.
+
+        Returns:
+            `False` if the event changes events which were applied before, in this
+            case the states have to be recreated from all events.
+        """
+        if isinstance(event, (Restarted, SessionStarted)):
+            self.prior_tracker = tracker.init_copy()
+            self.applied_events = []
+            self.states = []
+            return True
+
+        if isinstance(event, (ActionReverted, UserUtteranceReverted)):
+            return False
+        # loop names change how previous loop executions are applied
+        if (
+            isinstance(event, ActiveLoop)
+            and event.name
+            and event.name not in self.loop_names
+        ):
+            return False
+        if (
+            isinstance(event, ActionExecuted)
+            and event.action_name in self.loop_names
+            and not tracker._first_loop_execution_or_unhappy_path(
+                event.action_name, self.applied_events
+            )
+        ):
+            return False
+
+        self.apply(event)
+        return True
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
@@ -189,6 +249,12 @@ class DialogueStateTracker:
         self.sender_source = sender_source
         # whether the tracker belongs to a rule-based data
         self.is_rule_tracker = is_rule_tracker
+        # number of events (from the start of `events`) which are known to be
+        # persisted in a tracker store. `None` if that is unknown, e.g. if the
+        # tracker wasn't loaded from or saved to a tracker store.
+        self.persisted_events_count: Optional[int] = None
+        # states of the history which were created for predictions
+        self._past_states_cache: Optional[_PastStatesCache] = None
 
         ###
         # current state of the tracker - MUST be re-creatable by processing
@@ -210,10 +276,20 @@ class DialogueStateTracker:
     # Public tracker interface
     ###
     def current_state(
-        self, event_verbosity: EventVerbosity = EventVerbosity.NONE
+        self,
+        event_verbosity: EventVerbosity = EventVerbosity.NONE,
+        max_events: Optional[int] = None,
     ) -> Dict[Text, Any]:
-        """Returns the current tracker state as an object."""
+        """Returns the current tracker state as an object.
+
+        Args:
+            event_verbosity: Which events to include.
+            max_events: If set, only the last `max_events` of these events are
+                included.
+        """
         _events = self._events_for_verbosity(event_verbosity)
+        if _events and max_events is not None:
+            _events = _events[max(len(_events) - max_events, 0) :]
         if _events:
             _events = [e.as_dict() for e in _events]
         latest_event_time = None
@@ -273,16 +349,66 @@ class DialogueStateTracker:
             }.items()
         )
 
-    def past_states(self, domain: Domain) -> List[State]:
+    def past_states(
+        self, domain: Domain, max_history: Optional[int] = None
+    ) -> List[State]:
         """Generate the past states of this tracker based on the history.
 
+        The states are cached and only updated with the events which were added
+        since the last call, unless these events revert previous events.
+
         Args:
             domain: a :class:`rasa.shared.core.domain.Domain`
+            max_history: if given, only the last `max_history` states are returned
 
         Returns:
             a list of states
         """
-        return domain.states_for_tracker_history(self)
+        cache = self._update_past_states_cache(domain)
+
+        states = cache.states
+        if max_history:
+            states = states[max(len(states) - max_history + 1, 0) :]
+        # callers might modify the states, hence they get copies of the cached ones
+        return [
+            {key: dict(sub_state) for key, sub_state in state.items()}
+            for state in states
+        ] + [domain.get_active_states(cache.prior_tracker)]
+
+    def _update_past_states_cache(self, domain: Domain) -> _PastStatesCache:
+        cache = self._past_states_cache
+        number_of_events = len(self.events)
+
+        if (
+            cache is None
+            or cache.domain is not domain
+            or number_of_events < cache.events_count
+            or (
+                cache.events_count
+                and self.events[cache.events_count - 1] is not cache.last_event
+            )
+        ):
+            # the cached states don't belong to the events of this tracker
+            return self._recreate_past_states_cache(domain)
+
+        for index in range(cache.events_count, number_of_events):
+            if not cache.apply_new_event(self.events[index], self):
+                return self._recreate_past_states_cache(domain)
+
+        cache.events_count = number_of_events
+        cache.last_event = self.events[-1] if number_of_events else None
+        return cache
+
+    def _recreate_past_states_cache(self, domain: Domain) -> _PastStatesCache:
+        # this mirrors `Domain.states_for_tracker_history`
+        cache = _PastStatesCache(self, domain)
+        for event in self.applied_events():
+            cache.apply(event)
+
+        cache.events_count = len(self.events)
+        cache.last_event = self.events[-1] if self.events else None
+        self._past_states_cache = cache
+        return cache
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
         """Set the currently active loop.
@@ -26,9 +26,24 @@ class NaturalLanguageInterpreter:
             "Interpreter needs to be able to parse messages into structured output."
         )
 
+    async def parse_batch(
+        self, texts: List[Text], metadata: Optional[Dict] = None
+    ) -> List[Dict[Text, Any]]:
+        """Parses multiple texts which share the same `metadata`.
+
+        Interpreters which are able to process several texts at once should override
+        this method, by default the texts are parsed one after the other.
+        """
+        return [await self.parse(text, metadata=metadata) for text in texts]
+
     def featurize_message(self, message: Message) -> Optional[Message]:
         pass
 
+    def warm_up(self) -> None:
+        """Runs a message through the model so that the first parse isn't slowed
+        down by building the model's prediction graphs."""
+        pass
+
 
 class RegexInterpreter(NaturalLanguageInterpreter):
     @staticmethod
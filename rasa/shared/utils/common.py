@@ -205,3 +205,13 @@ def arguments_of(func: Callable) -> List[Text]:
     import inspect
 
     return list(inspect.signature(func).parameters.keys())
+
+
+def accepts_keyword_arguments(func: Callable) -> bool:
+    """Checks if the function `func` accepts arbitrary keyword arguments."""
+    import inspect
+
+    return any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in inspect.signature(func).parameters.values()
+    )
@@ -1,6 +1,9 @@
 import asyncio
+import logging
+import multiprocessing
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import ExitStack
 from typing import (
     Text,
@@ -10,6 +13,8 @@ from typing import (
     List,
     Union,
     Dict,
+    Any,
+    TYPE_CHECKING,
 )
 
 import rasa.core.interpreter
@@ -36,8 +41,14 @@ from rasa.shared.constants import (
     DEFAULT_NLU_SUBDIRECTORY_NAME,
 )
 
+from rasa.constants import ENV_CPU_INTER_OP_CONFIG, ENV_CPU_INTRA_OP_CONFIG
 from rasa.core.agent import Agent
 
+if TYPE_CHECKING:
+    from rasa.shared.nlu.training_data.training_data import TrainingData
+
+logger = logging.getLogger(__name__)
+
 CODE_CORE_NEEDS_TO_BE_RETRAINED = 0b0001
 CODE_NLU_NEEDS_TO_BE_RETRAINED = 0b0010
 CODE_NLG_NEEDS_TO_BE_RETRAINED = 0b0100
@@ -794,8 +805,8 @@ async def _train_nlu_with_validated_data(
     """Train NLU with validated training and config data."""
     import rasa.nlu.train
 
-    if additional_arguments is None:
-        additional_arguments = {}
+    additional_arguments = dict(additional_arguments or {})
+    nlu_parallelism = additional_arguments.pop("nlu_parallelism", 1)
 
     with ExitStack() as stack:
         if train_path:
@@ -832,8 +843,30 @@ async def _train_nlu_with_validated_data(
             model_type="nlu",
             is_finetuning=model_to_finetune is not None,
         ):
+            languages_to_train = [lang for lang in config if config[lang]]
             for lang in config:
-                if config[lang]:
+                if not config[lang]:
+                    rasa.shared.utils.cli.print_color(
+                        f"NLU data for language <{lang}> didn't change, skipping training...",
+                        color=rasa.shared.utils.io.bcolors.OKBLUE,
+                    )
+
+            # fine-tuned models can't be passed to other processes
+            if (
+                nlu_parallelism > 1
+                and len(languages_to_train) > 1
+                and not model_to_finetune
+            ):
+                await _train_nlu_models_in_parallel(
+                    {lang: config[lang] for lang in languages_to_train},
+                    file_importer,
+                    _train_path,
+                    persist_nlu_training_data,
+                    additional_arguments,
+                    nlu_parallelism,
+                )
+            else:
+                for lang in languages_to_train:
                     rasa.shared.utils.cli.print_color(
                         "Start training <{}> NLU model ...".format(lang),
                         color=rasa.shared.utils.io.bcolors.OKBLUE,
@@ -847,11 +880,6 @@ async def _train_nlu_with_validated_data(
                         model_to_finetune=model_to_finetune,
                         **additional_arguments,
                     )
-                else:
-                    rasa.shared.utils.cli.print_color(
-                        f"NLU data for language <{lang}> didn't change, skipping training...",
-                        color=rasa.shared.utils.io.bcolors.OKBLUE,
-                    )
         # </ bf mod
         rasa.shared.utils.cli.print_color(
             "NLU model training completed.", color=rasa.shared.utils.io.bcolors.OKBLUE
@@ -872,6 +900,105 @@ async def _train_nlu_with_validated_data(
         return _train_path
 
 
+def _set_up_nlu_training_process(tensorflow_threads: int, log_level: int) -> None:
+    # thread limits which were configured explicitly take precedence
+    os.environ.setdefault(ENV_CPU_INTRA_OP_CONFIG, str(tensorflow_threads))
+    os.environ.setdefault(ENV_CPU_INTER_OP_CONFIG, "1")
+
+    from rasa.utils.tensorflow import environment
+
+    rasa.utils.common.set_log_level(log_level)
+    environment.setup_tf_environment()
+
+
+def _train_nlu_model_in_process(
+    nlu_config: Dict[Text, Any],
+    training_data: "TrainingData",
+    train_path: Text,
+    fixed_model_name: Text,
+    persist_nlu_training_data: bool,
+    additional_arguments: Dict[Text, Any],
+) -> Optional[Text]:
+    import rasa.nlu.train
+
+    _, _, persisted_path = rasa.utils.common.run_in_loop(
+        rasa.nlu.train(
+            nlu_config,
+            training_data,
+            train_path,
+            fixed_model_name=fixed_model_name,
+            persist_nlu_training_data=persist_nlu_training_data,
+            **additional_arguments,
+        )
+    )
+    return persisted_path
+
+
+async def _train_nlu_models_in_parallel(
+    configs: Dict[Text, Dict[Text, Any]],
+    file_importer: TrainingDataImporter,
+    train_path: Text,
+    persist_nlu_training_data: bool,
+    additional_arguments: Dict[Text, Any],
+    parallelism: int,
+) -> None:
+    """Trains the NLU models of several languages in separate processes.
+
+    Each model is persisted to `train_path` in the same way as when training the
+    models one after another. The CPU cores are split among the processes by
+    limiting the TensorFlow thread pools of every process.
+
+    Args:
+        configs: The NLU configurations by language.
+        file_importer: Importer to load the training data of each language with.
+        train_path: Directory to persist the trained models to.
+        persist_nlu_training_data: `True` if the NLU training data should be
+            persisted with the models.
+        additional_arguments: Additional training parameters.
+        parallelism: Maximum number of models which are trained at the same time.
+    """
+    import rasa.nlu.config
+
+    parallelism = min(parallelism, len(configs))
+    tensorflow_threads = max(1, (os.cpu_count() or 1) // parallelism)
+
+    # the training data is loaded here as importers can't be passed to other processes
+    training_data = {}
+    for lang, nlu_config in configs.items():
+        language = rasa.nlu.config.load(nlu_config).language
+        training_data[lang] = await file_importer.get_nlu_data(language)
+
+    rasa.shared.utils.cli.print_color(
+        f"Training the NLU models of {len(configs)} languages in {parallelism} "
+        f"processes ...",
+        color=rasa.shared.utils.io.bcolors.OKBLUE,
+    )
+    loop = asyncio.get_event_loop()
+    # TensorFlow can't be used in forked processes once it was initialized
+    with ProcessPoolExecutor(
+        max_workers=parallelism,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_set_up_nlu_training_process,
+        initargs=(tensorflow_threads, logging.getLogger("rasa").level),
+    ) as executor:
+        trainings = {
+            lang: loop.run_in_executor(
+                executor,
+                _train_nlu_model_in_process,
+                nlu_config,
+                training_data[lang],
+                train_path,
+                f"nlu-{lang}",
+                persist_nlu_training_data,
+                additional_arguments,
+            )
+            for lang, nlu_config in configs.items()
+        }
+        for lang, training in trainings.items():
+            await training
+            logger.debug(f"Finished training the <{lang}> NLU model.")
+
+
 async def _nlu_model_for_finetuning(
     model_to_finetune: Text,
     file_importer: TrainingDataImporter,
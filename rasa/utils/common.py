@@ -7,6 +7,7 @@ from types import TracebackType
 from typing import Any, Coroutine, Dict, List, Optional, Text, Type, TypeVar, Union
 
 import rasa.core.utils
+import rasa.utils.endpoints
 import rasa.utils.io
 from rasa.constants import DEFAULT_LOG_LEVEL_LIBRARIES, ENV_LOG_LEVEL_LIBRARIES
 from rasa.shared.constants import DEFAULT_LOG_LEVEL, ENV_LOG_LEVEL
@@ -305,11 +306,16 @@ def run_in_loop(
         except RuntimeError:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-    result = loop.run_until_complete(f)
+    # the connections to endpoints are kept alive until the awaitable is finished
+    rasa.utils.endpoints.enable_session_pooling(loop)
+    try:
+        result = loop.run_until_complete(f)
 
-    # Let's also finish all running tasks:
-    pending = asyncio.Task.all_tasks()
-    loop.run_until_complete(asyncio.gather(*pending))
+        # Let's also finish all running tasks:
+        pending = asyncio.Task.all_tasks()
+        loop.run_until_complete(asyncio.gather(*pending))
+    finally:
+        loop.run_until_complete(rasa.utils.endpoints.close_sessions())
 
     return result
 
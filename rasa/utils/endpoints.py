@@ -1,17 +1,36 @@
+import asyncio
+import weakref
+
 import aiohttp
 import logging
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from types import TracebackType
+from typing import Any, Optional, Text, Dict, Tuple, Type
 
 import rasa.shared.utils.io
 import rasa.utils.io
-from rasa.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.constants import (
+    DEFAULT_CONNECTION_POOL_SIZE,
+    DEFAULT_CONNECTION_POOL_SIZE_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# endpoints which hold pooled sessions by their id (endpoints aren't hashable)
+_endpoints_with_sessions: "weakref.WeakValueDictionary[int, EndpointConfig]" = (
+    weakref.WeakValueDictionary()
+)
+# event loops whose owner closes the pooled sessions with `close_sessions`
+_loops_with_pooled_sessions: "weakref.WeakSet[asyncio.AbstractEventLoop]" = (
+    weakref.WeakSet()
+)
+
 
 def read_endpoint_config(
     filename: Text, endpoint_type: Text
@@ -90,21 +109,111 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
+        # pooled sessions (and their event loop) by the id of their event loop
+        self._sessions: Dict[
+            int, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]
+        ] = {}
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # sessions are bound to the event loop of the process which created them
+        state = self.__dict__.copy()
+        state["_sessions"] = {}
+        return state
+
+    def _auth(self) -> Optional[aiohttp.BasicAuth]:
         # create authentication parameters
         if self.basic_auth:
-            auth = aiohttp.BasicAuth(
+            return aiohttp.BasicAuth(
                 self.basic_auth["username"], self.basic_auth["password"]
             )
-        else:
-            auth = None
+        return None
 
+    def session(self) -> aiohttp.ClientSession:
+        """Creates a new session, which the caller has to close."""
         return aiohttp.ClientSession(
             headers=self.headers,
-            auth=auth,
+            auth=self._auth(),
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
         )
 
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        async def on_connection_create_end(*_: Any) -> None:
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(*_: Any) -> None:
+            self.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def request_session(self) -> "_RequestSession":
+        """Returns the session to use for a request as an async context manager.
+
+        This is the pooled session if pooling is enabled for the running event loop
+        (see `enable_session_pooling`), otherwise a new session which is closed
+        when the context is left.
+        """
+        return _RequestSession(self)
+
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the long-lived session of the running event loop.
+
+        The session keeps connections to the endpoint alive and reuses them across
+        requests. Its connection pool is configured with the `pool_size`,
+        `pool_size_per_host`, `keepalive_timeout` and `dns_cache_ttl` keys of the
+        endpoint configuration. The session is closed by `close_sessions`.
+        """
+        loop = asyncio.get_event_loop()
+        session_loop, session = self._sessions.get(id(loop), (None, None))
+        if session_loop is loop and not session.closed:
+            return session
+
+        # sessions of closed event loops can't be used or closed anymore
+        self._sessions = {
+            loop_id: (session_loop, session)
+            for loop_id, (session_loop, session) in self._sessions.items()
+            if not session.closed and not session_loop.is_closed()
+        }
+
+        connector = aiohttp.TCPConnector(
+            limit=self.kwargs.get("pool_size", DEFAULT_CONNECTION_POOL_SIZE),
+            limit_per_host=self.kwargs.get(
+                "pool_size_per_host", DEFAULT_CONNECTION_POOL_SIZE_PER_HOST
+            ),
+            keepalive_timeout=self.kwargs.get(
+                "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            ttl_dns_cache=self.kwargs.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            auth=self._auth(),
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            trace_configs=[self._trace_config()],
+        )
+        self._sessions[id(loop)] = (loop, session)
+        _endpoints_with_sessions[id(self)] = self
+        return session
+
+    async def close_session(self) -> None:
+        """Closes the pooled session of the running event loop."""
+        loop = asyncio.get_event_loop()
+        session_loop, session = self._sessions.pop(id(loop), (None, None))
+        if session_loop is loop and not session.closed:
+            await session.close()
+
+    def stats(self) -> Dict[Text, int]:
+        """Returns how many connections were created and reused by the sessions."""
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+        }
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -142,7 +251,7 @@ class EndpointConfig:
             del kwargs["headers"]
 
         url = concat_url(self.url, subpath)
-        async with self.session() as session:
+        async with self.request_session() as session:
             async with session.request(
                 method,
                 url,
@@ -191,6 +300,65 @@ class EndpointConfig:
         return not self.__eq__(other)
 
 
+class _RequestSession:
+    """Provides the pooled session of an endpoint or a session for a single use."""
+
+    def __init__(self, endpoint: EndpointConfig) -> None:
+        self.endpoint = endpoint
+        self._single_use_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        if asyncio.get_event_loop() in _loops_with_pooled_sessions:
+            return self.endpoint.pooled_session()
+
+        self._single_use_session = self.endpoint.session()
+        return self._single_use_session
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._single_use_session is not None:
+            await self._single_use_session.close()
+            self._single_use_session = None
+
+
+def enable_session_pooling(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Lets endpoints keep their sessions open across requests on the event loop.
+
+    The owner of the event loop (e.g. the server) has to call `close_sessions`
+    before the loop ends. Without pooling, every request uses a session of its own.
+
+    Args:
+        loop: the event loop, by default the current one
+    """
+    _loops_with_pooled_sessions.add(loop or asyncio.get_event_loop())
+
+
+async def close_sessions() -> None:
+    """Closes the pooled sessions of all endpoints for the running event loop.
+
+    Pooling is disabled for the event loop until it's enabled again.
+    """
+    _loops_with_pooled_sessions.discard(asyncio.get_event_loop())
+    for endpoint in list(_endpoints_with_sessions.values()):
+        await endpoint.close_session()
+
+
+def session_stats() -> Dict[Text, Dict[Text, int]]:
+    """Returns the connection counters of the endpoints with pooled sessions by URL."""
+    stats = {}
+    for endpoint in list(_endpoints_with_sessions.values()):
+        url_stats = stats.setdefault(
+            endpoint.url, {"connections_created": 0, "connections_reused": 0}
+        )
+        for key, value in endpoint.stats().items():
+            url_stats[key] += value
+    return stats
+
+
 class ClientResponseError(aiohttp.ClientError):
     def __init__(self, status: int, message: Text, text: Text) -> None:
         self.status = status
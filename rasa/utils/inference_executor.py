@@ -0,0 +1,134 @@
+import asyncio
+import functools
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Text
+
+from rasa.constants import (
+    DEFAULT_INFERENCE_MAX_PENDING,
+    DEFAULT_INFERENCE_MAX_WORKERS,
+    ENV_INFERENCE_EXECUTOR,
+    ENV_INFERENCE_MAX_PENDING,
+    ENV_INFERENCE_MAX_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+INLINE_EXECUTOR = "inline"
+THREAD_EXECUTOR = "thread"
+
+_UNSET = object()
+_executor: Any = _UNSET
+
+
+class InferenceExecutor:
+    """Runs CPU-bound inference (NLU parsing, policy predictions) off the event loop.
+
+    Inference runs on a pool of threads, as TensorFlow releases the GIL during
+    model calls. At most `max_pending` inference calls are running or waiting for a
+    thread, further callers wait on the event loop until a slot is free.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_INFERENCE_MAX_WORKERS,
+        max_pending: int = DEFAULT_INFERENCE_MAX_PENDING,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference"
+        )
+        # semaphores are bound to the event loop they are used from
+        self._semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self.pending = 0
+        self.completed = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_pending)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Runs `function` on the thread pool and waits for its result."""
+        async with self._semaphore():
+            self.pending += 1
+            try:
+                return await asyncio.get_event_loop().run_in_executor(
+                    self._executor, functools.partial(function, *args, **kwargs)
+                )
+            finally:
+                self.pending -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict[Text, int]:
+        """Returns the counters of the executor."""
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+def _create_executor_from_environment() -> Optional[InferenceExecutor]:
+    mode = os.environ.get(ENV_INFERENCE_EXECUTOR, INLINE_EXECUTOR).lower()
+    if mode == INLINE_EXECUTOR:
+        return None
+    if mode != THREAD_EXECUTOR:
+        logger.warning(
+            f"Unknown inference executor '{mode}' set in '{ENV_INFERENCE_EXECUTOR}'. "
+            f"Valid values are '{INLINE_EXECUTOR}' and '{THREAD_EXECUTOR}'. "
+            f"Running inference on the event loop."
+        )
+        return None
+
+    executor = InferenceExecutor(
+        max_workers=int(
+            os.environ.get(ENV_INFERENCE_MAX_WORKERS, DEFAULT_INFERENCE_MAX_WORKERS)
+        ),
+        max_pending=int(
+            os.environ.get(ENV_INFERENCE_MAX_PENDING, DEFAULT_INFERENCE_MAX_PENDING)
+        ),
+    )
+    logger.debug(f"Running inference on a thread pool ({executor.stats()}).")
+    return executor
+
+
+def get_inference_executor() -> Optional[InferenceExecutor]:
+    """Returns the executor of the process or `None` if inference runs inline.
+
+    The executor is configured with the `INFERENCE_EXECUTOR`,
+    `INFERENCE_MAX_WORKERS` and `INFERENCE_MAX_PENDING` environment variables.
+    """
+    global _executor
+    if _executor is _UNSET:
+        _executor = _create_executor_from_environment()
+    return _executor
+
+
+def reset_inference_executor() -> None:
+    """Shuts down the executor, the next call creates it from the environment."""
+    global _executor
+    if isinstance(_executor, InferenceExecutor):
+        _executor.shutdown()
+    _executor = _UNSET
+
+
+async def run_inference(function: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Runs a blocking inference call using the executor of the process.
+
+    If no executor is configured, `function` is called directly.
+    """
+    executor = get_inference_executor()
+    if executor is None:
+        return function(*args, **kwargs)
+    return await executor.run(function, *args, **kwargs)
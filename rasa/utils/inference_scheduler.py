@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple
+
+from rasa.constants import (
+    DEFAULT_INFERENCE_MAX_BATCH_SIZE,
+    ENV_INFERENCE_BATCH_WINDOW_MS,
+    ENV_INFERENCE_MAX_BATCH_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# the worker thread of a scheduler stops after being idle for this long (in seconds),
+# so that schedulers of replaced models don't keep their thread (and model) alive
+WORKER_IDLE_TIMEOUT = 60
+
+_active_schedulers: "weakref.WeakSet[InferenceScheduler]" = weakref.WeakSet()
+
+
+class InferenceScheduler:
+    """Collects concurrent inference requests and runs them as a single batch.
+
+    Requests are collected until either `max_batch_size` requests are waiting or
+    `max_wait_ms` milliseconds passed since the first request of the batch arrived.
+    The batch is then passed to `batch_function` on a worker thread and every
+    caller receives the result at the position of its request.
+    """
+
+    def __init__(
+        self,
+        batch_function: Callable[[List[Any]], List[Any]],
+        max_wait_ms: float,
+        max_batch_size: int = DEFAULT_INFERENCE_MAX_BATCH_SIZE,
+        name: Text = "inference",
+    ) -> None:
+        self.batch_function = batch_function
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self.name = name
+
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.processed_requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+        _active_schedulers.add(self)
+
+    @classmethod
+    def from_environment(
+        cls, batch_function: Callable[[List[Any]], List[Any]], name: Text
+    ) -> Optional["InferenceScheduler"]:
+        """Creates a scheduler if micro-batching was enabled by the environment.
+
+        Micro-batching is enabled by setting `INFERENCE_BATCH_WINDOW_MS` to the
+        maximum time a request may wait for other requests of its batch.
+        """
+        max_wait_ms = float(os.environ.get(ENV_INFERENCE_BATCH_WINDOW_MS) or 0)
+        if max_wait_ms <= 0:
+            return None
+
+        max_batch_size = int(
+            os.environ.get(
+                ENV_INFERENCE_MAX_BATCH_SIZE, DEFAULT_INFERENCE_MAX_BATCH_SIZE
+            )
+        )
+        return cls(batch_function, max_wait_ms, max_batch_size, name)
+
+    def submit(self, item: Any) -> Future:
+        """Schedules `item` to be processed with the next batch.
+
+        Returns:
+            A future which resolves to the result for `item`.
+        """
+        future = Future()
+        with self._lock:
+            self.requests += 1
+            self._queue.put((item, future))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name=f"{self.name}-scheduler", daemon=True
+                )
+                self._worker.start()
+
+        return future
+
+    def predict(self, item: Any) -> Any:
+        """Processes `item` with the next batch and waits for its result."""
+        return self.submit(item).result()
+
+    async def predict_async(self, item: Any) -> Any:
+        """Processes `item` with the next batch without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(item))
+
+    def _next_batch(self) -> List[Tuple[Any, Future]]:
+        try:
+            batch = [self._queue.get(timeout=WORKER_IDLE_TIMEOUT)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                with self._lock:
+                    # requests might have been submitted while the worker timed out
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[Any, Future]]) -> None:
+        self.batches += 1
+        self.processed_requests += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        logger.debug(
+            f"Running a batch of {len(batch)} requests with the '{self.name}' "
+            f"scheduler ({self._queue.qsize()} requests are queued)."
+        )
+
+        try:
+            results = self.batch_function([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} results from the batch, "
+                    f"got {len(results)}."
+                )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def stats(self) -> Dict[Text, Any]:
+        """Returns the counters of the scheduler."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": (
+                self.processed_requests / self.batches if self.batches else 0
+            ),
+            "largest_batch": self.largest_batch,
+        }
+
+
+def scheduler_stats() -> Dict[Text, List[Dict[Text, Any]]]:
+    """Returns the counters of all schedulers in use, grouped by their name."""
+    stats = {}
+    for scheduler in list(_active_schedulers):
+        stats.setdefault(scheduler.name, []).append(scheduler.stats())
+    return stats
@@ -319,7 +319,7 @@ def entity_label_to_tags(
         predictions = model_predictions[f"e_{tag_spec.tag_name}_ids"].numpy()
         confidences = model_predictions[f"e_{tag_spec.tag_name}_scores"].numpy()
 
-        if not np.any(predictions):
+        if not np.any(predictions[prediction_index]):
             continue
 
         confidences = [float(c) for c in confidences[prediction_index]]
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRAPHQL_REQUEST_TIMEOUT = 10  # in seconds
+DEFAULT_GRAPHQL_MAX_CONNECTIONS = 100
+
+
+class GraphQLError(Exception):
+    """Raised when a GraphQL endpoint answers with errors."""
+
+    def __init__(self, errors: Any) -> None:
+        self.errors = errors
+        if isinstance(errors, list):
+            message = ", ".join(str(e.get("message", e)) for e in errors)
+        else:
+            message = str(errors)
+        super().__init__(message)
+
+
+class AsyncGraphQLClient:
+    """Sends GraphQL queries over a persistent pool of keep-alive connections.
+
+    The underlying `aiohttp` session is created lazily, as it has to be bound to the
+    event loop it's used from (e.g. the loop of a Sanic worker).
+    """
+
+    def __init__(
+        self,
+        url: Text,
+        headers: Optional[Dict[Text, Text]] = None,
+        timeout: float = DEFAULT_GRAPHQL_REQUEST_TIMEOUT,
+        max_connections: int = DEFAULT_GRAPHQL_MAX_CONNECTIONS,
+    ) -> None:
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_event_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+
+        return self._session
+
+    async def query(
+        self, query: Text, variables: Optional[Dict[Text, Any]] = None
+    ) -> Dict[Text, Any]:
+        """Sends a GraphQL query.
+
+        Args:
+            query: The GraphQL query or mutation.
+            variables: The variables of the query.
+
+        Returns:
+            The `data` of the response.
+
+        Raises:
+            GraphQLError: If the response contains errors.
+            aiohttp.ClientError: If the request failed.
+            asyncio.TimeoutError: If the request timed out.
+        """
+        data, errors = await self.query_with_errors(query, variables)
+        if errors:
+            raise GraphQLError(errors)
+
+        return data
+
+    async def query_with_errors(
+        self, query: Text, variables: Optional[Dict[Text, Any]] = None
+    ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
+        """Sends a GraphQL query and returns its partial data along with its errors.
+
+        Fields which failed are `null` in the data, the `path` of their errors
+        starts with their (aliased) name.
+
+        Args:
+            query: The GraphQL query or mutation.
+            variables: The variables of the query.
+
+        Returns:
+            The `data` and the `errors` of the response.
+
+        Raises:
+            GraphQLError: If the response isn't a GraphQL response.
+            aiohttp.ClientError: If the request failed.
+            asyncio.TimeoutError: If the request timed out.
+        """
+        async with self._get_session().post(
+            self.url, json={"query": query, "variables": variables or {}}
+        ) as response:
+            # GraphQL servers may answer with errors and an unsuccessful status code
+            if response.content_type != "application/json":
+                response.raise_for_status()
+            try:
+                content = await response.json(content_type=None)
+            except ValueError:
+                content = None
+            if not isinstance(content, dict):
+                raise GraphQLError(f"Unexpected response from '{self.url}'.")
+
+        return content.get("data") or {}, content.get("errors") or []
+
+    async def close(self) -> None:
+        """Closes the connections of the client."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
@@ -1,30 +1,162 @@
-from typing import Text, Dict, Any, Optional
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Text, Dict, Any, List, Optional, TYPE_CHECKING
 import rasa.core.interpreter
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
+from rasa_addons.core.lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    from rasa.nlu.components import ComponentBuilder
+
+logger = logging.getLogger(__name__)
+
+# maximum number of NLU models which are kept in memory (pinned languages included)
+ENV_MAX_LOADED_LANGUAGES = "NLU_MAX_LOADED_LANGUAGES"
+# comma separated languages which are loaded at startup and never unloaded
+ENV_PINNED_LANGUAGES = "NLU_PINNED_LANGUAGES"
 
 
 class MultilingualNLUInterpreter(NaturalLanguageInterpreter):
+    """Parses messages with the NLU model of their language.
+
+    The model of a language is loaded when the first message in this language
+    arrives. Concurrent first messages wait for the same load. At most
+    `max_loaded_languages` models are kept in memory, the least recently used model
+    is unloaded before another one is loaded. Models of `pinned_languages` are loaded
+    upfront (unless `lazy_init` is set) and are never unloaded; they count towards
+    `max_loaded_languages`, pinned languages beyond it are not pinned.
+    """
+
     def __init__(
         self,
         model_directory: Dict[Text, Optional[Text]],
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        component_builder: Optional["ComponentBuilder"] = None,
+        max_loaded_languages: Optional[int] = None,
+        pinned_languages: Optional[List[Text]] = None,
     ):
         self.lazy_init = lazy_init
         self.config_file = config_file
-        self.interpreters = {
-            lang: rasa.core.interpreter.create_interpreter(model_path)
-            for lang, model_path in model_directory.items()
-        }
+        self.model_directory = model_directory
+        self.component_builder = component_builder
 
-    async def parse(
-        self,
-        text: Text,
-        message_id: Optional[Text] = None,
-        tracker: DialogueStateTracker = None,
-        metadata: Optional[Dict] = None,
-    ) -> Dict[Text, Any]:
+        if max_loaded_languages is None and os.environ.get(ENV_MAX_LOADED_LANGUAGES):
+            max_loaded_languages = int(os.environ[ENV_MAX_LOADED_LANGUAGES])
+        if pinned_languages is None:
+            pinned_languages = [
+                lang.strip()
+                for lang in os.environ.get(ENV_PINNED_LANGUAGES, "").split(",")
+                if lang.strip()
+            ]
+
+        self.pinned_languages = [
+            lang for lang in pinned_languages if lang in model_directory
+        ]
+        if (
+            max_loaded_languages is not None
+            and len(self.pinned_languages) > max_loaded_languages
+        ):
+            logger.warning(
+                f"Only {max_loaded_languages} NLU model(s) may be loaded, the "
+                f"languages {self.pinned_languages[max_loaded_languages:]} are not "
+                f"pinned."
+            )
+            self.pinned_languages = self.pinned_languages[:max_loaded_languages]
+        self.max_loaded_languages = max_loaded_languages
+
+        max_unpinned_languages = None
+        if max_loaded_languages is not None:
+            max_unpinned_languages = max_loaded_languages - len(self.pinned_languages)
+            if max_unpinned_languages == 0:
+                logger.warning(
+                    "All NLU models which may be loaded are pinned, the models of "
+                    "other languages are loaded again for every message."
+                )
+        self._pinned: Dict[Text, NaturalLanguageInterpreter] = {}
+        self._loaded = LRUCache(max_entries=max_unpinned_languages)
+        self._loading: Dict[Text, Future] = {}
+        self._lock = threading.Lock()
+        # models are loaded one after another to avoid several loads at a time
+        # exceeding the memory the cap on loaded languages is meant to keep
+        self._loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="nlu-model-loader"
+        )
+
+        if not lazy_init:
+            for lang in self.pinned_languages:
+                self._pinned[lang] = self._create_interpreter(lang)
+
+    @property
+    def interpreters(self) -> Dict[Text, NaturalLanguageInterpreter]:
+        """The interpreters which are currently loaded, by language."""
+        loaded = dict(self._pinned)
+        for lang in self.model_directory:
+            interpreter = self._loaded.peek(lang)
+            if interpreter is not None:
+                loaded[lang] = interpreter
+        return loaded
+
+    def _create_interpreter(self, lang: Text) -> NaturalLanguageInterpreter:
+        logger.debug(f"Loading the NLU model for language '{lang}'.")
+        return rasa.core.interpreter.create_interpreter(
+            self.model_directory[lang], component_builder=self.component_builder
+        )
+
+    def _unload_least_recently_used(self) -> None:
+        # unload before loading another model, so that the loaded models never
+        # exceed `max_loaded_languages`
+        max_entries = self._loaded.max_entries
+        while (
+            max_entries is not None
+            and max_entries > 0
+            and len(self._loaded) >= max_entries
+        ):
+            lang, _ = self._loaded.popitem()
+            logger.debug(f"Unloading the NLU model for language '{lang}'.")
+
+    def _load(self, lang: Text) -> NaturalLanguageInterpreter:
+        try:
+            if lang not in self.pinned_languages:
+                self._unload_least_recently_used()
+            interpreter = self._create_interpreter(lang)
+            interpreter.warm_up()
+            if lang in self.pinned_languages:
+                self._pinned[lang] = interpreter
+            else:
+                self._loaded.set(lang, interpreter)
+            return interpreter
+        finally:
+            with self._lock:
+                del self._loading[lang]
+
+    def _loaded_interpreter(self, lang: Text) -> Optional[NaturalLanguageInterpreter]:
+        return self._pinned.get(lang) or self._loaded.get(lang)
+
+    async def load(self, lang: Text) -> NaturalLanguageInterpreter:
+        """Returns the interpreter of `lang` and loads its model if necessary."""
+        if lang not in self.model_directory:
+            raise Exception(f"No NLU model for language '{lang}'.")
+
+        interpreter = self._loaded_interpreter(lang)
+        if interpreter is not None:
+            return interpreter
+
+        with self._lock:
+            future = self._loading.get(lang)
+            if future is None:
+                future = self._loader.submit(self._load, lang)
+                self._loading[lang] = future
+
+        return await asyncio.wrap_future(future)
+
+    async def _get_interpreter(
+        self, tracker: Optional[DialogueStateTracker], metadata: Optional[Dict]
+    ) -> NaturalLanguageInterpreter:
         fallback_language_slot = (
             tracker.slots.get("fallback_language") if tracker else None
         )
@@ -34,5 +166,45 @@ class MultilingualNLUInterpreter(NaturalLanguageInterpreter):
         lang = (metadata or {}).get("language") or fallback_language
         if lang is None:
             raise Exception("No language specified.")
-        interpreter = self.interpreters.get(lang)
+        return await self.load(lang)
+
+    async def parse(
+        self,
+        text: Text,
+        message_id: Optional[Text] = None,
+        tracker: DialogueStateTracker = None,
+        metadata: Optional[Dict] = None,
+    ) -> Dict[Text, Any]:
+        interpreter = await self._get_interpreter(tracker, metadata)
         return await interpreter.parse(text)
+
+    async def parse_batch(
+        self, texts: List[Text], metadata: Optional[Dict] = None
+    ) -> List[Dict[Text, Any]]:
+        interpreter = await self._get_interpreter(None, metadata)
+        return await interpreter.parse_batch(texts)
+
+    def warm_up(self) -> None:
+        for interpreter in self.interpreters.values():
+            interpreter.warm_up()
+
+    def cache_stats(self) -> Dict[Text, Dict[Text, Any]]:
+        """Returns the counters of the component caches of the loaded models."""
+        stats = {}
+        for lang, interpreter in self.interpreters.items():
+            if callable(getattr(interpreter, "cache_stats", None)):
+                language_stats = interpreter.cache_stats()
+                if language_stats:
+                    stats[lang] = language_stats
+        return stats
+
+    def stats(self) -> Dict[Text, Any]:
+        """Returns the loaded languages and the counters of the loaded models."""
+        return {
+            "pinned_languages": list(self._pinned),
+            "loaded_languages": [
+                lang for lang in self.model_directory if lang in self._loaded
+            ],
+            "loading_languages": list(self._loading),
+            **self._loaded.stats(),
+        }
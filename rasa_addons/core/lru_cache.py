@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Text, Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe cache evicting the least recently used entries.
+
+    The cache is bounded by a number of entries and, if a `sizeof` function is
+    given, by the total size of its entries. Entries which weren't accessed for
+    longer than `ttl` seconds expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        # maps keys to `(value, size, last access time)`, least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return self.ttl is not None and now - last_access > self.ttl
+
+    def _remove(self, key: Hashable) -> Any:
+        value, size, _ = self._entries.pop(key)
+        self.bytes -= size
+        return value
+
+    def _evict(self, now: float) -> None:
+        # entries are ordered by their last access, hence expired entries come first
+        while self._entries:
+            key, (_, _, last_access) = next(iter(self._entries.items()))
+            if not (
+                self._is_expired(last_access, now)
+                or (self.max_entries is not None and len(self) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                return
+            self._remove(key)
+            self.evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value of `key` and marks it as recently used."""
+        with self._lock:
+            now = time.time()
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry[2], now):
+                self.misses += 1
+                self._evict(now)
+                return default
+
+            value, size, _ = entry
+            self._entries[key] = (value, size, now)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value of `key` without marking it as used or counting it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry[2], time.time()):
+                return default
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores `value` and evicts entries until the cache is within its bounds."""
+        size = self.sizeof(value) if self.sizeof else 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.time())
+            self.bytes += size
+            self._evict(time.time())
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes `key` from the cache and returns its value."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._remove(key)
+
+    def popitem(self) -> Tuple[Hashable, Any]:
+        """Evicts the least recently used entry and returns its key and value."""
+        with self._lock:
+            if not self._entries:
+                raise KeyError("popitem(): cache is empty")
+            key = next(iter(self._entries))
+            self.evictions += 1
+            return key, self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[Text, int]:
+        """Returns the counters of the cache."""
+        with self._lock:
+            return {
+                "entries": len(self),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
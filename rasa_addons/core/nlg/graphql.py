@@ -1,18 +1,37 @@
+import asyncio
+import copy
 import logging
-from typing import Text, Any, Dict, Optional, List
+import time
+from typing import Text, Any, Dict, Optional, List, Tuple
+
+import aiohttp
+
+import rasa.shared.utils.io
+from rasa_addons.core.graphql_client import (
+    DEFAULT_GRAPHQL_MAX_CONNECTIONS,
+    DEFAULT_GRAPHQL_REQUEST_TIMEOUT,
+    AsyncGraphQLClient,
+    GraphQLError,
+)
+from rasa_addons.core.lru_cache import LRUCache
 from rasa_addons.core.nlg.nlg_helper import rewrite_url
 from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.nlg.generator import NaturalLanguageGenerator
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.utils.endpoints import EndpointConfig
 import os
-import urllib.error
 from rasa.core.nlg.interpolator import interpolate
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_NLG_CACHE_TTL = 60  # in seconds
+
+# the tracker is sent with all its events
+FULL_TRACKER_PAYLOAD = "full"
+# only the slots and the latest message of the tracker are sent
+COMPACT_TRACKER_PAYLOAD = "compact"
 
-NLG_QUERY = """
+CAROUSEL_ELEMENT_FRAGMENT = """
 fragment CarouselElementFields on CarouselElement {
     title
     subtitle
@@ -20,6 +39,21 @@ fragment CarouselElementFields on CarouselElement {
     default_action { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } }
     buttons { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } }
 }
+"""
+
+RESPONSE_FIELDS = """
+        metadata
+        ...on TextPayload { text }
+        ...on QuickRepliesPayload { text, quick_replies { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } } }
+        ...on TextWithButtonsPayload { text, buttons { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } } }
+        ...on ImagePayload { text, image }
+        ...on CarouselPayload { template_type, elements { ...CarouselElementFields } }
+        ...on CustomPayload { customText: text, customImage: image, customQuickReplies: quick_replies, customButtons: buttons, customElements: elements, custom, customAttachment: attachment }
+"""
+
+NLG_QUERY = (
+    CAROUSEL_ELEMENT_FRAGMENT
+    + """
 query(
     $template: String!
     $arguments: Any
@@ -31,17 +65,48 @@ query(
         arguments: $arguments
         tracker: $tracker
         channel: $channel
-    ) {
-        metadata
-        ...on TextPayload { text }
-        ...on QuickRepliesPayload { text, quick_replies { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } } }
-        ...on TextWithButtonsPayload { text, buttons { title, type, ...on WebUrlButton { url }, ...on PostbackButton { payload } } }
-        ...on ImagePayload { text, image }
-        ...on CarouselPayload { template_type, elements { ...CarouselElementFields } }
-        ...on CustomPayload { customText: text, customImage: image, customQuickReplies: quick_replies, customButtons: buttons, customElements: elements, custom, customAttachment: attachment }
-    }
+    ) {"""
+    + RESPONSE_FIELDS
+    + """    }
 }
 """
+)
+
+KEYS_TO_INTERPOLATE = [
+    "text",
+    "image",
+    "custom",
+    "buttons",
+    "attachment",
+    "quick_replies",
+]
+
+
+def nlg_batch_query(size: int) -> Text:
+    """Query for `size` templates, their responses are aliased `r0`, `r1`, ..."""
+    variables = "".join(
+        f"    $template{i}: String!\n    $arguments{i}: Any\n" for i in range(size)
+    )
+    responses = "".join(
+        f"""
+    r{i}: getResponse(
+        template: $template{i}
+        arguments: $arguments{i}
+        tracker: $tracker
+        channel: $channel
+    ) {{{RESPONSE_FIELDS}    }}"""
+        for i in range(size)
+    )
+    return (
+        CAROUSEL_ELEMENT_FRAGMENT
+        + f"""
+query(
+{variables}    $tracker: ConversationInput
+    $channel: NlgRequestChannel
+) {{{responses}
+}}
+"""
+    )
 
 
 def nlg_response_format_spec():
@@ -84,6 +149,18 @@ def nlg_request_format_spec():
     }
 
 
+def tracker_payload(
+    tracker: DialogueStateTracker, payload: Text = FULL_TRACKER_PAYLOAD
+) -> Dict[Text, Any]:
+    """Returns the state of the tracker which is sent to the NLG endpoint."""
+    if payload == COMPACT_TRACKER_PAYLOAD:
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        return {
+            key: tracker_state[key] for key in ["sender_id", "slots", "latest_message"]
+        }
+    return tracker.current_state(EventVerbosity.ALL)
+
+
 def nlg_request_format(
     template_name: Text,
     tracker: DialogueStateTracker,
@@ -92,7 +169,7 @@ def nlg_request_format(
 ) -> Dict[Text, Any]:
     """Create the json body for the NLG json body for the request."""
 
-    tracker_state = tracker.current_state(EventVerbosity.ALL)
+    tracker_state = tracker_payload(tracker)
 
     return {
         "template": template_name,
@@ -103,36 +180,245 @@ def nlg_request_format(
 
 
 class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
-    """Like Rasa's CallbackNLG, but queries Botfront's GraphQL endpoint"""
+    """Like Rasa's CallbackNLG, but queries Botfront's GraphQL endpoint.
+
+    The templates of a batch are rendered with a single query. If `cache_size` is
+    set in the endpoint configuration, the responses are cached for `cache_ttl`
+    seconds before they are interpolated with the slot values. The cache key
+    contains the template, its arguments, the language, the output channel and the
+    values of the `conditional_slots` (all slots if not set), as they select the
+    variation of a response. `tracker_payload: compact` only sends the slots and
+    the latest message of the tracker instead of all its events.
+    """
 
     def __init__(self, **kwargs) -> None:
         self.nlg_endpoint = kwargs.get("endpoint_config")
         self.url_substitution_patterns = []
+        self.tracker_payload = FULL_TRACKER_PAYLOAD
+        self.conditional_slots = None
+        self.cache = None
+        self.cache_ttl = DEFAULT_NLG_CACHE_TTL
+        self.graphql_client = None
         if self.nlg_endpoint:
-            self.url_substitution_patterns = (
-                self.nlg_endpoint.kwargs.get("url_substitutions") or []
+            config = self.nlg_endpoint.kwargs
+            self.url_substitution_patterns = config.get("url_substitutions") or []
+            self.tracker_payload = config.get("tracker_payload", FULL_TRACKER_PAYLOAD)
+            self.conditional_slots = config.get("conditional_slots")
+            if config.get("cache_size"):
+                self.cache = LRUCache(max_entries=config["cache_size"])
+            self.cache_ttl = config.get("cache_ttl", DEFAULT_NLG_CACHE_TTL)
+
+            if "graphql" in self.nlg_endpoint.url:
+                api_key = os.environ.get("API_KEY")
+                self.graphql_client = AsyncGraphQLClient(
+                    self.nlg_endpoint.url,
+                    {"Authorization": api_key} if api_key else None,
+                    timeout=config.get(
+                        "request_timeout", DEFAULT_GRAPHQL_REQUEST_TIMEOUT
+                    ),
+                    max_connections=config.get(
+                        "max_connections", DEFAULT_GRAPHQL_MAX_CONNECTIONS
+                    ),
+                )
+
+    @staticmethod
+    def _language(tracker: DialogueStateTracker) -> Optional[Text]:
+        fallback_language_slot = tracker.slots.get("fallback_language")
+        fallback_language = (
+            fallback_language_slot.initial_value if fallback_language_slot else None
+        )
+        return tracker.latest_message.metadata.get("language") or fallback_language
+
+    def _cache_key(
+        self,
+        template_name: Text,
+        arguments: Dict[Text, Any],
+        tracker: DialogueStateTracker,
+        output_channel: Text,
+        language: Optional[Text],
+    ) -> Tuple[Text, ...]:
+        slot_values = tracker.current_slot_values()
+        if self.conditional_slots is not None:
+            slot_values = {
+                slot: slot_values.get(slot) for slot in self.conditional_slots
+            }
+        fingerprint = rasa.shared.utils.io.get_dictionary_fingerprint(
+            {"arguments": arguments, "slots": slot_values}
+        )
+        return template_name, str(language), output_channel, fingerprint
+
+    def _cached_response(self, key: Tuple[Text, ...]) -> Optional[Dict[Text, Any]]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        rendered_at, response = cached
+        if time.time() - rendered_at > self.cache_ttl:
+            # the response might have been edited in the meantime
+            self.cache.pop(key)
+            return None
+        return response
+
+    def cache_stats(self) -> Dict[Text, Any]:
+        """Returns the counters and the hit rate of the response cache."""
+        if self.cache is None:
+            return {}
+        stats = self.cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _format_response(
+        self, response: Optional[Dict[Text, Any]], template_name: Text
+    ) -> Dict[Text, Any]:
+        response = response or {}
+        rewrite_url(response, self.url_substitution_patterns)
+        if "customText" in response:
+            response["text"] = response.pop("customText")
+        if "customImage" in response:
+            response["image"] = response.pop("customImage")
+        if "customQuickReplies" in response:
+            response["quick_replies"] = response.pop("customQuickReplies")
+        if "customButtons" in response:
+            response["buttons"] = response.pop("customButtons")
+        if "customElements" in response:
+            response["elements"] = response.pop("customElements")
+        if "customAttachment" in response:
+            response["attachment"] = response.pop("customAttachment")
+        metadata = response.pop("metadata", {}) or {}
+        for key in metadata:
+            response[key] = metadata[key]
+        response["template_name"] = template_name
+        return response
+
+    async def _query_responses(
+        self,
+        requests: List[Tuple[Text, Dict[Text, Any]]],
+        tracker: DialogueStateTracker,
+        output_channel: Text,
+    ) -> List[Optional[Dict[Text, Any]]]:
+        """Renders the templates with a single query.
+
+        Returns:
+            The responses in the order of the `requests`, `None` for the templates
+            which failed to render.
+
+        Raises:
+            GraphQLError: If the query failed as a whole.
+        """
+        variables = {
+            "tracker": tracker_payload(tracker, self.tracker_payload),
+            "channel": {"name": output_channel},
+        }
+        for i, (template_name, arguments) in enumerate(requests):
+            variables[f"template{i}"] = template_name
+            variables[f"arguments{i}"] = arguments
+
+        logger.debug(
+            f"Requesting NLG for {[template for template, _ in requests]} "
+            f"from {self.nlg_endpoint.url}."
+        )
+        data, errors = await self.graphql_client.query_with_errors(
+            nlg_batch_query(len(requests)), variables
+        )
+
+        # the path of an error starts with the alias of the response which failed
+        failed = set()
+        for error in errors:
+            path = error.get("path") or [None]
+            alias = path[0]
+            if not (
+                isinstance(alias, str) and alias[:1] == "r" and alias[1:].isdigit()
+            ):
+                raise GraphQLError(errors)
+            failed.add(int(alias[1:]))
+        if errors:
+            logger.error(
+                f"NLG web endpoint at {self.nlg_endpoint.url} returned errors: "
+                f"{GraphQLError(errors)}"
             )
 
+        return [
+            None if i in failed else self._format_response(data.get(f"r{i}"), template)
+            for i, (template, _) in enumerate(requests)
+        ]
+
+    async def generate_batch(
+        self,
+        requests: List[Tuple[Text, Dict[Text, Any]]],
+        tracker: DialogueStateTracker,
+        output_channel: Text,
+    ) -> List[Optional[Dict[Text, Any]]]:
+        if self.graphql_client is None:
+            # legacy route
+            return await super().generate_batch(requests, tracker, output_channel)
+
+        language = self._language(tracker)
+        project_id = os.environ.get("BF_PROJECT_ID")
+        keys = [
+            self._cache_key(template_name, kwargs, tracker, output_channel, language)
+            for template_name, kwargs in requests
+        ]
+        responses = [self._cached_response(key) for key in keys]
+
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            arguments = {"language": language, "projectId": project_id}
+            try:
+                rendered = await self._query_responses(
+                    [
+                        (requests[i][0], {**requests[i][1], **arguments})
+                        for i in missing
+                    ],
+                    tracker,
+                    output_channel,
+                )
+            except (GraphQLError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(
+                    f"NLG web endpoint at {self.nlg_endpoint.url} returned errors: "
+                    f"{e or e.__class__.__name__}"
+                )
+                rendered = [None] * len(missing)
+
+            for i, response in zip(missing, rendered):
+                if response is None:
+                    responses[i] = {"text": requests[i][0]}
+                    continue
+                if self.validate_response(response) and self.cache is not None:
+                    self.cache.set(keys[i], (time.time(), response))
+                responses[i] = response
+
+        slot_values = tracker.current_slot_values()
+        interpolated = []
+        for response in responses:
+            # the cached responses are shared, interpolation modifies them in place
+            response = copy.deepcopy(response)
+            for key in KEYS_TO_INTERPOLATE:
+                if key in response:
+                    response[key] = interpolate(response[key], slot_values)
+            interpolated.append(response)
+        return interpolated
+
     async def generate(
         self,
         template_name: Text,
         tracker: DialogueStateTracker,
         output_channel: Text,
         **kwargs: Any,
-    ) -> List[Dict[Text, Any]]:
-
-        fallback_language_slot = tracker.slots.get("fallback_language")
-        fallback_language = (
-            fallback_language_slot.initial_value if fallback_language_slot else None
-        )
-        language = tracker.latest_message.metadata.get("language") or fallback_language
+    ) -> Optional[Dict[Text, Any]]:
+        if self.graphql_client is not None:
+            responses = await self.generate_batch(
+                [(template_name, kwargs)], tracker, output_channel
+            )
+            return responses[0]
 
         body = nlg_request_format(
             template_name,
             tracker,
             output_channel,
             **kwargs,
-            language=language,
+            language=self._language(tracker),
             projectId=os.environ.get("BF_PROJECT_ID"),
         )
 
@@ -141,62 +427,10 @@ class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
             "".format(template_name, self.nlg_endpoint.url)
         )
 
-        try:
-            if "graphql" in self.nlg_endpoint.url:
-                from sgqlc.endpoint.http import HTTPEndpoint
-
-                logging.getLogger("sgqlc.endpoint.http").setLevel(logging.WARNING)
-
-                api_key = os.environ.get("API_KEY")
-                headers = [{"Authorization": api_key}] if api_key else []
-                response = HTTPEndpoint(self.nlg_endpoint.url, *headers)(
-                    NLG_QUERY, body
-                )
-                if response.get("errors"):
-                    raise urllib.error.URLError(
-                        ", ".join([e.get("message") for e in response.get("errors")])
-                    )
-                response = response.get("data", {}).get("getResponse", {})
-                rewrite_url(response, self.url_substitution_patterns)
-                if "customText" in response:
-                    response["text"] = response.pop("customText")
-                if "customImage" in response:
-                    response["image"] = response.pop("customImage")
-                if "customQuickReplies" in response:
-                    response["quick_replies"] = response.pop("customQuickReplies")
-                if "customButtons" in response:
-                    response["buttons"] = response.pop("customButtons")
-                if "customElements" in response:
-                    response["elements"] = response.pop("customElements")
-                if "customAttachment" in response:
-                    response["attachment"] = response.pop("customAttachment")
-                metadata = response.pop("metadata", {}) or {}
-                for key in metadata:
-                    response[key] = metadata[key]
-                response["template_name"] = template_name
-
-                keys_to_interpolate = [
-                    "text",
-                    "image",
-                    "custom",
-                    "buttons",
-                    "attachment",
-                    "quick_replies",
-                ]
-                for key in keys_to_interpolate:
-                    if key in response:
-                        response[key] = interpolate(response[key], tracker.current_slot_values())
-            else:
-                response = await self.nlg_endpoint.request(
-                    method="post", json=body, timeout=DEFAULT_REQUEST_TIMEOUT
-                )
-                response = response[0]  # legacy route, use first message in seq
-        except urllib.error.URLError as e:
-            message = e.reason
-            logger.error(
-                f"NLG web endpoint at {self.nlg_endpoint.url} returned errors: {message}"
-            )
-            return {"text": template_name}
+        response = await self.nlg_endpoint.request(
+            method="post", json=body, timeout=DEFAULT_REQUEST_TIMEOUT
+        )
+        response = response[0]  # legacy route, use first message in seq
 
         if self.validate_response(response):
             return response
@@ -206,6 +440,11 @@ class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
             )
             return {"text": template_name}
 
+    async def close(self) -> None:
+        """Closes the connections to the GraphQL endpoint."""
+        if self.graphql_client is not None:
+            await self.graphql_client.close()
+
     @staticmethod
     def validate_response(content: Optional[Dict[Text, Any]]) -> bool:
         """Validate the NLG response. Raises exception on failure."""
@@ -1,13 +1,24 @@
+import asyncio
+import json
 import logging
 import jsonpickle
 import requests
-import time
 import os
 import re
-from threading import Thread
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+import aiohttp
 
 from rasa.core.tracker_store import TrackerStore
+from rasa.shared.core.events import SessionStarted
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+from rasa_addons.core.lru_cache import LRUCache
+from rasa_addons.core.graphql_client import (
+    AsyncGraphQLClient,
+    GraphQLError,
+    DEFAULT_GRAPHQL_MAX_CONNECTIONS,
+    DEFAULT_GRAPHQL_REQUEST_TIMEOUT,
+)
 
 from sgqlc.endpoint.http import HTTPEndpoint
 import urllib.error
@@ -61,13 +72,19 @@ mutation updateTracker(
 }
 """
 
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _size_of_cached_tracker(cached_tracker: Dict[Text, Any]) -> int:
+    return len(json.dumps(cached_tracker["events"], ensure_ascii=False))
 
-def _start_sweeper(tracker_store, break_time):
-    while True:
-        try:
-            tracker_store.sweep()
-        finally:
-            time.sleep(break_time)
+
+def _events_since_latest_session_start(events: List[Dict]) -> List[Dict]:
+    for index in range(len(events) - 1, -1, -1):
+        if events[index].get("event") == SessionStarted.type_name:
+            return events[index:]
+    return events
 
 
 class BotfrontTrackerStore(TrackerStore):
@@ -77,17 +94,32 @@ class BotfrontTrackerStore(TrackerStore):
         self.tracker_persist_time = kwargs.get("tracker_persist_time", 3600)
         self.test_tracker_persist_time = kwargs.get("test_tracker_persist_time", 240)
         self.max_events = kwargs.get("max_events", 100)
-        self.trackers = {}
-        self.test_trackers = {}
-        self.trackers_info = (
-            {}
-        )  # in this stucture we will keep the last index and the last timestamp of events in the db for a said tracker
-        self.sweeper = Thread(target=_start_sweeper, args=(self, 30))
-        self.sweeper.setDaemon(True)
-        self.sweeper.start()
+        max_cached_trackers = kwargs.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)
+        # in this structure we keep the events of the latest session of a tracker
+        # together with the last index and the last timestamp of events in the db
+        self.trackers = LRUCache(
+            max_entries=max_cached_trackers,
+            max_bytes=kwargs.get("cache_max_bytes", DEFAULT_CACHE_MAX_BYTES),
+            ttl=self.tracker_persist_time,
+            sizeof=_size_of_cached_tracker,
+        )
+        self.test_trackers = LRUCache(
+            max_entries=max_cached_trackers, ttl=self.test_tracker_persist_time
+        )
         api_key = os.environ.get("API_KEY")
         headers = [{"Authorization": api_key}] if api_key else []
         self.graphql_endpoint = HTTPEndpoint(host, *headers)
+        self.graphql_client = AsyncGraphQLClient(
+            host,
+            {"Authorization": api_key} if api_key else None,
+            timeout=kwargs.get("request_timeout", DEFAULT_GRAPHQL_REQUEST_TIMEOUT),
+            max_connections=kwargs.get(
+                "max_connections", DEFAULT_GRAPHQL_MAX_CONNECTIONS
+            ),
+        )
+        # saves which weren't sent to Botfront yet and the tasks sending them
+        self._pending_saves: Dict[Text, Tuple[Dict[Text, Any], bool]] = {}
+        self._flush_tasks: Dict[Text, asyncio.Task] = {}
         self.host = host
         self.environement = os.environ.get("BOTFRONT_ENV", "development")
         self.botfront_test_regex = re.compile('^bot_regression_test_')
@@ -110,109 +142,217 @@ class BotfrontTrackerStore(TrackerStore):
             )
             return {}
 
+    async def _graphql_query_async(self, query, params):
+        try:
+            return await self.graphql_client.query(query, params)
+        except (GraphQLError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(
+                f"Something went wrong getting the tracker from {self.host}: "
+                f"{e or e.__class__.__name__}"
+            )
+            return {}
+
+    def _fetch_tracker_params(self, sender_id, lastIndex):
+        return {
+            "senderId": sender_id,
+            "projectId": self.project_id,
+            "after": lastIndex,
+            "maxEvents": self.max_events,
+        }
+
+    def _write_tracker_params(self, sender_id, tracker):
+        return {
+            "senderId": sender_id,
+            "projectId": self.project_id,
+            "tracker": tracker,
+            "env": self.environement,
+        }
+
     def _fetch_tracker(self, sender_id, lastIndex):
         data = self._graphql_query(
-            GET_TRACKER,
-            {
-                "senderId": sender_id,
-                "projectId": self.project_id,
-                "after": lastIndex,
-                "maxEvents": self.max_events,
-            },
+            GET_TRACKER, self._fetch_tracker_params(sender_id, lastIndex)
         )
         return data.get("trackerStore")
 
     def _insert_tracker_gql(self, sender_id, tracker):
         data = self._graphql_query(
-            INSERT_TRACKER,
-            {
-                "senderId": sender_id,
-                "projectId": self.project_id,
-                "tracker": tracker,
-                "env": self.environement,
-            },
+            INSERT_TRACKER, self._write_tracker_params(sender_id, tracker)
         )
         return data.get("insertTrackerStore")
 
     def _update_tracker_gql(self, sender_id, tracker):
         data = self._graphql_query(
-            UPDATE_TRACKER,
-            {
-                "senderId": sender_id,
-                "projectId": self.project_id,
-                "tracker": tracker,
-                "env": self.environement,
-            },
+            UPDATE_TRACKER, self._write_tracker_params(sender_id, tracker)
+        )
+        return data.get("updateTrackerStore")
+
+    async def _fetch_tracker_async(self, sender_id, lastIndex):
+        data = await self._graphql_query_async(
+            GET_TRACKER, self._fetch_tracker_params(sender_id, lastIndex)
+        )
+        return data.get("trackerStore")
+
+    async def _insert_tracker_gql_async(self, sender_id, tracker):
+        data = await self._graphql_query_async(
+            INSERT_TRACKER, self._write_tracker_params(sender_id, tracker)
+        )
+        return data.get("insertTrackerStore")
+
+    async def _update_tracker_gql_async(self, sender_id, tracker):
+        data = await self._graphql_query_async(
+            UPDATE_TRACKER, self._write_tracker_params(sender_id, tracker)
         )
         return data.get("updateTrackerStore")
 
     def _get_last_index(self, sender_id):
-        info = self.trackers_info.get(sender_id, -1)
-        if info == -1:
-            return info
-        elif info.get("last_index") is None:
+        cached_tracker = self.trackers.peek(sender_id, {})
+        if cached_tracker.get("last_index") is None:
             return -1
         else:
-            return info.get("last_index")
+            return cached_tracker.get("last_index")
 
     def _get_last_timestamp(self, sender_id):
-        info = self.trackers_info.get(sender_id, 0)
-        if info == 0:
-            return info
-        elif info.get("last_timestamp") is None:
+        cached_tracker = self.trackers.peek(sender_id, {})
+        if cached_tracker.get("last_timestamp") is None:
             return 0
         else:
-            return info.get("last_timestamp")
+            return cached_tracker.get("last_timestamp")
 
-    def _store_tracker_info(self, sender_id, tracker_info):
+    def _cache_tracker(self, sender_id, events, tracker_info=None):
+        """Stores the events of the latest session of a tracker in the local cache.
+
+        The last index and the last timestamp of the cached tracker are kept unless
+        `tracker_info` is given. Returns the cached events.
+        """
+        cached_tracker = self.trackers.peek(sender_id, {})
         if tracker_info is not None:
-            self.trackers_info[sender_id] = {
-                "last_index": tracker_info["lastIndex"],
-                "last_timestamp": tracker_info["lastTimestamp"],
-            }
+            last_index = tracker_info["lastIndex"]
+            last_timestamp = tracker_info["lastTimestamp"]
+        else:
+            last_index = cached_tracker.get("last_index")
+            last_timestamp = cached_tracker.get("last_timestamp")
+        events = _events_since_latest_session_start(events)
+        self.trackers.set(
+            sender_id,
+            {
+                "events": events,
+                "last_index": last_index,
+                "last_timestamp": last_timestamp,
+            },
+        )
+        return events
+
+    def _store_tracker_info(self, sender_id, tracker_info):
+        cached_tracker = self.trackers.peek(sender_id)
+        # the tracker might have been evicted in the meantime, in this case it is
+        # fetched again from Botfront
+        if tracker_info is not None and cached_tracker is not None:
+            self._cache_tracker(sender_id, cached_tracker["events"], tracker_info)
 
     def save(self, canonical_tracker):
         serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
         sender_id = canonical_tracker.sender_id
         if self.botfront_test_regex.match(sender_id):
-            self.test_trackers[sender_id] = canonical_tracker
+            self.test_trackers.set(sender_id, canonical_tracker)
             return serialized_tracker["events"]
         # call the event broker below the test exit so that the logs aren't filled with testing data
         if self.event_broker:
             self.stream_events(canonical_tracker)
+        canonical_tracker.persisted_events_count = len(canonical_tracker.events)
 
         # Fetch here just in case retrieve wasn't called first
         tracker = self.trackers.get(sender_id)
 
         if tracker is None:  # the tracker does not exist localy ( first save)
             updated_info = self._insert_tracker_gql(sender_id, serialized_tracker)
-            self.trackers[sender_id] = serialized_tracker
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            return serialized_tracker["events"]
         else:  # the tracker  exist localy
-            # Insert only the new examples
-            last_timestamp = self._get_last_timestamp(sender_id)
-            new_events = list(
-                filter(
-                    lambda x: x["timestamp"] > last_timestamp,
-                    serialized_tracker["events"],
-                )
-            )
-            tracker_shallow_copy = {key: val for key, val in serialized_tracker.items()}
-            tracker_shallow_copy["events"] = new_events
             # only send the new events to the remote tracker
-            updated_info = self._update_tracker_gql(sender_id, tracker_shallow_copy)
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            self.trackers[sender_id] = serialized_tracker
-            return serialized_tracker["events"]
+            updated_info = self._update_tracker_gql(
+                sender_id, self._tracker_with_new_events(sender_id, serialized_tracker)
+            )
+        # update the last index and last time stamp for future uses
+        self._cache_tracker(sender_id, serialized_tracker["events"], updated_info)
+        return serialized_tracker["events"]
+
+    def _tracker_with_new_events(self, sender_id, serialized_tracker):
+        """Returns a copy of the serialized tracker without the events in Botfront."""
+        last_timestamp = self._get_last_timestamp(sender_id)
+        new_events = list(
+            filter(
+                lambda x: x["timestamp"] > last_timestamp,
+                serialized_tracker["events"],
+            )
+        )
+        tracker_shallow_copy = {key: val for key, val in serialized_tracker.items()}
+        tracker_shallow_copy["events"] = new_events
+        return tracker_shallow_copy
+
+    async def save_async(self, canonical_tracker: DialogueStateTracker) -> None:
+        """Saves the tracker locally and queues sending it to Botfront.
+
+        Saves are sent in the background one after the other for each conversation.
+        Saves which are queued while another save of the same conversation is in
+        flight are coalesced into a single request.
+        """
+        serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
+        sender_id = canonical_tracker.sender_id
+        if self.botfront_test_regex.match(sender_id):
+            self.test_trackers.set(sender_id, canonical_tracker)
+            return
+        # call the event broker below the test exit so that the logs aren't filled with testing data
+        if self.event_broker:
+            self.stream_events(canonical_tracker)
+        canonical_tracker.persisted_events_count = len(canonical_tracker.events)
 
-    def _convert_tracker(self, sender_id, tracker):
+        # the tracker has to be inserted if it neither exists locally nor is
+        # waiting to be inserted
+        pending = self._pending_saves.get(sender_id)
+        insert = self.trackers.get(sender_id) is None or (
+            pending is not None and pending[1]
+        )
+        self._pending_saves[sender_id] = (serialized_tracker, insert)
+        self._cache_tracker(sender_id, serialized_tracker["events"])
+
+        if sender_id not in self._flush_tasks:
+            self._flush_tasks[sender_id] = asyncio.ensure_future(
+                self._flush_pending_saves(sender_id)
+            )
+
+    async def _flush_pending_saves(self, sender_id: Text) -> None:
+        """Sends the pending saves of a conversation to Botfront."""
+        try:
+            while sender_id in self._pending_saves:
+                serialized_tracker, insert = self._pending_saves.pop(sender_id)
+                if insert:
+                    updated_info = await self._insert_tracker_gql_async(
+                        sender_id, serialized_tracker
+                    )
+                else:
+                    updated_info = await self._update_tracker_gql_async(
+                        sender_id,
+                        self._tracker_with_new_events(sender_id, serialized_tracker),
+                    )
+                # update the last index and last time stamp for future uses
+                self._store_tracker_info(sender_id, updated_info)
+        except Exception as e:
+            logger.error(
+                f"Could not save the tracker of '{sender_id}' to Botfront: {e}"
+            )
+        finally:
+            self._flush_tasks.pop(sender_id, None)
+
+    async def _wait_for_pending_saves(self, sender_id: Text) -> None:
+        flush_task = self._flush_tasks.get(sender_id)
+        if flush_task is not None:
+            await asyncio.shield(flush_task)
+
+    def _convert_tracker(self, sender_id, events):
         if self.domain:
-            return DialogueStateTracker.from_dict(
-                sender_id, tracker["events"], self.domain.slots
+            canonical_tracker = DialogueStateTracker.from_dict(
+                sender_id, events, self.domain.slots
             )
+            canonical_tracker.persisted_events_count = len(events)
+            return canonical_tracker
         else:
             logger.warning(
                 "Can't recreate tracker from mongo storage "
@@ -221,24 +361,15 @@ class BotfrontTrackerStore(TrackerStore):
             )
             return None
 
-    def _update_tracker(self, sender_id, remote_tracker):
-        old_tracker = self.trackers.get(sender_id)
-        if old_tracker is not None:
-            events = old_tracker.get("events")
-            remote_events = remote_tracker.get("events")
-            # if we recieve max event it means that the we skiped some events
-            # as we take only the last max events, so we remplace the local copy with the remote data
-            if len(remote_events) == self.max_events:
-                new_events = remote_events
-            else:
-                new_events = [*events, *remote_events]
-            new_tracker = {**old_tracker, **remote_tracker}
-            new_tracker["events"] = new_events
-            self.trackers[sender_id] = new_tracker
-            return new_tracker
+    def _update_tracker(self, sender_id, old_tracker, tracker_info):
+        remote_events = tracker_info["tracker"].get("events")
+        # if we recieve max event it means that the we skiped some events
+        # as we take only the last max events, so we remplace the local copy with the remote data
+        if old_tracker is not None and len(remote_events) != self.max_events:
+            new_events = [*old_tracker["events"], *remote_events]
         else:
-            self.trackers[sender_id] = remote_tracker
-            return remote_tracker
+            new_events = remote_events
+        return self._cache_tracker(sender_id, new_events, tracker_info)
 
     def retrieve(self, sender_id):
         if self.botfront_test_regex.match(sender_id):
@@ -246,49 +377,46 @@ class BotfrontTrackerStore(TrackerStore):
         last_index = self._get_last_index(sender_id)
         # retreive all new info since the last sync (given by last index)
         new_tracker_info = self._fetch_tracker(sender_id, last_index)
+        return self._merge_fetched_tracker(sender_id, new_tracker_info)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        if self.botfront_test_regex.match(sender_id):
+            return self.test_trackers.get(sender_id)
+        # make sure that Botfront knows all events of this instance
+        await self._wait_for_pending_saves(sender_id)
+        last_index = self._get_last_index(sender_id)
+        # retreive all new info since the last sync (given by last index)
+        new_tracker_info = await self._fetch_tracker_async(sender_id, last_index)
+        return self._merge_fetched_tracker(sender_id, new_tracker_info)
+
+    async def retrieve_full_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        return await self.retrieve_async(conversation_id)
+
+    def _merge_fetched_tracker(self, sender_id, new_tracker_info):
         current_tracker = self.trackers.get(sender_id)
         # do not chane the order of these ifs
         # ortherwise you will get synchornication issues when working with multiple rasa instances
         # the tracker exist on the remote and may exist locally
         if new_tracker_info is not None:
-            self._store_tracker_info(sender_id, new_tracker_info)
-            tracker = self._update_tracker(sender_id, new_tracker_info.get("tracker"))
-            return self._convert_tracker(sender_id, tracker)
+            events = self._update_tracker(sender_id, current_tracker, new_tracker_info)
+            return self._convert_tracker(sender_id, events)
 
         # the tracker do not exist yet
         if current_tracker is None:
             return None
 
         # the tracker exist localy an there is no new infos
-        return self._convert_tracker(sender_id, current_tracker)
-
-    def cleanup_trackers(self, trackers, persist_time):
-        for key in list(
-            trackers.keys()
-        ):
-            ## wraped in a try block so if an exception occurs it does not stop the sweep mechanism
-            try:
-                tracker = trackers.get(key)
-                max_event_time = time.time() - persist_time
-                latest_event = float("inf")
-                try:
-                    latest_event = tracker.latest_message.timestamp
-                except:
-                    latest_event = tracker.get("latest_event_time", float("inf"))
-                    pass
-                if latest_event < max_event_time:
-                    logger.debug("SWEEPER: Removing botfront test tracker {}".format(key))
-                    if key in trackers:
-                        del trackers[key]
-                    if key in self.trackers_info:
-                        del self.trackers_info[key]
-            except Exception as e:
-                print(e)
-                pass
-
-    def sweep(self):
-        self.cleanup_trackers(self.test_trackers, self.test_tracker_persist_time)
-        self.cleanup_trackers(self.trackers, self.tracker_persist_time)
+        return self._convert_tracker(sender_id, current_tracker["events"])
+
+    async def close(self) -> None:
+        """Sends the pending saves to Botfront and closes the connections."""
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks.values())
+        await self.graphql_client.close()
+        logger.debug(f"Local tracker cache statistics: {self.trackers.stats()}")
+        await super().close()
 
     @staticmethod
     def _serialize_tracker_to_dict(canonical_tracker):
@@ -1,20 +1,103 @@
+import json
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from rasa.nlu.extractors.duckling_entity_extractor import DucklingEntityExtractor, convert_duckling_format_to_rasa
 from rasa.shared.utils.io import raise_warning
 from rasa.shared.nlu.training_data.message import Message
 
-from typing import Any, List, Optional, Text, Dict
+from typing import Any, List, Optional, Text, Dict, Tuple
 from rasa.shared.constants import DOCS_URL_COMPONENTS
-from rasa.shared.nlu.constants import ENTITIES
+from rasa.shared.nlu.constants import ENTITIES, TEXT
+from rasa_addons.core.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
 
 class DucklingHTTPExtractorWithTimezone(DucklingEntityExtractor):
+    """Duckling extractor which sends the timezone and reference time of a request.
+
+    Requests are sent over a pooled keep-alive session. If `cache_size` is set, the
+    results are cached by text, locale, timezone, dimensions and reference time. The
+    reference time is rounded to `reference_time_bucket` seconds, so relative
+    expressions such as "in 5 minutes" may then be resolved up to that long before
+    the actual request.
+    """
+
+    defaults = {
+        **DucklingEntityExtractor.defaults,
+        # timeout for connecting to the duckling server, defaults to `timeout`
+        "connect_timeout": None,
+        # maximum number of connections to the duckling server, which is also the
+        # number of messages of a batch that are parsed at the same time
+        "max_connections": 10,
+        # maximum number of cached duckling results, `0` disables the cache
+        "cache_size": 0,
+        # granularity of the reference time in the cache key, in seconds
+        "reference_time_bucket": 60,
+    }
+
+    def __init__(
+        self,
+        component_config: Optional[Dict[Text, Any]] = None,
+        language: Optional[Text] = None,
+    ) -> None:
+        super().__init__(component_config, language)
+
+        cache_size = self.component_config.get("cache_size")
+        self._cache = LRUCache(max_entries=cache_size) if cache_size else None
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                max_connections = self.component_config.get("max_connections")
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+                self._session = requests.Session()
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+            return self._session
+
+    def _timeout(self) -> Any:
+        timeout = self.component_config.get("timeout")
+        connect_timeout = self.component_config.get("connect_timeout")
+        if connect_timeout is None:
+            return timeout
+        return connect_timeout, timeout
+
+    def _cache_key(self, text: Text, reference_time: int, timezone) -> Tuple:
+        bucket = self.component_config.get("reference_time_bucket") or 0
+        return (
+            text,
+            self._locale(),
+            timezone,
+            json.dumps(self.component_config["dimensions"]),
+            reference_time // (bucket * 1000) if bucket else reference_time,
+        )
 
     def _duckling_parse(self, text: Text, reference_time: int, timezone) -> List[Dict[Text, Any]]:
+        """Returns the cached duckling result or requests it from the server."""
+
+        if self._cache is None:
+            return self._request_duckling(text, reference_time, timezone) or []
+
+        key = self._cache_key(text, reference_time, timezone)
+        matches = self._cache.get(key)
+        if matches is None:
+            matches = self._request_duckling(text, reference_time, timezone)
+            if matches is None:
+                return []
+            # failed requests are not cached so they are retried with the next message
+            self._cache.set(key, matches)
+        return matches
+
+    def _request_duckling(
+        self, text: Text, reference_time: int, timezone
+    ) -> Optional[List[Dict[Text, Any]]]:
         """Sends the request to the duckling server and parses the result."""
 
         try:
@@ -23,11 +106,11 @@ class DucklingHTTPExtractorWithTimezone(DucklingEntityExtractor):
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
             }
-            response = requests.post(
+            response = self._get_session().post(
                 self._url() + "/parse",
                 data=payload,
                 headers=headers,
-                timeout=self.component_config.get("timeout"),
+                timeout=self._timeout(),
             )
             if response.status_code == 200:
                 return response.json()
@@ -37,7 +120,7 @@ class DucklingHTTPExtractorWithTimezone(DucklingEntityExtractor):
                     "duckling. Status Code: {}. Response: {}"
                     "".format(response.status_code, response.text)
                 )
-                return []
+                return None
         except (
             requests.exceptions.ConnectionError,
             requests.exceptions.ReadTimeout,
@@ -51,7 +134,16 @@ class DucklingHTTPExtractorWithTimezone(DucklingEntityExtractor):
                 "https://github.com/facebook/duckling#quickstart "
                 "Error: {}".format(e)
             )
-            return []
+            return None
+
+    def cache_stats(self) -> Dict[Text, Any]:
+        """Returns the counters and the hit rate of the result cache."""
+        if self._cache is None:
+            return {}
+        stats = self._cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
 
     @staticmethod
     def _timezone_from_config_or_request(component_config, timezone):
@@ -83,35 +175,65 @@ class DucklingHTTPExtractorWithTimezone(DucklingEntityExtractor):
                 )
         return int(time.time()) * 1000
 
+    def _request_parameters(self, message: Message, kwargs: Dict[Text, Any]) -> Tuple:
+        timezone = self._timezone_from_config_or_request(
+            self.component_config, kwargs.get("timezone", None)
+        )
+        reference_time = self._reference_time_from_message_or_request(
+            message, kwargs.get("reference_time", None)
+        )
+        return message.get(TEXT), reference_time, timezone
+
+    def _set_entities(self, message: Message, matches: List[Dict[Text, Any]]) -> None:
+        all_extracted = convert_duckling_format_to_rasa(matches)
+        dimensions = self.component_config["dimensions"]
+        extracted = DucklingEntityExtractor.filter_irrelevant_entities(
+            all_extracted, dimensions
+        )
+        extracted = self.add_extractor_name(extracted)
+        message.set(
+            ENTITIES, message.get(ENTITIES, []) + extracted, add_to_output=True,
+        )
+
+    def _warn_about_missing_url(self) -> None:
+        raise_warning(
+            "Duckling HTTP component in pipeline, but no "
+            "`url` configuration in the config "
+            "file nor is `RASA_DUCKLING_HTTP_URL` "
+            "set as an environment variable. No entities will be extracted!",
+            docs=DOCS_URL_COMPONENTS + "#ducklinghttpextractor",
+        )
+
     def process(self, message: Message, **kwargs: Any) -> None:
 
         if self._url() is not None:
             # mod >
-            params = kwargs
-            timezone = self._timezone_from_config_or_request(
-                self.component_config, params.get("timezone", None)
-            )
-            reference_time = self._reference_time_from_message_or_request(
-                message, params.get("reference_time", None)
-            )
-            matches = self._duckling_parse(message.text, reference_time, timezone)
+            matches = self._duckling_parse(*self._request_parameters(message, kwargs))
             # </ mod
-            all_extracted = convert_duckling_format_to_rasa(matches)
-            dimensions = self.component_config["dimensions"]
-            extracted = DucklingEntityExtractor.filter_irrelevant_entities(
-                all_extracted, dimensions
-            )
         else:
-            extracted = []
-            raise_warning(
-                "Duckling HTTP component in pipeline, but no "
-                "`url` configuration in the config "
-                "file nor is `RASA_DUCKLING_HTTP_URL` "
-                "set as an environment variable. No entities will be extracted!",
-                docs=DOCS_URL_COMPONENTS + "#ducklinghttpextractor",
-            )
+            matches = []
+            self._warn_about_missing_url()
 
-        extracted = self.add_extractor_name(extracted)
-        message.set(
-            ENTITIES, message.get(ENTITIES, []) + extracted, add_to_output=True,
-        )
\ No newline at end of file
+        self._set_entities(message, matches)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Sends the requests for all messages to duckling at the same time."""
+
+        if self._url() is None:
+            self._warn_about_missing_url()
+            for message in messages:
+                self._set_entities(message, [])
+            return
+
+        parameters = [self._request_parameters(message, kwargs) for message in messages]
+        max_workers = min(len(messages), self.component_config.get("max_connections"))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                all_matches = list(
+                    executor.map(lambda args: self._duckling_parse(*args), parameters)
+                )
+        else:
+            all_matches = [self._duckling_parse(*args) for args in parameters]
+
+        for message, matches in zip(messages, all_matches):
+            self._set_entities(message, matches)
@@ -1,8 +1,9 @@
 import os
 import warnings
+from collections import Counter, defaultdict
 import rasa
 
-from typing import Any, Text, Dict, Optional
+from typing import Any, Text, Dict, List, Optional, Tuple
 
 import rasa.shared.utils.io
 from rasa.nlu import utils
@@ -14,6 +15,104 @@ from rasa.nlu.model import Metadata
 
 from fuzzy_matcher import process
 
+# length of the character n-grams used to find match candidates
+NGRAM_SIZE = 2
+# gazettes with fewer values are scanned completely, which keeps the suggestions
+# below the minimum score of an entity
+MIN_INDEXED_VALUES = 500
+
+
+def _ngrams(value: Text) -> Counter:
+    return Counter(
+        value[i : i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)
+    )
+
+
+def _ngram_count(value: Text) -> int:
+    return max(len(value) - NGRAM_SIZE + 1, 0)
+
+
+class _GazetteIndex:
+    """Character n-gram index over the values of a gazette.
+
+    Values which differ from the query by at most `k` edits share at least
+    `len(query) - NGRAM_SIZE + 1 - k * NGRAM_SIZE` n-grams with it. The index uses
+    this bound to only score values which can exceed the minimum score of an
+    entity. Suggestions scoring below the minimum score may hence be missing.
+    """
+
+    def __init__(self, values: List[Text]) -> None:
+        self.values = values
+        self.exact = set(values)
+        self.by_length: Dict[int, List[Text]] = defaultdict(list)
+        for value in values:
+            self.by_length[len(value)].append(value)
+        self.postings: Dict[Text, List[Tuple[int, int]]] = defaultdict(list)
+        for position, value in enumerate(values):
+            for ngram, count in _ngrams(value).items():
+                self.postings[ngram].append((position, count))
+
+    @staticmethod
+    def _max_edits(length: int, min_score: int) -> int:
+        # the scorers truncate their score, so it exceeds `min_score` if the share
+        # of edits is at most `1 - (min_score + 1) / 100`
+        return int(length * (100 - min_score - 1) / 100)
+
+    def candidates(self, query: Text, mode: Text, min_score: int) -> List[Text]:
+        """Returns the values which can score above `min_score` for `query`."""
+        if mode == "ratio":
+            # the score is relative to the longer string, which can be at most
+            # `len(query) / (1 - share of edits)` long
+            max_share = max(100 - min_score - 1, 0) / 100
+            longest = int(len(query) / (1 - max_share)) if max_share < 1 else None
+            max_edits = self._max_edits(longest, min_score) if longest else None
+        elif mode == "partial_ratio":
+            max_edits = self._max_edits(len(query), min_score)
+        else:
+            return self.values
+
+        query_ngrams = _ngrams(query)
+        required = sum(query_ngrams.values()) - (
+            max_edits * NGRAM_SIZE if max_edits is not None else len(query)
+        )
+        if required <= 0:
+            return self.values
+
+        shared = defaultdict(int)
+        for ngram, count in query_ngrams.items():
+            for position, value_count in self.postings.get(ngram, []):
+                shared[position] += min(count, value_count)
+
+        candidates = []
+        for position, count in shared.items():
+            value = self.values[position]
+            if mode == "partial_ratio" and len(value) < len(query):
+                # shorter values are compared to windows of the query, hence the
+                # bound applies to the n-grams of the value
+                if count >= _ngram_count(value) - max_edits * NGRAM_SIZE:
+                    candidates.append(value)
+            elif count >= required:
+                candidates.append(value)
+
+        if mode == "partial_ratio":
+            # values which are too short to share n-grams under the bound
+            shortest_bounded = max_edits * NGRAM_SIZE + NGRAM_SIZE
+            scored = {self.values[position] for position in shared}
+            candidates += [
+                value
+                for length in range(min(shortest_bounded, len(query)))
+                for value in self.by_length.get(length, [])
+                if value not in scored
+            ]
+        else:
+            candidates = [
+                value
+                for value in candidates
+                if abs(len(value) - len(query))
+                <= self._max_edits(max(len(value), len(query)), min_score)
+            ]
+        return candidates
+
 
 class Gazette(Component):
     name = "Gazette"
@@ -30,6 +129,33 @@ class Gazette(Component):
             self._load_config()
         self.limit = self.component_config.get("max_num_suggestions")
         self.entities = self.component_config.get("entities", [])
+        self._build_index()
+
+    def _build_index(self) -> None:
+        self._entity_configs = {rep["name"]: rep for rep in self.entities}
+        self._indices = {
+            name: _GazetteIndex(values)
+            for name, values in self.gazette.items()
+            if len(values) >= MIN_INDEXED_VALUES
+        }
+
+    def _match(self, value: Text, entity_name: Text, config: Dict) -> List[Tuple]:
+        index = self._indices.get(entity_name)
+        if index is None:
+            values = self.gazette.get(entity_name, [])
+            is_exact = value in values
+        else:
+            values = index.candidates(value, config["mode"], config["min_score"])
+            is_exact = value in index.exact
+
+        matches = process.extract(
+            value, values, limit=self.limit, scorer=config["mode"]
+        )
+        if is_exact:
+            # other values might score 100 as well, the exact match comes first
+            others = [match for match in matches if match[0] != value]
+            matches = [(value, 100)] + others[: self.limit - 1]
+        return matches
 
     def process(self, message: Message, **kwargs: Any) -> None:
 
@@ -37,17 +163,12 @@ class Gazette(Component):
         new_entities = []
 
         for entity in entities:
-            config = self._find_entity(entity, self.entities)
+            config = self._entity_configs.get(entity["entity"])
             if config is None or not isinstance(entity["value"], str):
                 new_entities.append(entity)
                 continue
 
-            matches = process.extract(
-                entity["value"],
-                self.gazette.get(entity["entity"], []),
-                limit=self.limit,
-                scorer=config["mode"],
-            )
+            matches = self._match(entity["value"], entity["entity"], config)
             primary, score = matches[0] if len(matches) else (None, None)
 
             if primary is not None and score > config["min_score"]:
@@ -69,6 +190,7 @@ class Gazette(Component):
                 table = item["gazette"]
                 gazette_dict[name] = table
             self.gazette = gazette_dict
+            self._build_index()
 
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         file_name = file_name + ".json"
@@ -92,13 +214,6 @@ class Gazette(Component):
             warnings.warn("Could not load gazette.")
             return Gazette(component_meta, None)
 
-    @staticmethod
-    def _find_entity(entity, entities):
-        for rep in entities:
-            if entity["entity"] == rep["name"]:
-                return rep
-        return None
-
     def _load_config(self):
         entities = []
         for rep in self.component_config.get("entities", []):
@@ -0,0 +1,133 @@
+import copy
+from typing import Any, Dict, List, Text, Tuple
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import SlotSet, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.core.slots import TextSlot
+from rasa.utils.endpoints import EndpointConfig
+from rasa_addons.core.nlg.graphql import GraphQLNaturalLanguageGenerator
+
+TEMPLATES = {
+    "utter_greet": {"text": "Hello {name}!", "metadata": {"linkTarget": "_blank"}},
+    "utter_bye": {"customText": "Bye {name}", "custom": {"a": "{name}"}},
+}
+
+
+@pytest.fixture
+def queries(monkeypatch: MonkeyPatch) -> List[Dict[Text, Any]]:
+    queries = []
+
+    async def query_with_errors(
+        self: Any, query: Text, variables: Dict[Text, Any]
+    ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
+        queries.append(variables)
+        templates = [variables[f"template{i}"] for i in range(len(variables) // 2 - 1)]
+        if "utter_invalid" in templates:
+            # errors of the query as a whole don't have a path
+            return {}, [{"message": "invalid query"}]
+
+        data, errors = {}, []
+        for i, template in enumerate(templates):
+            if template == "utter_error":
+                data[f"r{i}"] = None
+                errors.append({"message": "error", "path": [f"r{i}"]})
+            else:
+                data[f"r{i}"] = copy.deepcopy(TEMPLATES[template])
+        return data, errors
+
+    monkeypatch.setattr(
+        "rasa_addons.core.graphql_client.AsyncGraphQLClient.query_with_errors",
+        query_with_errors,
+    )
+    return queries
+
+
+def _nlg(**config: Any) -> GraphQLNaturalLanguageGenerator:
+    return GraphQLNaturalLanguageGenerator(
+        endpoint_config=EndpointConfig("http://botfront/graphql", **config)
+    )
+
+
+def _tracker(name: Text = "Ada") -> DialogueStateTracker:
+    tracker = DialogueStateTracker("sender", [TextSlot("name"), TextSlot("mood")])
+    tracker.update(UserUttered("hi", metadata={"language": "en"}), Domain.empty())
+    tracker.update(SlotSet("name", name))
+    return tracker
+
+
+async def test_templates_are_rendered_with_one_query(queries: List[Dict[Text, Any]]):
+    nlg = _nlg(tracker_payload="compact")
+
+    responses = await nlg.generate_batch(
+        [("utter_greet", {}), ("utter_bye", {"x": 1})], _tracker(), "webchat"
+    )
+
+    assert responses == [
+        {"text": "Hello Ada!", "linkTarget": "_blank", "template_name": "utter_greet"},
+        {"text": "Bye Ada", "custom": {"a": "Ada"}, "template_name": "utter_bye"},
+    ]
+    assert len(queries) == 1
+    assert queries[0]["arguments1"] == {"x": 1, "language": "en", "projectId": None}
+    assert set(queries[0]["tracker"]) == {"sender_id", "slots", "latest_message"}
+
+
+async def test_responses_are_cached_before_interpolation(
+    queries: List[Dict[Text, Any]]
+):
+    nlg = _nlg(cache_size=10, conditional_slots=["mood"])
+
+    first = await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+    second = await nlg.generate("utter_greet", _tracker("Bob"), "webchat")
+    # another channel might get another response
+    await nlg.generate("utter_greet", _tracker("Bob"), "telegram")
+
+    assert first["text"] == "Hello Ada!"
+    assert second["text"] == "Hello Bob!"
+    assert len(queries) == 2
+    assert "events" in queries[0]["tracker"]
+    assert nlg.cache_stats()["hits"] == 1
+
+
+async def test_cache_key_contains_conditional_slots(queries: List[Dict[Text, Any]]):
+    nlg = _nlg(cache_size=10)
+
+    await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+    await nlg.generate("utter_greet", _tracker("Bob"), "webchat")
+
+    assert len(queries) == 2
+
+
+async def test_failing_templates_do_not_fail_the_batch(queries: List[Dict[Text, Any]]):
+    nlg = _nlg(cache_size=10)
+
+    for _ in range(2):
+        responses = await nlg.generate_batch(
+            [("utter_greet", {}), ("utter_error", {})], _tracker(), "webchat"
+        )
+        assert responses == [
+            {
+                "text": "Hello Ada!",
+                "linkTarget": "_blank",
+                "template_name": "utter_greet",
+            },
+            {"text": "utter_error"},
+        ]
+
+    # errors are not cached, the other responses are
+    assert len(queries) == 2
+    assert queries[1]["template0"] == "utter_error"
+    assert "template1" not in queries[1]
+
+
+async def test_errors_of_the_query_fail_all_templates(queries: List[Dict[Text, Any]]):
+    nlg = _nlg()
+
+    responses = await nlg.generate_batch(
+        [("utter_greet", {}), ("utter_invalid", {})], _tracker(), "webchat"
+    )
+
+    assert responses == [{"text": "utter_greet"}, {"text": "utter_invalid"}]
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from rasa_addons.core.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_entries():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": 0,
+        "hits": 3,
+        "misses": 0,
+        "evictions": 1,
+    }
+
+
+def test_lru_cache_evicts_entries_above_byte_budget():
+    cache = LRUCache(max_bytes=10, sizeof=len)
+    cache.set("a", "12345")
+    cache.set("b", "123456")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "123456"
+    assert cache.bytes == 6
+
+    # entries which are larger than the budget aren't kept
+    cache.set("c", "12345678901")
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache = LRUCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    monkeypatch.setattr(time, "time", lambda: now + 5)
+    assert cache.get("a") == 1
+
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_popitem_evicts_least_recently_used_entry():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    assert cache.popitem() == ("b", 2)
+    assert cache.popitem() == ("a", 1)
+    assert cache.stats()["evictions"] == 2
+    with pytest.raises(KeyError):
+        cache.popitem()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Any, List, Optional, Text
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.core.interpreter
+from rasa.shared.nlu.interpreter import RegexInterpreter
+from rasa_addons.core.interpreter import (
+    ENV_MAX_LOADED_LANGUAGES,
+    ENV_PINNED_LANGUAGES,
+    MultilingualNLUInterpreter,
+)
+
+
+@pytest.fixture
+def loaded_models(monkeypatch: MonkeyPatch) -> List[Text]:
+    loaded_models = []
+
+    def create_interpreter(model_path: Optional[Text], **kwargs: Any):
+        # loading a model takes a while
+        time.sleep(0.05)
+        loaded_models.append(model_path)
+        return RegexInterpreter()
+
+    monkeypatch.setattr(rasa.core.interpreter, "create_interpreter", create_interpreter)
+    return loaded_models
+
+
+MODELS = {"en": "models/nlu-en", "fr": "models/nlu-fr", "de": "models/nlu-de"}
+
+
+async def test_models_are_loaded_on_first_message(loaded_models: List[Text]):
+    interpreter = MultilingualNLUInterpreter(MODELS)
+    assert loaded_models == []
+
+    result = await interpreter.parse("/greet", metadata={"language": "fr"})
+
+    assert result["intent"]["name"] == "greet"
+    assert loaded_models == ["models/nlu-fr"]
+    assert list(interpreter.interpreters) == ["fr"]
+
+
+async def test_concurrent_first_messages_load_model_once(loaded_models: List[Text]):
+    interpreter = MultilingualNLUInterpreter(MODELS)
+
+    await asyncio.gather(
+        *[interpreter.parse("/greet", metadata={"language": "en"}) for _ in range(5)]
+    )
+
+    assert loaded_models == ["models/nlu-en"]
+
+
+async def test_least_recently_used_model_is_unloaded(loaded_models: List[Text]):
+    interpreter = MultilingualNLUInterpreter(
+        MODELS, max_loaded_languages=2, pinned_languages=["en"]
+    )
+    assert loaded_models == ["models/nlu-en"]
+
+    await interpreter.parse("/greet", metadata={"language": "fr"})
+    await interpreter.parse("/greet", metadata={"language": "de"})
+    await interpreter.parse("/greet", metadata={"language": "en"})
+
+    # the pinned language stays loaded
+    assert set(interpreter.interpreters) == {"en", "de"}
+    assert interpreter.stats()["evictions"] == 1
+
+    await interpreter.parse("/greet", metadata={"language": "fr"})
+    assert loaded_models == [
+        "models/nlu-en",
+        "models/nlu-fr",
+        "models/nlu-de",
+        "models/nlu-fr",
+    ]
+
+
+async def test_limits_are_read_from_environment(
+    loaded_models: List[Text], monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(ENV_MAX_LOADED_LANGUAGES, "1")
+    monkeypatch.setenv(ENV_PINNED_LANGUAGES, "de, it")
+
+    interpreter = MultilingualNLUInterpreter(MODELS)
+
+    assert interpreter.max_loaded_languages == 1
+    assert interpreter.pinned_languages == ["de"]
+    assert loaded_models == ["models/nlu-de"]
+
+    await interpreter.parse("/greet", metadata={"language": "fr"})
+
+    # there is no room for unpinned models
+    assert set(interpreter.interpreters) == {"de"}
+
+
+async def test_pinned_languages_beyond_the_limit_are_not_pinned(
+    loaded_models: List[Text],
+):
+    interpreter = MultilingualNLUInterpreter(
+        MODELS, max_loaded_languages=1, pinned_languages=["en", "fr"]
+    )
+
+    assert interpreter.pinned_languages == ["en"]
+    assert loaded_models == ["models/nlu-en"]
+
+
+@pytest.mark.parametrize("pinned_languages", [[], ["en"]])
+async def test_loaded_models_never_exceed_the_limit(
+    pinned_languages: List[Text], monkeypatch: MonkeyPatch
+):
+    loaded_at_load_time = []
+
+    def create_interpreter(model_path: Optional[Text], **kwargs: Any):
+        loaded_at_load_time.append(len(interpreter.interpreters))
+        return RegexInterpreter()
+
+    monkeypatch.setattr(rasa.core.interpreter, "create_interpreter", create_interpreter)
+    interpreter = MultilingualNLUInterpreter(
+        MODELS,
+        max_loaded_languages=2,
+        pinned_languages=pinned_languages,
+        lazy_init=True,
+    )
+
+    for lang in ["fr", "de", "en", "fr", "de", "en"]:
+        await interpreter.parse("/greet", metadata={"language": lang})
+        assert len(interpreter.interpreters) <= 2
+
+    # the models which are already loaded when another one is loaded
+    assert loaded_at_load_time
+    assert max(loaded_at_load_time) < 2
+
+
+async def test_unknown_language_raises(loaded_models: List[Text]):
+    interpreter = MultilingualNLUInterpreter(MODELS)
+
+    with pytest.raises(Exception):
+        await interpreter.parse("/greet", metadata={"language": "ja"})
+
+
+async def test_cache_stats_of_loaded_models(loaded_models: List[Text]):
+    interpreter = MultilingualNLUInterpreter(MODELS)
+    await interpreter.parse("/greet", metadata={"language": "fr"})
+    assert interpreter.cache_stats() == {}
+
+    interpreter.interpreters["fr"].cache_stats = lambda: {"Duckling": {"hits": 1}}
+
+    assert interpreter.cache_stats() == {"fr": {"Duckling": {"hits": 1}}}
@@ -15,7 +15,7 @@ def test_should_properly_update_tracker():
     testTrackerStore._fetch_tracker = MagicMock(return_value = tracker2)
     testTrackerStore.retrieve('test')
     assert (
-            testTrackerStore.trackers['test'] == merged_tracker_1
+            testTrackerStore.trackers.get('test')["events"] == merged_tracker_1["events"]
         ) 
 
 
@@ -32,5 +32,70 @@ def test_should_not_update_events():
     testTrackerStore._fetch_tracker = MagicMock(return_value = tracker3)
     testTrackerStore.retrieve('test')
     assert (
-            testTrackerStore.trackers['test'] == merged_tracker_2
+            testTrackerStore.trackers.get('test')["events"] == merged_tracker_2["events"]
         ) 
+
+
+# only the events of the latest session are kept locally
+def test_should_cache_events_of_latest_session():
+    from rasa.shared.core.events import ActionExecuted, SessionStarted, UserUttered
+    from rasa.shared.core.trackers import DialogueStateTracker
+
+    testTrackerStore = BotfrontTrackerStore(domain=None, host='test')
+    testTrackerStore._insert_tracker_gql = MagicMock(return_value=None)
+    tracker = DialogueStateTracker.from_events(
+        'test',
+        [
+            UserUttered("hi"),
+            ActionExecuted("action_listen"),
+            SessionStarted(),
+            ActionExecuted("action_listen"),
+        ],
+    )
+    testTrackerStore.save(tracker)
+
+    cached_events = testTrackerStore.trackers.get('test')["events"]
+    assert [e["event"] for e in cached_events] == ["session_started", "action"]
+
+
+async def test_should_coalesce_pending_saves():
+    from rasa.shared.core.events import UserUttered
+    from rasa.shared.core.trackers import DialogueStateTracker
+    from tests.conftest import AsyncMock
+
+    testTrackerStore = BotfrontTrackerStore(domain=None, host='test')
+    updated_info = {"lastIndex": 1, "lastTimestamp": 1}
+    testTrackerStore._insert_tracker_gql_async = AsyncMock(return_value=updated_info)
+    testTrackerStore._update_tracker_gql_async = AsyncMock(return_value=updated_info)
+
+    tracker = DialogueStateTracker.from_events('test', [UserUttered("hi")])
+    await testTrackerStore.save_async(tracker)
+    tracker.update(UserUttered("hello"))
+    await testTrackerStore.save_async(tracker)
+    await testTrackerStore.close()
+
+    # both saves are sent with a single insert
+    testTrackerStore._insert_tracker_gql_async.assert_called_once()
+    testTrackerStore._update_tracker_gql_async.assert_not_called()
+    _, sent_tracker = testTrackerStore._insert_tracker_gql_async.call_args[0]
+    assert len(sent_tracker["events"]) == 2
+    assert testTrackerStore._get_last_index('test') == 1
+    assert testTrackerStore._get_last_timestamp('test') == 1
+
+
+async def test_should_wait_for_pending_saves_when_retrieving():
+    from rasa.shared.core.events import UserUttered
+    from rasa.shared.core.trackers import DialogueStateTracker
+    from tests.conftest import AsyncMock
+
+    testTrackerStore = BotfrontTrackerStore(domain=None, host='test')
+    updated_info = {"lastIndex": 3, "lastTimestamp": 1}
+    testTrackerStore._insert_tracker_gql_async = AsyncMock(return_value=updated_info)
+    testTrackerStore._fetch_tracker_async = AsyncMock(return_value=None)
+
+    tracker = DialogueStateTracker.from_events('test', [UserUttered("hi")])
+    await testTrackerStore.save_async(tracker)
+    await testTrackerStore.retrieve_async('test')
+
+    # only the events which were stored after the save are fetched
+    testTrackerStore._fetch_tracker_async.assert_called_once_with('test', 3)
@@ -0,0 +1,95 @@
+import responses
+
+from rasa.shared.nlu.constants import ENTITIES
+from rasa.shared.nlu.training_data.message import Message
+from rasa_addons.nlu.components.duckling_http_extractor import (
+    DucklingHTTPExtractorWithTimezone,
+)
+
+DUCKLING_RESPONSE = [
+    {
+        "body": "two",
+        "start": 4,
+        "value": {"value": 2, "type": "value"},
+        "end": 7,
+        "dim": "number",
+        "latent": False,
+    }
+]
+
+
+def _extractor(**config) -> DucklingHTTPExtractorWithTimezone:
+    return DucklingHTTPExtractorWithTimezone(
+        {"url": "http://localhost:8000", "dimensions": ["number"], **config}, "en"
+    )
+
+
+def test_repeated_messages_are_served_from_cache():
+    extractor = _extractor(cache_size=10)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "http://localhost:8000/parse", json=DUCKLING_RESPONSE)
+
+        for _ in range(3):
+            message = Message.build(text="buy two apples")
+            extractor.process(message, reference_time=1_000_000)
+            assert message.get(ENTITIES)[0]["value"] == 2
+
+        assert len(rsps.calls) == 1
+
+    assert extractor.cache_stats()["hits"] == 2
+    assert extractor.cache_stats()["hit_rate"] == 2 / 3
+
+
+def test_cache_key_includes_timezone_and_reference_time_bucket():
+    extractor = _extractor(cache_size=10, reference_time_bucket=60)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "http://localhost:8000/parse", json=DUCKLING_RESPONSE)
+
+        for timezone, reference_time in [
+            ("Europe/Berlin", 0),
+            ("Europe/Berlin", 59_000),
+            ("Europe/Berlin", 60_000),
+            ("America/Montreal", 60_000),
+        ]:
+            extractor.process(
+                Message.build(text="buy two apples"),
+                timezone=timezone,
+                reference_time=reference_time,
+            )
+
+        assert len(rsps.calls) == 3
+
+
+def test_failed_requests_are_not_cached():
+    extractor = _extractor(cache_size=10)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "http://localhost:8000/parse", status=500)
+        rsps.add(responses.POST, "http://localhost:8000/parse", json=DUCKLING_RESPONSE)
+
+        first = Message.build(text="buy two apples")
+        extractor.process(first, reference_time=0)
+        second = Message.build(text="buy two apples")
+        extractor.process(second, reference_time=0)
+
+        assert len(rsps.calls) == 2
+
+    assert first.get(ENTITIES) == []
+    assert second.get(ENTITIES)[0]["value"] == 2
+
+
+def test_process_batch():
+    # the cache is disabled by default
+    extractor = _extractor()
+    messages = [Message.build(text=f"buy two apples {i}") for i in range(5)]
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "http://localhost:8000/parse", json=DUCKLING_RESPONSE)
+        extractor.process_batch(messages, reference_time=0)
+
+        assert len(rsps.calls) == 5
+
+    assert all(message.get(ENTITIES)[0]["value"] == 2 for message in messages)
+    assert extractor.cache_stats() == {}
@@ -3,7 +3,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from rasa_addons.nlu.components.gazette import Gazette
+import random
+
+import pytest
+from fuzzy_matcher import process
+
+from rasa_addons.nlu.components.gazette import Gazette, MIN_INDEXED_VALUES
 from rasa.shared.nlu.training_data.message import Message
 
 from pytest import raises
@@ -136,3 +141,69 @@ def test_mode_specification():
         example.data["entities"][0], "chinese and a whole bunch of other stuff", 1
     )
 
+
+@pytest.mark.parametrize("mode", ["ratio", "partial_ratio"])
+@pytest.mark.parametrize("min_score", [60, 80, 90])
+def test_indexed_matching_finds_all_matches_above_min_score(mode, min_score):
+    rng = random.Random(42)
+    letters = "abcdefgh "
+    values = list(
+        {
+            "".join(rng.choice(letters) for _ in range(rng.randint(3, 15)))
+            for _ in range(MIN_INDEXED_VALUES * 2)
+        }
+    )
+    gazette = Gazette(
+        component_config={
+            "entities": [{"name": "type", "mode": mode, "min_score": min_score}],
+            "max_num_suggestions": 1000,
+        },
+        gazette={"type": values},
+    )
+    config = {"mode": mode, "min_score": min_score}
+
+    for _ in range(50):
+        query = list(rng.choice(values))
+        # introduce a typo
+        query[rng.randrange(len(query))] = rng.choice(letters)
+        query = "".join(query)
+        if query in values:
+            continue
+
+        expected = {
+            match
+            for match in process.extract(query, values, limit=len(values), scorer=mode)
+            if match[1] > min_score
+        }
+        matches = {
+            match
+            for match in gazette._match(query, "type", config)
+            if match[1] > min_score
+        }
+        assert matches == expected
+
+
+@pytest.mark.parametrize("num_values", [10, MIN_INDEXED_VALUES])
+def test_exact_match_comes_first_with_other_suggestions(num_values):
+    values = [f"product {i}" for i in range(num_values)]
+    example = _get_example(
+        gazette={"type": values}, primary={"entity": "type", "value": "product 7"}
+    )
+
+    entity = example.data["entities"][0]
+    _test_entity(entity, "product 7", 5)
+    assert entity["gazette_matches"][0] == {"value": "product 7", "score": 100}
+
+
+@pytest.mark.parametrize("num_values", [10, MIN_INDEXED_VALUES])
+def test_exact_match_comes_first_if_other_values_score_the_same(num_values):
+    values = [f"product 7 {i}" for i in range(num_values - 1)] + ["product 7"]
+    example = _get_example(
+        config={"entities": [{"name": "type", "mode": "partial_ratio"}]},
+        gazette={"type": values},
+        primary={"entity": "type", "value": "product 7"},
+    )
+
+    entity = example.data["entities"][0]
+    _test_entity(entity, "product 7", 5)
+    assert all(match["score"] == 100 for match in entity["gazette_matches"])
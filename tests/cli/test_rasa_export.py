@@ -10,6 +10,7 @@ from _pytest.pytester import RunResult
 import rasa.core.utils as rasa_core_utils
 from rasa.cli import export
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.kafka import KafkaEventBroker
 from rasa.core.brokers.pika import PikaEventBroker
 from rasa.shared.core.events import UserUttered
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -134,6 +135,20 @@ def test_prepare_pika_event_broker():
     assert pika_broker.raise_on_failure
 
 
+def test_prepare_kafka_event_broker():
+    kafka_broker = Mock(spec=KafkaEventBroker)
+    kafka_broker.is_ready.return_value = True
+
+    # noinspection PyProtectedMember
+    export._prepare_event_broker(kafka_broker)
+
+    # events are neither dropped nor given up on when closing the broker
+    assert kafka_broker.overflow_policy == "block"
+    assert kafka_broker.block_timeout_in_seconds is None
+    assert kafka_broker.close_timeout_in_seconds is None
+    assert kafka_broker.raise_on_failure
+
+
 @pytest.mark.parametrize(
     "current_timestamp,maximum_timestamp,endpoints_path,requested_ids,expected",
     [
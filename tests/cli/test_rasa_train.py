@@ -397,6 +397,7 @@ def test_train_help(run: Callable[..., RunResult]):
                   [-c CONFIG] [-d DOMAIN] [--out OUT] [--dry-run]
                   [--augmentation AUGMENTATION] [--debug-plots]
                   [--num-threads NUM_THREADS]
+                  [--nlu-parallelism NLU_PARALLELISM]
                   [--fixed-model-name FIXED_MODEL_NAME] [--persist-nlu-data]
                   [--force] [--finetune [FINETUNE]]
                   [--epoch-fraction EPOCH_FRACTION]
@@ -415,6 +416,7 @@ def test_train_nlu_help(run: Callable[..., RunResult]):
 
     help_text = """usage: rasa train nlu [-h] [-v] [-vv] [--quiet] [-c CONFIG] [-d DOMAIN]
                       [--out OUT] [-u NLU] [--num-threads NUM_THREADS]
+                      [--nlu-parallelism NLU_PARALLELISM]
                       [--fixed-model-name FIXED_MODEL_NAME]
                       [--persist-nlu-data] [--finetune [FINETUNE]]
                       [--epoch-fraction EPOCH_FRACTION]"""
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Text, Optional
 
@@ -20,8 +21,9 @@ from rasa.shared.core.constants import (
     ACTION_BACK_NAME,
     RULE_SNIPPET_ACTION_NAME,
     REQUESTED_SLOT,
+    PREVIOUS_ACTION,
 )
-from rasa.shared.core.domain import Domain
+from rasa.shared.core.domain import Domain, State
 from rasa.shared.core.events import (
     ActionExecuted,
     UserUttered,
@@ -32,7 +34,12 @@ from rasa.shared.core.events import (
 )
 from rasa.shared.nlu.interpreter import RegexInterpreter
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule
+from rasa.core.policies.rule_policy import (
+    RulePolicy,
+    InvalidRule,
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+)
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 
@@ -1936,3 +1943,116 @@ def test_predict_nothing_if_fallback_disabled():
     )
 
     assert prediction.max_confidence == 0
+
+
+def _is_rule_applicable(
+    rule_key: Text, turn_index: int, conversation_state: State
+) -> bool:
+    """Checks a single rule for a single turn without the rule index."""
+    # turn_index goes back in time
+    reversed_rule_states = list(reversed(json.loads(rule_key)))
+
+    # the rule must be applicable because we got (without any applicability issues)
+    # further in the conversation history than the rule's length
+    if turn_index >= len(reversed_rule_states):
+        return True
+
+    # a state has previous action if and only if it is not a conversation start
+    # state
+    current_previous_action = conversation_state.get(PREVIOUS_ACTION)
+    rule_previous_action = reversed_rule_states[turn_index].get(PREVIOUS_ACTION)
+
+    # current conversation state and rule state are conversation starters
+    if not rule_previous_action and not current_previous_action:
+        return True
+
+    # only one of the states is a conversation starter
+    if not rule_previous_action or not current_previous_action:
+        return False
+
+    return RulePolicy._does_rule_match_state(
+        reversed_rule_states[turn_index], conversation_state
+    )
+
+
+def test_rule_index_finds_applicable_rules():
+    form_name = "some_form"
+    submit_action_name = "utter_submit"
+    other_intent = "other"
+    utter_anti_greet_action = "utter_anti_greet"
+    domain = Domain.from_yaml(
+        f"""
+intents:
+- {GREET_INTENT_NAME}
+- {other_intent}
+actions:
+- {UTTER_GREET_ACTION}
+- {utter_anti_greet_action}
+- {submit_action_name}
+slots:
+  {REQUESTED_SLOT}:
+    type: any
+forms:
+  {form_name}:
+"""
+    )
+    greet_rule_at_conversation_start = TrackerWithCachedStates.from_events(
+        "greet rule at conversation start",
+        domain=domain,
+        slots=domain.slots,
+        evts=[
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(intent={"name": GREET_INTENT_NAME}),
+            ActionExecuted(utter_anti_greet_action),
+        ],
+        is_rule_tracker=True,
+    )
+    policy = RulePolicy()
+    policy.train(
+        [
+            GREET_RULE,
+            greet_rule_at_conversation_start,
+            _form_activation_rule(domain, form_name, other_intent),
+            _form_submit_rule(domain, submit_action_name, form_name),
+        ],
+        domain,
+        RegexInterpreter(),
+    )
+
+    conversation_events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(intent={"name": GREET_INTENT_NAME}),
+        ActionExecuted(utter_anti_greet_action),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(intent={"name": other_intent}),
+        ActionExecuted(form_name),
+        ActiveLoop(form_name),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(intent={"name": GREET_INTENT_NAME}),
+        ActionExecuted(form_name),
+        ActiveLoop(None),
+        SlotSet(REQUESTED_SLOT, None),
+    ]
+    applicable_rule_counts = []
+    for index in range(len(conversation_events)):
+        tracker = DialogueStateTracker.from_events(
+            "test conversation",
+            evts=conversation_events[: index + 1],
+            slots=domain.slots,
+        )
+        states = policy.featurizer.prediction_states([tracker], domain)[0]
+
+        for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+            expected_keys = {
+                rule_key
+                for rule_key in policy.lookup[lookup_name]
+                if all(
+                    _is_rule_applicable(rule_key, turn_index, state)
+                    for turn_index, state in enumerate(reversed(states))
+                )
+            }
+            assert policy._get_possible_keys(lookup_name, states) == expected_keys
+            applicable_rule_counts.append(len(expected_keys))
+
+    # make sure that the rules are applicable in some of the states
+    assert any(applicable_rule_counts)
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Optional
 from unittest.mock import Mock
@@ -35,9 +36,11 @@ from rasa.utils.tensorflow.constants import (
     MODEL_CONFIDENCE,
     COSINE,
     INNER,
+    ENTITY_RECOGNITION,
 )
 from tests.core.test_policies import PolicyTestCollection
 from rasa.shared.constants import DEFAULT_SENDER_ID
+from rasa.constants import ENV_INFERENCE_BATCH_WINDOW_MS
 
 UTTER_GREET_ACTION = "utter_greet"
 GREET_INTENT_NAME = "greet"
@@ -72,6 +75,60 @@ def test_diagnostics():
     assert isinstance(prediction.diagnostic_data.get("attention_weights"), np.ndarray)
 
 
+def test_batched_predictions_match_single_predictions():
+    domain = Domain.from_yaml(DOMAIN_YAML)
+    policy = TEDPolicy()
+    greet = DialogueStateTracker.from_events(
+        "greet",
+        evts=[
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(intent={"name": GREET_INTENT_NAME}),
+            ActionExecuted(UTTER_GREET_ACTION),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(intent={"name": GREET_INTENT_NAME}),
+            ActionExecuted(UTTER_GREET_ACTION),
+        ],
+    )
+    policy.train([greet], domain, RegexInterpreter())
+
+    # dialogues of different lengths are padded within the batch
+    trackers = [
+        DialogueStateTracker.from_events("short", evts=greet.events[:3]),
+        DialogueStateTracker.from_events("long", evts=greet.events),
+    ]
+    all_state_features = [
+        policy._featurize_tracker_for_e2e(tracker, domain, RegexInterpreter())
+        for tracker in trackers
+    ]
+
+    batch_results = policy._predict_batch(all_state_features)
+
+    for state_features, (_, similarities, confidences) in zip(
+        all_state_features, batch_results
+    ):
+        _, expected_similarities, expected_confidences = policy._predict_batch(
+            [state_features]
+        )[0]
+        assert np.allclose(similarities, expected_similarities, atol=1e-5)
+        assert np.allclose(confidences, expected_confidences, atol=1e-5)
+
+
+async def test_predictions_on_the_event_loop_are_not_scheduled(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv(ENV_INFERENCE_BATCH_WINDOW_MS, "5")
+    policy = TEDPolicy(**{ENTITY_RECOGNITION: False})
+    tracker = DialogueStateTracker.from_events(
+        "greet", evts=[ActionExecuted(UTTER_GREET_ACTION)]
+    )
+
+    assert policy._scheduler is not None
+    assert not policy._should_schedule(tracker)
+
+    loop = asyncio.get_running_loop()
+    assert await loop.run_in_executor(None, policy._should_schedule, tracker)
+
+
 class TestTEDPolicy(PolicyTestCollection):
     def test_train_model_checkpointing(self, tmp_path: Path):
         model_name = "core-checkpointed-model"
@@ -1,7 +1,10 @@
+import asyncio
+import copy
 import textwrap
-from typing import List, Text
+from typing import Any, Dict, List, Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import rasa.core
@@ -352,6 +355,137 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+@pytest.fixture
+def action_server_requests(monkeypatch: MonkeyPatch) -> List[Dict[Text, Any]]:
+    monkeypatch.setattr(action, "_domains_sent_to_action_servers", set())
+    requests = []
+
+    async def request(self: EndpointConfig, **kwargs: Any) -> Dict[Text, Any]:
+        json_body = copy.deepcopy(kwargs["json"])
+        requests.append(json_body)
+        if "domain" not in json_body and self.kwargs.get("domain_cache_missed"):
+            self.kwargs["domain_cache_missed"] = False
+            raise ClientResponseError(412, "Precondition Failed", "")
+        return {"events": [], "responses": []}
+
+    monkeypatch.setattr(EndpointConfig, "request", request)
+    return requests
+
+
+async def test_remote_action_sends_domain_by_fingerprint(
+    default_channel,
+    default_nlg,
+    default_tracker,
+    default_domain,
+    action_server_requests: List[Dict[Text, Any]],
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions",
+        domain_by_fingerprint=True,
+        tracker_events="after_restart",
+        max_tracker_events=2,
+    )
+    default_tracker.update_with_events(
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi"),
+            ActionExecuted("utter_greet"),
+        ],
+        default_domain,
+    )
+
+    for _ in range(2):
+        await action.RemoteAction("my_action", endpoint).run(
+            default_channel, default_nlg, default_tracker, default_domain
+        )
+
+    first, second = action_server_requests
+    assert first["domain"] == default_domain.as_dict()
+    assert "domain" not in second
+    assert second["domain_fingerprint"] == default_domain.fingerprint()
+    assert [event["event"] for event in second["tracker"]["events"]] == [
+        "user",
+        "action",
+    ]
+
+
+async def test_remote_action_sends_domain_on_cache_miss(
+    default_channel,
+    default_nlg,
+    default_tracker,
+    default_domain,
+    action_server_requests: List[Dict[Text, Any]],
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", domain_by_fingerprint=True
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    await remote_action.run(
+        default_channel, default_nlg, default_tracker, default_domain
+    )
+    # e.g. the action server was restarted
+    endpoint.kwargs["domain_cache_missed"] = True
+    await remote_action.run(
+        default_channel, default_nlg, default_tracker, default_domain
+    )
+
+    assert ["domain" in request for request in action_server_requests] == [
+        True,
+        False,
+        True,
+    ]
+
+
+async def test_remote_action_renders_templates_concurrently(
+    default_channel, default_tracker, default_domain, monkeypatch: MonkeyPatch
+):
+    class SlowNaturalLanguageGenerator(TemplatedNaturalLanguageGenerator):
+        running = 0
+        most_running = 0
+
+        async def generate(self, template_name: Text, *args: Any, **kwargs: Any):
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+            # the first templates take the longest to render
+            await asyncio.sleep(0.01 * int(template_name[-1]))
+            self.running -= 1
+            return await super().generate(template_name, *args, **kwargs)
+
+    nlg = SlowNaturalLanguageGenerator(
+        {f"utter_{i}": [{"text": f"text {i}"}] for i in range(1, 4)}
+    )
+    response = {
+        "events": [],
+        "responses": [
+            {"template": "utter_3"},
+            {"text": "plain text"},
+            {"template": "utter_2"},
+            {"template": "utter_1"},
+        ],
+    }
+
+    async def request(*args: Any, **kwargs: Any) -> Dict[Text, Any]:
+        return copy.deepcopy(response)
+
+    endpoint = EndpointConfig("https://example.com/webhooks/actions")
+    monkeypatch.setattr(endpoint, "request", request)
+
+    events = await action.RemoteAction("my_action", endpoint).run(
+        default_channel, nlg, default_tracker, default_domain
+    )
+
+    assert [event.text for event in events] == [
+        "text 3",
+        "plain text",
+        "text 2",
+        "text 1",
+    ]
+    assert nlg.most_running == 3
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, default_domain
 ):
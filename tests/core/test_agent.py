@@ -12,6 +12,7 @@ from sanic.request import Request
 from sanic.response import StreamingHTTPResponse
 
 import rasa.core
+import rasa.core.agent
 from rasa.exceptions import ModelNotFound
 import rasa.shared.utils.common
 from rasa.core.policies.form_policy import FormPolicy
@@ -25,6 +26,7 @@ from rasa.shared.core.domain import InvalidDomain, Domain
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.core.policies.ensemble import PolicyEnsemble, SimplePolicyEnsemble
 from rasa.core.policies.memoization import AugmentedMemoizationPolicy, MemoizationPolicy
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 from rasa.utils.endpoints import EndpointConfig
 from tests.core.conftest import DEFAULT_DOMAIN_PATH_WITH_SLOTS
 
@@ -385,6 +387,45 @@ async def test_agent_update_model_none_domain(trained_rasa_model: Text):
     assert tracker.events[3].intent["name"] == "greet"
 
 
+def test_new_model_is_warmed_up_before_it_is_used(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    agent = Agent()
+    interpreter = Mock(spec=NaturalLanguageInterpreter)
+    ensemble = Mock(spec=PolicyEnsemble)
+    ensemble.warm_up.side_effect = lambda *args: assert_not_in_use()
+
+    def assert_not_in_use() -> None:
+        assert agent.policy_ensemble is not ensemble
+
+    monkeypatch.setattr(
+        rasa.core.agent, "get_model_subdirectories", Mock(return_value=("core", "nlu"))
+    )
+    monkeypatch.setattr(
+        rasa.core.agent, "_load_interpreter", Mock(return_value=interpreter)
+    )
+    monkeypatch.setattr(
+        rasa.core.agent,
+        "_load_domain_and_policy_ensemble",
+        Mock(return_value=(default_domain, ensemble)),
+    )
+
+    rasa.core.agent._load_and_set_updated_model(agent, "model", "fingerprint")
+
+    interpreter.warm_up.assert_called_once()
+    ensemble.warm_up.assert_called_once_with(default_domain, interpreter)
+    assert agent.policy_ensemble is ensemble
+
+
+def test_failed_warm_up_does_not_prevent_loading(default_domain: Domain):
+    ensemble = Mock()
+    ensemble.warm_up.side_effect = ValueError()
+
+    rasa.core.agent._warm_up(default_domain, ensemble, None)
+
+    ensemble.warm_up.assert_called_once()
+
+
 async def test_load_agent_on_not_existing_path():
     agent = await load_agent(model_path="some-random-path")
 
@@ -1,9 +1,12 @@
+import asyncio
 import json
 import logging
 import textwrap
+import time
 from asyncio.events import AbstractEventLoop
 from pathlib import Path
 from typing import Union, Text, List, Optional, Type, Dict, Any
+from unittest.mock import Mock
 
 import aio_pika.exceptions
 import kafka
@@ -21,6 +24,7 @@ from rasa.core.brokers.file import FileEventBroker
 from rasa.core.brokers.kafka import KafkaEventBroker
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.exceptions import PublishingError
 from rasa.shared.core.events import Event, Restarted, SlotSet, UserUttered
 from rasa.shared.exceptions import ConnectionException
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
@@ -282,6 +286,112 @@ async def test_kafka_broker_security_protocols(file: Text, exception: Exception)
         actual._create_producer()
 
 
+async def test_kafka_broker_publish_does_not_block_if_kafka_is_unreachable(
+    monkeypatch: MonkeyPatch,
+):
+    def create_producer(self: KafkaEventBroker) -> None:
+        raise kafka.errors.NoBrokersAvailable()
+
+    monkeypatch.setattr(KafkaEventBroker, "_create_producer", create_producer)
+    broker = KafkaEventBroker("localhost", queue_size=2, retry_delay_in_seconds=60)
+
+    start = time.time()
+    for i in range(5):
+        broker.publish({"event": "slot", "value": i})
+    await broker.close()
+
+    assert time.time() - start < 5
+    stats = broker.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["dropped"] > 0
+    assert stats["dropped"] + stats["failed"] == 5
+
+
+async def test_kafka_broker_spills_events_in_order(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    kafka_is_up = False
+    producer = Mock()
+    producer.bootstrap_connected.return_value = True
+
+    def create_producer(self: KafkaEventBroker) -> None:
+        if not kafka_is_up:
+            raise kafka.errors.NoBrokersAvailable()
+        self.producer = producer
+
+    monkeypatch.setattr(KafkaEventBroker, "_create_producer", create_producer)
+    broker = KafkaEventBroker(
+        "localhost",
+        queue_size=2,
+        overflow_policy="spill",
+        spill_directory=str(tmp_path),
+        retry_delay_in_seconds=0.05,
+    )
+
+    for i in range(10):
+        broker.publish({"event": "slot", "value": i})
+    assert broker.stats()["spilled"] > 0
+
+    kafka_is_up = True
+    await asyncio.sleep(1.5)
+    await broker.close()
+
+    sent_events = [call.args[1]["value"] for call in producer.send.call_args_list]
+    assert sent_events == list(range(10))
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_kafka_broker_does_not_drop_events_when_blocking(
+    monkeypatch: MonkeyPatch,
+):
+    producer = Mock()
+    producer.bootstrap_connected.return_value = True
+    # Kafka is slower than the events are published
+    producer.send.side_effect = lambda *args: time.sleep(0.01) or Mock()
+
+    def create_producer(self: KafkaEventBroker) -> None:
+        self.producer = producer
+
+    monkeypatch.setattr(KafkaEventBroker, "_create_producer", create_producer)
+    broker = KafkaEventBroker(
+        "localhost",
+        queue_size=2,
+        overflow_policy="block",
+        block_timeout_in_seconds=None,
+        close_timeout_in_seconds=None,
+        raise_on_failure=True,
+    )
+
+    for i in range(20):
+        broker.publish({"event": "slot", "value": i})
+    await broker.close()
+
+    sent_events = [call.args[1]["value"] for call in producer.send.call_args_list]
+    assert sent_events == list(range(20))
+    assert broker.stats()["dropped"] == 0
+
+
+async def test_kafka_broker_close_raises_if_events_were_not_published(
+    monkeypatch: MonkeyPatch,
+):
+    def create_producer(self: KafkaEventBroker) -> None:
+        raise kafka.errors.NoBrokersAvailable()
+
+    monkeypatch.setattr(KafkaEventBroker, "_create_producer", create_producer)
+    broker = KafkaEventBroker(
+        "localhost", retry_delay_in_seconds=0.05, raise_on_failure=True
+    )
+
+    for timestamp in [3.0, 1.0, 2.0]:
+        broker.publish({"event": "slot", "timestamp": timestamp})
+
+    with pytest.raises(PublishingError) as error:
+        await broker.close()
+
+    assert error.value.timestamp == 1.0
+    assert broker.stats()["failed"] == 3
+
+
 async def test_no_pika_logs_if_no_debug_mode(caplog: LogCaptureFixture):
     broker = PikaEventBroker(
         "host", "username", "password", retry_delay_in_seconds=1, connection_attempts=1
@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import List, Any, Text, Optional, Union
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from _pytest.capture import CaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
@@ -19,17 +19,21 @@ from rasa.shared.core.generator import TrackerWithCachedStates
 from rasa.shared.core.events import UserUttered, ActiveLoop, Event, SlotSet
 from rasa.core.policies.fallback import FallbackPolicy
 from rasa.core.policies.form_policy import FormPolicy
-from rasa.core.policies.policy import Policy, PolicyPrediction
+from rasa.core.policies.policy import Policy, PolicyPrediction, PredictionContext
 from rasa.core.policies.ensemble import (
     PolicyEnsemble,
     InvalidPolicyConfig,
     SimplePolicyEnsemble,
 )
-from rasa.core.policies.rule_policy import RulePolicy
+from rasa.core.policies.rule_policy import (
+    RulePolicy,
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+)
 import rasa.core.actions.action
 
 from tests.core import utilities
-from rasa.core.constants import FORM_POLICY_PRIORITY
+from rasa.core.constants import FORM_POLICY_PRIORITY, WARM_UP_MESSAGE_TEXT
 from rasa.shared.core.events import ActionExecuted, DefinePrevUserUtteredFeaturization
 from rasa.core.policies.two_stage_fallback import TwoStageFallbackPolicy
 from rasa.core.policies.mapping_policy import MappingPolicy
@@ -717,3 +721,102 @@ def test_is_not_in_training_data(
         SimplePolicyEnsemble.is_not_in_training_data(policy_name, confidence)
         == not_in_training_data
     )
+
+
+def test_policies_share_prediction_states(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    ensemble = SimplePolicyEnsemble(
+        [
+            MemoizationPolicy(max_history=2),
+            MemoizationPolicy(max_history=2),
+            RulePolicy(lookup={RULES: {}, RULES_FOR_LOOP_UNHAPPY_PATH: {}}),
+        ]
+    )
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        evts=[ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "greet"})],
+        slots=default_domain.slots,
+    )
+
+    featurizer_type = type(ensemble.policies[0].featurizer)
+    prediction_states = Mock(wraps=featurizer_type.prediction_states)
+    monkeypatch.setattr(
+        featurizer_type,
+        "prediction_states",
+        lambda self, *args: prediction_states(self, *args),
+    )
+
+    ensemble.probabilities_using_best_policy(
+        tracker, default_domain, RegexInterpreter()
+    )
+
+    # memoization policies create the states once, the rule policy creates the
+    # states based on the intent and based on the text of the user message
+    assert prediction_states.call_count == 3
+
+
+def test_prediction_context_is_cleared_if_tracker_changes(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        evts=[ActionExecuted(ACTION_LISTEN_NAME)],
+        slots=default_domain.slots,
+    )
+    context = PredictionContext(tracker, default_domain)
+    featurizer = MemoizationPolicy(max_history=2).featurizer
+
+    states = context.prediction_states(featurizer)
+    assert context.prediction_states(featurizer) is states
+    assert context.applied_events() == tracker.applied_events()
+
+    tracker.update(UserUttered("hi", {"name": "greet"}))
+
+    assert (
+        context.prediction_states(featurizer)
+        == featurizer.prediction_states([tracker], default_domain)[0]
+    )
+    assert context.applied_events() == tracker.applied_events()
+
+
+def test_augmented_memoization_uses_applied_events_of_prediction_context(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        evts=[ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "greet"})],
+        slots=default_domain.slots,
+    )
+    context = PredictionContext(tracker, default_domain)
+    applied_events = Mock(wraps=tracker.applied_events)
+    monkeypatch.setattr(tracker, "applied_events", applied_events)
+
+    policy = AugmentedMemoizationPolicy(max_history=2)
+    policy.predict_action_probabilities(
+        tracker, default_domain, RegexInterpreter(), prediction_context=context
+    )
+    call_count = applied_events.call_count
+    policy.predict_action_probabilities(
+        tracker, default_domain, RegexInterpreter(), prediction_context=context
+    )
+
+    # the second prediction takes the applied events from the context
+    assert applied_events.call_count == call_count
+
+
+def test_warm_up_predicts_sample_conversation(default_domain: Domain):
+    policy = ConstantPolicy(priority=1, predict_index=0)
+    ensemble = SimplePolicyEnsemble([policy])
+    interpreter = RegexInterpreter()
+
+    with patch.object(
+        policy,
+        "predict_action_probabilities",
+        wraps=policy.predict_action_probabilities,
+    ) as predict:
+        ensemble.warm_up(default_domain, interpreter)
+
+    predict.assert_called_once()
+    tracker, domain, _ = predict.call_args[0]
+    assert domain == default_domain
+    assert tracker.latest_message.intent_name == default_domain.intents[0]
+    assert tracker.latest_message.text == WARM_UP_MESSAGE_TEXT
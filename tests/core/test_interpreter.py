@@ -1,7 +1,12 @@
+import asyncio
+from unittest.mock import Mock
+
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
-from rasa.core.interpreter import RasaNLUHttpInterpreter
+from rasa.constants import ENV_INFERENCE_BATCH_WINDOW_MS
+from rasa.core.interpreter import RasaNLUHttpInterpreter, RasaNLUInterpreter
 from rasa.utils.endpoints import EndpointConfig
 from tests.utilities import latest_request, json_of_latest_request
 
@@ -28,3 +33,36 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+async def test_nlu_interpreter_batches_concurrent_requests(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_INFERENCE_BATCH_WINDOW_MS, "200")
+    interpreter = RasaNLUInterpreter("some/model", lazy_init=True)
+    interpreter.interpreter = Mock()
+    interpreter.interpreter.parse_batch.side_effect = lambda texts: [
+        {"text": text} for text in texts
+    ]
+
+    results = await asyncio.gather(
+        interpreter.parse("hello"), interpreter.parse("goodbye")
+    )
+
+    assert results == [{"text": "hello"}, {"text": "goodbye"}]
+    interpreter.interpreter.parse_batch.assert_called_once_with(["hello", "goodbye"])
+    interpreter.interpreter.parse.assert_not_called()
+
+
+def test_nlu_interpreter_cache_stats():
+    interpreter = RasaNLUInterpreter("some/model", lazy_init=True)
+    assert interpreter.cache_stats() == {}
+
+    cached_component = Mock()
+    cached_component.name = "CachedComponent"
+    cached_component.cache_stats.return_value = {"hits": 1}
+    disabled_cache = Mock()
+    disabled_cache.cache_stats.return_value = {}
+    interpreter.interpreter = Mock(
+        pipeline=[cached_component, disabled_cache, object()]
+    )
+
+    assert interpreter.cache_stats() == {"CachedComponent": {"hits": 1}}
@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import freezegun
 import pytest
+import threading
 import time
 import uuid
 import json
@@ -21,6 +22,8 @@ import rasa.core.policies.policy
 from rasa.core.nlg import NaturalLanguageGenerator
 from rasa.core.policies.policy import PolicyPrediction
 import tests.utilities
+import rasa.utils.inference_executor
+from rasa.constants import ENV_INFERENCE_EXECUTOR
 
 from rasa.core import jobs
 from rasa.core.agent import Agent
@@ -82,6 +85,38 @@ async def test_message_processor(
     }
 
 
+async def test_action_prediction_runs_off_the_event_loop(
+    default_channel: CollectingOutputChannel,
+    default_processor: MessageProcessor,
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR, "thread")
+    rasa.utils.inference_executor.reset_inference_executor()
+
+    prediction_threads = []
+    predict_next_action = default_processor.predict_next_action
+
+    def record_thread(tracker: DialogueStateTracker) -> Any:
+        prediction_threads.append(threading.get_ident())
+        return predict_next_action(tracker)
+
+    monkeypatch.setattr(default_processor, "predict_next_action", record_thread)
+
+    try:
+        await default_processor.handle_message(
+            UserMessage('/greet{"name":"Core"}', default_channel)
+        )
+    finally:
+        rasa.utils.inference_executor.reset_inference_executor()
+
+    assert default_channel.latest_output() == {
+        "recipient_id": "default",
+        "text": "hey there Core!",
+    }
+    assert prediction_threads
+    assert threading.get_ident() not in prediction_threads
+
+
 async def test_message_id_logging(default_processor: MessageProcessor):
     message = UserMessage("If Meg was an egg would she still have a leg?")
     tracker = DialogueStateTracker("1", [])
@@ -537,7 +572,7 @@ async def test_update_tracker_session(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor._save_tracker(tracker)
+    await default_processor._save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
@@ -639,7 +674,7 @@ async def test_update_tracker_session_with_slots(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor._save_tracker(tracker)
+    await default_processor._save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
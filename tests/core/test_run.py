@@ -1,3 +1,5 @@
+import gc
+import os
 from unittest.mock import Mock
 
 import pytest
@@ -10,6 +12,7 @@ from asyncio import AbstractEventLoop
 from pathlib import Path
 from rasa.core import run, interpreter, policies
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.core.tracker_store import InMemoryTrackerStore
 from rasa.core.utils import AvailableEndpoints
 
 CREDENTIALS_FILE = "examples/moodbot/credentials.yml"
@@ -87,6 +90,35 @@ async def test_load_agent_on_start_with_bad_model_file(
     assert isinstance(agent.domain, rasa.shared.core.domain.Domain)
 
 
+async def test_load_agent_on_start_from_preloaded_model(
+    trained_rasa_model: Text, rasa_server: Sanic, loop: AbstractEventLoop
+):
+    preloaded_model = run.preload_model(trained_rasa_model)
+    gc.unfreeze()
+
+    assert preloaded_model.model_archive == trained_rasa_model
+    assert os.path.isdir(preloaded_model.model_directory)
+
+    agent = await run.load_agent_on_start(
+        trained_rasa_model,
+        AvailableEndpoints(),
+        None,
+        rasa_server,
+        loop,
+        preloaded_model=preloaded_model,
+    )
+
+    # the workers load the model from the directory unpacked by the main process
+    assert agent.model_directory == preloaded_model.model_directory
+    assert agent.path_to_model_archive == trained_rasa_model
+    assert isinstance(agent.policy_ensemble, policies.PolicyEnsemble)
+    assert agent.interpreter is not None
+
+
+def test_preload_model_without_model(tmp_path: Path):
+    assert run.preload_model(str(tmp_path)) is None
+
+
 async def test_close_resources(loop: AbstractEventLoop):
     broker = SQLEventBroker()
     app = Mock()
@@ -109,3 +141,19 @@ async def test_close_resources_with_sync(loop: AbstractEventLoop):
 
     with pytest.warns(FutureWarning):
         await run.close_resources(app, loop)
+
+
+async def test_close_resources_closes_tracker_store(loop: AbstractEventLoop):
+    class TestTrackerStore(InMemoryTrackerStore):
+        is_closed = False
+
+        async def close(self) -> None:
+            self.is_closed = True
+
+    tracker_store = TestTrackerStore(rasa.shared.core.domain.Domain.empty())
+    app = Mock()
+    app.agent.tracker_store = tracker_store
+
+    await run.close_resources(app, loop)
+
+    assert tracker_store.is_closed
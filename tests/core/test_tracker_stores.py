@@ -1,4 +1,5 @@
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -43,6 +44,7 @@ from rasa.core.tracker_store import (
 )
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
+from tests.conftest import AsyncMock
 from tests.core.conftest import DEFAULT_ENDPOINTS_FILE, MockedMongoTrackerStore
 
 domain = Domain.load("data/test_domains/default.yml")
@@ -186,6 +188,88 @@ def test_redis_tracker_store_valid_key_prefix(default_domain: Domain):
     )
 
 
+def _redis_tracker_store_with_event_lists(domain: Domain) -> RedisTrackerStore:
+    import fakeredis
+
+    tracker_store = RedisTrackerStore(domain, use_event_lists=True)
+    tracker_store.red = fakeredis.FakeStrictRedis()
+
+    return tracker_store
+
+
+def test_redis_tracker_store_with_event_lists_appends_new_events(
+    default_domain: Domain,
+):
+    tracker_store = _redis_tracker_store_with_event_lists(default_domain)
+    events, tracker = create_tracker_with_partially_saved_events(tracker_store)
+    tracker_store.save(tracker)
+
+    key = tracker_store.key_prefix + tracker.sender_id
+    assert tracker_store.red.llen(key) == len(tracker.events)
+
+    retrieved = tracker_store.retrieve(tracker.sender_id)
+    assert list(retrieved.events) == list(tracker.events)
+
+    # saving again without new events doesn't append anything
+    tracker_store.save(retrieved)
+    assert tracker_store.red.llen(key) == len(tracker.events)
+
+
+def test_redis_tracker_store_with_event_lists_retrieves_latest_session(
+    default_domain: Domain,
+):
+    tracker_store = _redis_tracker_store_with_event_lists(default_domain)
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [
+            UserUttered("hi"),
+            ActionExecuted(ACTION_SESSION_START_NAME),
+            SessionStarted(),
+            UserUttered("hello"),
+        ],
+    )
+    tracker_store.save(tracker)
+
+    retrieved = tracker_store.retrieve(sender_id)
+    assert list(retrieved.events) == list(tracker.events)[2:]
+
+    retrieved.update(BotUttered("hey"))
+    tracker_store.save(retrieved)
+
+    full_tracker = tracker_store.retrieve_full_tracker(sender_id)
+    assert len(full_tracker.events) == len(tracker.events) + 1
+
+
+def test_redis_tracker_store_with_event_lists_migrates_serialised_tracker(
+    default_domain: Domain,
+):
+    tracker_store = _redis_tracker_store_with_event_lists(default_domain)
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hi"), BotUttered("hello")]
+    )
+    # store tracker in the serialised format
+    tracker_store.red.set(
+        tracker_store.key_prefix + sender_id, tracker_store.serialise_tracker(tracker)
+    )
+
+    retrieved = tracker_store.retrieve(sender_id)
+    assert list(retrieved.events) == list(tracker.events)
+
+    # trackers which weren't retrieved before are migrated when they are saved
+    other_sender_id = uuid.uuid4().hex
+    other_tracker = DialogueStateTracker.from_events(other_sender_id, [UserUttered()])
+    tracker_store.red.set(
+        tracker_store.key_prefix + other_sender_id,
+        tracker_store.serialise_tracker(other_tracker),
+    )
+    other_tracker.update(BotUttered("hello"))
+    tracker_store.save(other_tracker)
+
+    assert tracker_store.red.llen(tracker_store.key_prefix + other_sender_id) == 2
+
+
 def test_exception_tracker_store_from_endpoint_config(
     default_domain: Domain, monkeypatch: MonkeyPatch
 ):
@@ -490,6 +574,24 @@ def test_fail_safe_tracker_store_with_retrieve_error():
     on_error_callback.assert_called_once()
 
 
+async def test_fail_safe_tracker_store_with_async_save_error():
+    mocked_tracker_store = Mock()
+    mocked_tracker_store.save_async = AsyncMock(side_effect=Exception())
+
+    fallback_tracker_store = Mock()
+    fallback_tracker_store.save_async = AsyncMock()
+
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(
+        mocked_tracker_store, on_error_callback, fallback_tracker_store
+    )
+    await tracker_store.save_async(DialogueStateTracker.from_events("sender", []))
+
+    fallback_tracker_store.save_async.assert_called_once()
+    on_error_callback.assert_called_once()
+
+
 def test_set_fail_safe_tracker_store_domain(default_domain: Domain):
     tracker_store = InMemoryTrackerStore(domain)
     fallback_tracker_store = InMemoryTrackerStore(None)
@@ -562,6 +664,53 @@ def test_mongo_additional_events_with_session_start(default_domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+def test_mongo_save_stores_event_counters(default_domain: Domain):
+    sender_id = uuid.uuid4().hex
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender_id)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored["events_count"] == 5
+    assert stored["last_session_start_index"] == 4
+
+    # only the events of the latest session are fetched
+    # noinspection PyProtectedMember
+    assert tracker_store._latest_session_projection(sender_id) == {
+        "events": {"$slice": [4, 1]}
+    }
+    assert len(tracker.events) == 1
+
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored["events_count"] == 6
+    assert stored["last_session_start_index"] == 4
+    assert len(tracker_store.retrieve(sender_id).events) == 2
+
+
+def test_mongo_save_migrates_conversation_without_event_counters(
+    default_domain: Domain,
+):
+    sender_id = uuid.uuid4().hex
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    events = [UserUttered("hi"), SessionStarted(), UserUttered("hi2")]
+    tracker_store.conversations.insert_one(
+        {"sender_id": sender_id, "events": [e.as_dict() for e in events]}
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert len(tracker.events) == 2
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert len(stored["events"]) == 4
+    assert stored["events_count"] == 4
+    assert stored["last_session_start_index"] == 1
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
 def test_sql_additional_events(default_domain: Domain):
@@ -594,6 +743,50 @@ def test_sql_additional_events_with_session_start(default_domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+def test_sql_additional_events_without_counting_stored_events(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = SQLTrackerStore(default_domain)
+    additional_events, tracker = create_tracker_with_partially_saved_events(
+        tracker_store
+    )
+    assert tracker.persisted_events_count == 2
+
+    # the offset of the stored events is known, so the database isn't queried
+    event_query = Mock()
+    monkeypatch.setattr(tracker_store, "_event_query", event_query)
+
+    with tracker_store.session_scope() as session:
+        # noinspection PyProtectedMember
+        assert (
+            list(tracker_store._additional_events(session, tracker))
+            == additional_events
+        )
+    event_query.assert_not_called()
+
+
+def test_sql_save_appends_only_new_events(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain)
+    _, tracker = create_tracker_with_partially_saved_events(tracker_store)
+    tracker_store.save(tracker)
+
+    retrieved = tracker_store.retrieve(tracker.sender_id)
+
+    assert list(retrieved.events) == list(tracker.events)
+    assert retrieved.persisted_events_count == len(tracker.events)
+
+    # saving a retrieved tracker doesn't store any of its events again
+    retrieved.update(UserUttered("bye"))
+    tracker_store.save(retrieved)
+
+    with tracker_store.session_scope() as session:
+        # noinspection PyProtectedMember
+        stored = tracker_store._event_query(
+            session, tracker.sender_id, fetch_events_from_all_sessions=True
+        ).count()
+    assert stored == len(tracker.events) + 1
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
     [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
@@ -689,6 +882,98 @@ def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+async def test_tracker_store_async_interface(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    sender_id = uuid.uuid4().hex
+
+    tracker = await tracker_store.get_or_create_tracker_async(sender_id)
+    assert list(tracker.events) == [ActionExecuted(ACTION_LISTEN_NAME)]
+
+    tracker.update(UserUttered("hi"))
+    await tracker_store.save_async(tracker)
+
+    retrieved = await tracker_store.retrieve_async(sender_id)
+    assert list(retrieved.events) == list(tracker.events)
+
+    full_tracker = await tracker_store.retrieve_full_tracker_async(sender_id)
+    assert list(full_tracker.events) == list(tracker.events)
+
+    assert sender_id in await tracker_store.keys_async()
+
+
+class SyncCustomTrackerStore(TrackerStore):
+    def __init__(self, domain: Domain) -> None:
+        self.store = {}
+        self.threads = []
+        super().__init__(domain)
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        self.threads.append(threading.current_thread())
+        self.store[tracker.sender_id] = tracker.copy()
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        self.threads.append(threading.current_thread())
+        return self.store.get(sender_id)
+
+
+async def test_tracker_store_async_interface_for_sync_custom_store(
+    default_domain: Domain,
+):
+    tracker_store = SyncCustomTrackerStore(default_domain)
+
+    tracker = await tracker_store.get_or_create_tracker_async("some-id")
+    await tracker_store.save_async(tracker)
+
+    assert await tracker_store.retrieve_async("some-id") == tracker
+    # the synchronous methods don't run on the thread of the event loop
+    assert threading.current_thread() not in tracker_store.threads
+    assert len(tracker_store.threads) == 4
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_stream_events_without_retrieving_stored_tracker(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    event_broker = Mock()
+    tracker_store.event_broker = event_broker
+
+    _, tracker = create_tracker_with_partially_saved_events(tracker_store)
+    tracker = tracker_store.retrieve(tracker.sender_id)
+    event_broker.publish.reset_mock()
+
+    tracker.update(UserUttered("bye"))
+    tracker_store.retrieve = Mock()
+    tracker_store.save(tracker)
+
+    tracker_store.retrieve.assert_not_called()
+    event_broker.publish.assert_called_once()
+    published = event_broker.publish.call_args[0][0]
+    assert published["event"] == UserUttered.type_name
+    assert published["sender_id"] == tracker.sender_id
+
+
 def test_tracker_store_deprecated_session_retrieval_kwarg():
     tracker_store = SQLTrackerStore(
         Domain.empty(), retrieve_events_from_previous_conversation_sessions=True
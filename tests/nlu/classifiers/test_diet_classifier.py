@@ -651,3 +651,25 @@ async def test_process_gives_diagnostic_data(trained_nlu_moodbot_path: Text,):
     assert isinstance(diagnostic_data[name].get("attention_weights"), np.ndarray)
     assert "text_transformed" in diagnostic_data[name]
     assert isinstance(diagnostic_data[name].get("text_transformed"), np.ndarray)
+
+
+async def test_parse_batch_matches_parse(trained_nlu_moodbot_path: Text):
+    with rasa.model.unpack_model(trained_nlu_moodbot_path) as unpacked_model_directory:
+        _, nlu_model_directory = rasa.model.get_model_subdirectories(
+            unpacked_model_directory
+        )
+        interpreter = Interpreter.load(nlu_model_directory)
+
+    texts = ["hello", "I am very sad today", "", "great, thanks a lot"]
+    batch_results = interpreter.parse_batch(texts)
+
+    assert len(batch_results) == len(texts)
+    for text, batch_result in zip(texts, batch_results):
+        result = interpreter.parse(text)
+
+        assert batch_result[TEXT] == result[TEXT]
+        assert batch_result[INTENT] == {
+            **result[INTENT],
+            "confidence": pytest.approx(result[INTENT]["confidence"], abs=1e-5),
+        }
+        assert batch_result[ENTITIES] == result[ENTITIES]
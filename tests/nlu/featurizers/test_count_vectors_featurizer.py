@@ -867,3 +867,29 @@ def test_cvf_incremental_train_vocabulary_overflow(tmp_path: Path,):
     with pytest.warns(UserWarning) as warning:
         new_featurizer.train(data)
     assert "New data contains vocabulary of size" in warning[0].message.args[0]
+
+
+def test_count_vector_featurizer_process_batch():
+    ftr = CountVectorsFeaturizer()
+    tk = WhitespaceTokenizer()
+
+    train_message = Message(data={TEXT: "hello how are you doing"})
+    tk.process(train_message)
+    ftr.train(TrainingData([train_message]))
+
+    sentences = ["hello you", "how are you doing today", "hello"]
+    batch_messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    for message in batch_messages + messages:
+        tk.process(message)
+
+    ftr.process_batch(batch_messages)
+    for message in messages:
+        ftr.process(message)
+
+    for batch_message, message in zip(batch_messages, messages):
+        batch_seq_vecs, batch_sen_vecs = batch_message.get_sparse_features(TEXT, [])
+        seq_vecs, sen_vecs = message.get_sparse_features(TEXT, [])
+
+        assert np.all(batch_seq_vecs.features.toarray() == seq_vecs.features.toarray())
+        assert np.all(batch_sen_vecs.features.toarray() == sen_vecs.features.toarray())
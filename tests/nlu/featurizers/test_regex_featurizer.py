@@ -640,3 +640,32 @@ def test_vocabulary_overflow_log():
         "The originally trained model was configured to handle a maximum number of 4 patterns"
         in warning[0].message.args[0]
     )
+
+
+def test_regex_featurizer_builds_sparse_features_from_overlaps():
+    patterns = [
+        {"pattern": r"\bnew york\b", "name": "city"},
+        {"pattern": "o", "name": "letter"},
+        {"pattern": "[0-9]+", "name": "number"},
+    ]
+    featurizer = RegexFeaturizer(
+        {"number_additional_patterns": 2}, known_patterns=patterns
+    )
+    message = Message(data={TEXT: "hi new york"})
+    WhitespaceTokenizer().process(message)
+
+    sequence_features, sentence_features = featurizer._features_for_patterns(
+        message, TEXT
+    )
+
+    assert sequence_features.toarray().tolist() == [
+        [0, 0, 0, 0, 0],
+        [1, 0, 0, 0, 0],
+        [1, 1, 0, 0, 0],
+    ]
+    assert sentence_features.toarray().tolist() == [[1, 1, 0, 0, 0]]
+    assert message.get(TOKENS_NAMES[TEXT])[0].get("pattern") == {
+        "city": False,
+        "letter": False,
+        "number": False,
+    }
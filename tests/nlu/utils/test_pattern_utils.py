@@ -179,3 +179,18 @@ def test_extract_patterns_use_only_lookup_tables_or_regex_features(
     )
 
     assert actual_patterns == expected_patterns
+
+
+def test_pattern_matcher_finds_overlapping_matches_of_all_patterns():
+    matcher = pattern_utils.PatternMatcher(
+        [
+            {"name": "city", "pattern": r"\bnew york\b"},
+            {"name": "word", "pattern": r"\byork\b"},
+            {"name": "zip", "pattern": r"\d{5}"},
+        ],
+        case_sensitive=False,
+    )
+
+    assert matcher.spans("New York 10001") == [[(0, 8)], [(4, 8)], [(9, 14)]]
+    assert matcher.first_match("in york") == 1
+    assert matcher.first_match("nowhere") is None
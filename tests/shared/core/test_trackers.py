@@ -497,6 +497,74 @@ def test_traveling_back_in_time(default_domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 2
 
 
+@pytest.mark.parametrize(
+    "events",
+    [
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+            ActionExecuted("utter_greet"),
+            SlotSet("name", "Peter"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("bye", {"name": "goodbye"}),
+            ActionReverted(),
+            ActionExecuted("utter_goodbye"),
+            UserUtteranceReverted(),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+        ],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("inform", {"name": "inform"}),
+            ActionExecuted("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("chitchat", {"name": "chitchat"}),
+            ActionExecutionRejected("loop"),
+            ActionExecuted("utter_chitchat"),
+            ActionExecuted("loop"),
+            ActiveLoop(None),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+    ],
+)
+def test_past_states_are_updated_incrementally(
+    events: List[Event], default_domain: Domain
+):
+    tracker = DialogueStateTracker("default", default_domain.slots)
+
+    for event in events:
+        tracker.update(event)
+
+        expected_states = default_domain.states_for_tracker_history(tracker)
+        assert tracker.past_states(default_domain) == expected_states
+        assert tracker.past_states(default_domain, max_history=2) == (
+            expected_states[-2:]
+        )
+
+
+def test_past_states_returns_copies(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+            ActionExecuted("utter_greet"),
+        ],
+        default_domain.slots,
+    )
+    tracker.past_states(default_domain)[1]["user"].pop("intent")
+
+    assert tracker.past_states(default_domain) == (
+        default_domain.states_for_tracker_history(tracker)
+    )
+
+
 def test_tracker_init_copy(default_domain: Domain):
     sender_id = "some-id"
     tracker = DialogueStateTracker(sender_id, default_domain.slots)
@@ -588,6 +656,21 @@ def test_current_state_no_events(default_agent):
     assert state.get("events") is None
 
 
+def test_current_state_max_events():
+    tracker_dump = "data/test_trackers/tracker_moodbot.json"
+    tracker_json = json.loads(rasa.shared.utils.io.read_file(tracker_dump))
+
+    tracker = DialogueStateTracker.from_dict(
+        tracker_json.get("sender_id"), tracker_json.get("events", []), []
+    )
+
+    state = tracker.current_state(EventVerbosity.ALL, max_events=3)
+    assert state.get("events") == [event.as_dict() for event in tracker.events][-3:]
+    assert len(tracker.current_state(EventVerbosity.ALL, max_events=100)["events"]) == (
+        len(tracker.events)
+    )
+
+
 def test_current_state_applied_events(default_agent):
     tracker_dump = "data/test_trackers/tracker_moodbot.json"
     tracker_json = json.loads(rasa.shared.utils.io.read_file(tracker_dump))
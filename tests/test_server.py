@@ -413,6 +413,19 @@ async def test_parse_with_different_emulation_mode(
     assert response.status == HTTPStatus.OK
 
 
+async def test_parse_batch(rasa_app: SanicASGITestClient):
+    texts = ["hello", "/greet", "hello ńöñàśçií"]
+    _, response = await rasa_app.post(
+        "/model/parse", json=[{"text": text} for text in texts]
+    )
+    assert response.status == HTTPStatus.OK
+
+    rjs = response.json()
+    assert [parsed["text"] for parsed in rjs] == texts
+    for parsed in rjs:
+        assert all(prop in parsed for prop in ["entities", "intent", "text"])
+
+
 async def test_parse_without_nlu_model(rasa_app_core: SanicASGITestClient):
     _, response = await rasa_app_core.post("/model/parse", json={"text": "hello"})
     assert response.status == HTTPStatus.OK
@@ -1147,3 +1147,35 @@ def test_dry_run_result(
     result_code, texts = dry_run_result(result)
     assert result_code == code
     assert len(texts) == texts_count
+
+
+async def test_train_nlu_models_in_parallel(tmp_path: Path):
+    from rasa.shared.nlu.training_data.loading import load_data
+    from rasa.train import _train_nlu_models_in_parallel
+
+    pipeline = [{"name": "WhitespaceTokenizer"}, {"name": "KeywordIntentClassifier"}]
+    configs = {
+        "en": {"language": "en", "pipeline": pipeline},
+        "fr": {"language": "fr", "pipeline": pipeline},
+    }
+    importer = Mock()
+    importer.get_nlu_data = AsyncMock(return_value=load_data(DEFAULT_NLU_DATA))
+
+    await _train_nlu_models_in_parallel(
+        configs,
+        importer,
+        str(tmp_path),
+        persist_nlu_training_data=False,
+        additional_arguments={},
+        parallelism=2,
+    )
+
+    assert {call[0][0] for call in importer.get_nlu_data.call_args_list} == {
+        "en",
+        "fr",
+    }
+    for lang in configs:
+        metadata = rasa.shared.utils.io.read_json_file(
+            tmp_path / f"nlu-{lang}" / "metadata.json"
+        )
+        assert metadata["language"] == lang
@@ -1,7 +1,11 @@
+import asyncio
 import logging
+import pickle
 from typing import Text
 
+import aiohttp
 import pytest
+from aiohttp import web
 from aioresponses import aioresponses
 
 from tests.utilities import latest_request, json_of_latest_request
@@ -124,6 +128,88 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_requests_reuse_pooled_session():
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/test", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = "http://127.0.0.1:{}".format(site._server.sockets[0].getsockname()[1])
+
+    endpoint = endpoint_utils.EndpointConfig(url)
+    endpoint_utils.enable_session_pooling()
+    try:
+        for _ in range(3):
+            assert await endpoint.request("post", subpath="test") == {"ok": True}
+
+        session = endpoint.pooled_session()
+        assert not session.closed
+        assert endpoint.stats() == {
+            "connections_created": 1,
+            "connections_reused": 2,
+        }
+        assert endpoint_utils.session_stats()[url] == endpoint.stats()
+
+        await endpoint_utils.close_sessions()
+
+        assert session.closed
+        assert endpoint.pooled_session() is not session
+    finally:
+        await endpoint_utils.close_sessions()
+        await runner.cleanup()
+
+
+async def test_requests_without_pooling_close_their_sessions():
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/test", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = "http://127.0.0.1:{}".format(site._server.sockets[0].getsockname()[1])
+
+    endpoint = endpoint_utils.EndpointConfig(url)
+    try:
+        async with endpoint.request_session() as session:
+            assert not session.closed
+        assert session.closed
+
+        assert await endpoint.request("post", subpath="test") == {"ok": True}
+        assert endpoint._sessions == {}
+    finally:
+        await runner.cleanup()
+
+
+def test_pooled_sessions_are_bound_to_event_loop():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", pool_size=5, keepalive_timeout=1
+    )
+
+    async def pooled_session() -> aiohttp.ClientSession:
+        session = endpoint.pooled_session()
+        assert endpoint.pooled_session() is session
+        assert session.connector.limit == 5
+        await endpoint.close_session()
+        return session
+
+    sessions = []
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        sessions.append(loop.run_until_complete(pooled_session()))
+        loop.close()
+
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    assert pickle.loads(pickle.dumps(endpoint))._sessions == {}
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type", [(DEFAULT_ENDPOINTS_FILE, "tracker_store"),],
 )
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.constants import ENV_INFERENCE_EXECUTOR
+from rasa.utils.inference_executor import (
+    InferenceExecutor,
+    get_inference_executor,
+    reset_inference_executor,
+    run_inference,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_executor() -> Iterator[None]:
+    reset_inference_executor()
+    yield
+    reset_inference_executor()
+
+
+async def test_inference_runs_inline_by_default(monkeypatch: MonkeyPatch):
+    monkeypatch.delenv(ENV_INFERENCE_EXECUTOR, raising=False)
+
+    assert get_inference_executor() is None
+    assert await run_inference(threading.get_ident) == threading.get_ident()
+
+
+async def test_inference_runs_on_thread_pool(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR, "thread")
+
+    assert isinstance(get_inference_executor(), InferenceExecutor)
+    assert await run_inference(threading.get_ident) != threading.get_ident()
+
+
+async def test_event_loop_stays_responsive():
+    executor = InferenceExecutor(max_workers=1)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    await executor.run(time.sleep, 0.2)
+    ticker.cancel()
+
+    assert ticks > 5
+
+
+async def test_pending_inference_is_bounded():
+    executor = InferenceExecutor(max_workers=2, max_pending=2)
+    running = 0
+    most_running = 0
+    lock = threading.Lock()
+
+    def predict() -> None:
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*[executor.run(predict) for _ in range(6)])
+
+    assert most_running == 2
+    assert executor.stats()["pending"] == 0
+    assert executor.stats()["completed"] == 6
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from typing import List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.constants import ENV_INFERENCE_BATCH_WINDOW_MS, ENV_INFERENCE_MAX_BATCH_SIZE
+from rasa.utils.inference_scheduler import InferenceScheduler, scheduler_stats
+
+
+def test_scheduler_is_opt_in(monkeypatch: MonkeyPatch):
+    monkeypatch.delenv(ENV_INFERENCE_BATCH_WINDOW_MS, raising=False)
+    assert InferenceScheduler.from_environment(list, name="test") is None
+
+    monkeypatch.setenv(ENV_INFERENCE_BATCH_WINDOW_MS, "5")
+    monkeypatch.setenv(ENV_INFERENCE_MAX_BATCH_SIZE, "8")
+    scheduler = InferenceScheduler.from_environment(list, name="test")
+
+    assert scheduler.max_wait_ms == 5
+    assert scheduler.max_batch_size == 8
+
+
+async def test_concurrent_requests_are_batched():
+    batches = []
+
+    def double(items: List[int]) -> List[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    scheduler = InferenceScheduler(double, max_wait_ms=200, max_batch_size=3)
+
+    results = await asyncio.gather(
+        *[scheduler.predict_async(item) for item in range(5)]
+    )
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2], [3, 4]]
+    assert scheduler.stats() == {
+        "queue_depth": 0,
+        "requests": 5,
+        "batches": 2,
+        "mean_batch_size": 2.5,
+        "largest_batch": 3,
+    }
+    assert scheduler.stats() in scheduler_stats()["inference"]
+
+
+def test_requests_from_threads_are_batched():
+    batches = []
+
+    def identity(items: List[int]) -> List[int]:
+        batches.append(items)
+        return items
+
+    scheduler = InferenceScheduler(identity, max_wait_ms=200, max_batch_size=4)
+    results = {}
+
+    def predict(item: int) -> None:
+        results[item] = scheduler.predict(item)
+
+    threads = [threading.Thread(target=predict, args=(item,)) for item in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {item: item for item in range(4)}
+    assert len(batches) == 1
+
+
+async def test_batch_errors_are_raised_for_every_request():
+    def fail(_: List[int]) -> List[int]:
+        raise ValueError("broken model")
+
+    scheduler = InferenceScheduler(fail, max_wait_ms=50)
+
+    results = await asyncio.gather(
+        scheduler.predict_async(1), scheduler.predict_async(2), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        scheduler.predict(3)